@@ -34,6 +34,19 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_object(obj, name, type_, reflected, compare_to):
+    """Leave the full-text search objects and activity_log partitions, which
+    exist only in migrations, out of autogenerate"""
+    if reflected and compare_to is None:
+        if type_ == "table" and name.startswith(("tasks_fts", "comments_fts", "activity_log_")):
+            return False
+        if type_ in ("column", "index") and name in (
+            "search_vector", "ix_tasks_search_vector", "ix_comments_search_vector"
+        ):
+            return False
+    return True
+
+
 def get_url():
     """Get database URL from settings"""
     return settings.DATABASE_URL
@@ -58,6 +71,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -84,6 +98,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,108 @@
+"""Add foreign key and access path indexes
+
+Drops the ix_<table>_id indexes (redundant with the primary keys) and
+ix_tasks_board_id (a prefix of the new board/column/position index), and
+indexes every foreign key and frequent filter reported by
+``python -m app.utils.index_audit``.
+
+Revision ID: d114a1f8b116
+Revises: b12c3d4e5f6g
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd114a1f8b116'
+down_revision = 'b12c3d4e5f6g'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_users_id', table_name='users')
+    op.drop_index('ix_notifications_id', table_name='notifications')
+    op.create_index('ix_organizations_owner_id', 'organizations', ['owner_id'], unique=False)
+    op.drop_index('ix_organizations_id', table_name='organizations')
+    op.create_index('ix_organization_members_user_id_organization_id', 'organization_members', ['user_id', 'organization_id'], unique=False)
+    op.drop_index('ix_organization_members_id', table_name='organization_members')
+    op.create_index('ix_projects_owner_id', 'projects', ['owner_id'], unique=False)
+    op.drop_index('ix_projects_id', table_name='projects')
+    op.create_index('ix_boards_project_id_created_at', 'boards', ['project_id', 'created_at'], unique=False)
+    op.drop_index('ix_boards_id', table_name='boards')
+    op.create_index('ix_custom_fields_project_id', 'custom_fields', ['project_id'], unique=False)
+    op.drop_index('ix_custom_fields_id', table_name='custom_fields')
+    op.drop_index('ix_labels_id', table_name='labels')
+    op.create_index('ix_project_members_user_id_project_id', 'project_members', ['user_id', 'project_id'], unique=False)
+    op.drop_index('ix_project_members_id', table_name='project_members')
+    op.create_index('ix_columns_board_id_position', 'columns', ['board_id', 'position'], unique=False)
+    op.drop_index('ix_columns_id', table_name='columns')
+    op.create_index('ix_tasks_board_id_column_id_position', 'tasks', ['board_id', 'column_id', 'position'], unique=False)
+    op.create_index('ix_tasks_parent_task_id', 'tasks', ['parent_task_id'], unique=False)
+    op.drop_index('ix_tasks_id', table_name='tasks')
+    op.drop_index('ix_tasks_board_id', table_name='tasks')
+    op.create_index('ix_activity_log_user_id', 'activity_log', ['user_id'], unique=False)
+    op.drop_index('ix_activity_log_id', table_name='activity_log')
+    op.create_index('ix_attachments_task_id', 'attachments', ['task_id'], unique=False)
+    op.create_index('ix_attachments_user_id', 'attachments', ['user_id'], unique=False)
+    op.drop_index('ix_attachments_id', table_name='attachments')
+    op.create_index('ix_checklists_task_id_position', 'checklists', ['task_id', 'position'], unique=False)
+    op.drop_index('ix_checklists_id', table_name='checklists')
+    op.create_index('ix_comments_parent_comment_id', 'comments', ['parent_comment_id'], unique=False)
+    op.drop_index('ix_comments_id', table_name='comments')
+    op.create_index('ix_task_assignees_user_id_task_id', 'task_assignees', ['user_id', 'task_id'], unique=False)
+    op.drop_index('ix_task_assignees_id', table_name='task_assignees')
+    op.create_index('ix_task_custom_field_values_custom_field_id', 'task_custom_field_values', ['custom_field_id'], unique=False)
+    op.drop_index('ix_task_custom_field_values_id', table_name='task_custom_field_values')
+    op.create_index('ix_task_dependencies_depends_on_task_id', 'task_dependencies', ['depends_on_task_id'], unique=False)
+    op.drop_index('ix_task_dependencies_id', table_name='task_dependencies')
+    op.create_index('ix_task_labels_label_id_task_id', 'task_labels', ['label_id', 'task_id'], unique=False)
+    op.drop_index('ix_task_labels_id', table_name='task_labels')
+    op.drop_index('ix_time_entries_id', table_name='time_entries')
+    op.create_index('ix_checklist_items_checklist_id_position', 'checklist_items', ['checklist_id', 'position'], unique=False)
+    op.drop_index('ix_checklist_items_id', table_name='checklist_items')
+
+
+def downgrade() -> None:
+    op.create_index('ix_checklist_items_id', 'checklist_items', ['id'], unique=False)
+    op.drop_index('ix_checklist_items_checklist_id_position', table_name='checklist_items')
+    op.create_index('ix_time_entries_id', 'time_entries', ['id'], unique=False)
+    op.create_index('ix_task_labels_id', 'task_labels', ['id'], unique=False)
+    op.drop_index('ix_task_labels_label_id_task_id', table_name='task_labels')
+    op.create_index('ix_task_dependencies_id', 'task_dependencies', ['id'], unique=False)
+    op.drop_index('ix_task_dependencies_depends_on_task_id', table_name='task_dependencies')
+    op.create_index('ix_task_custom_field_values_id', 'task_custom_field_values', ['id'], unique=False)
+    op.drop_index('ix_task_custom_field_values_custom_field_id', table_name='task_custom_field_values')
+    op.create_index('ix_task_assignees_id', 'task_assignees', ['id'], unique=False)
+    op.drop_index('ix_task_assignees_user_id_task_id', table_name='task_assignees')
+    op.create_index('ix_comments_id', 'comments', ['id'], unique=False)
+    op.drop_index('ix_comments_parent_comment_id', table_name='comments')
+    op.create_index('ix_checklists_id', 'checklists', ['id'], unique=False)
+    op.drop_index('ix_checklists_task_id_position', table_name='checklists')
+    op.create_index('ix_attachments_id', 'attachments', ['id'], unique=False)
+    op.drop_index('ix_attachments_user_id', table_name='attachments')
+    op.drop_index('ix_attachments_task_id', table_name='attachments')
+    op.create_index('ix_activity_log_id', 'activity_log', ['id'], unique=False)
+    op.drop_index('ix_activity_log_user_id', table_name='activity_log')
+    op.create_index('ix_tasks_board_id', 'tasks', ['board_id'], unique=False)
+    op.create_index('ix_tasks_id', 'tasks', ['id'], unique=False)
+    op.drop_index('ix_tasks_parent_task_id', table_name='tasks')
+    op.drop_index('ix_tasks_board_id_column_id_position', table_name='tasks')
+    op.create_index('ix_columns_id', 'columns', ['id'], unique=False)
+    op.drop_index('ix_columns_board_id_position', table_name='columns')
+    op.create_index('ix_project_members_id', 'project_members', ['id'], unique=False)
+    op.drop_index('ix_project_members_user_id_project_id', table_name='project_members')
+    op.create_index('ix_labels_id', 'labels', ['id'], unique=False)
+    op.create_index('ix_custom_fields_id', 'custom_fields', ['id'], unique=False)
+    op.drop_index('ix_custom_fields_project_id', table_name='custom_fields')
+    op.create_index('ix_boards_id', 'boards', ['id'], unique=False)
+    op.drop_index('ix_boards_project_id_created_at', table_name='boards')
+    op.create_index('ix_projects_id', 'projects', ['id'], unique=False)
+    op.drop_index('ix_projects_owner_id', table_name='projects')
+    op.create_index('ix_organization_members_id', 'organization_members', ['id'], unique=False)
+    op.drop_index('ix_organization_members_user_id_organization_id', table_name='organization_members')
+    op.create_index('ix_organizations_id', 'organizations', ['id'], unique=False)
+    op.drop_index('ix_organizations_owner_id', table_name='organizations')
+    op.create_index('ix_notifications_id', 'notifications', ['id'], unique=False)
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
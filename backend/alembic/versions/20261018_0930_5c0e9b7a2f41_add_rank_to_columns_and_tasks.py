@@ -0,0 +1,104 @@
+"""Add fractional rank to columns and tasks
+
+Adds columns.rank and tasks.rank (see app.utils.rank), backfilled from the
+current position order, and moves the ordering indexes from position to
+rank.
+
+Revision ID: 5c0e9b7a2f41
+Revises: d114a1f8b116
+Create Date: 2026-10-18 09:30:00.000000+00:00
+
+"""
+from itertools import groupby
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c0e9b7a2f41'
+down_revision = 'd114a1f8b116'
+branch_labels = None
+depends_on = None
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _rank_sequence(count):
+    """Evenly spaced ranks, frozen copy of app.utils.rank.rank_sequence"""
+    base = len(DIGITS)
+    width = 1
+    while base ** width <= count:
+        width += 1
+    step = base ** width // (count + 1)
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * step
+        chars = []
+        for _ in range(width):
+            value, digit = divmod(value, base)
+            chars.append(DIGITS[digit])
+        ranks.append("".join(reversed(chars)).rstrip("0"))
+    return ranks
+
+
+def _backfill(table, group_by):
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        f"SELECT id, {group_by} FROM {table} ORDER BY {group_by}, position, id"
+    )).fetchall()
+    params = []
+    for _, group in groupby(rows, key=lambda row: tuple(row[1:])):
+        ids = [row[0] for row in group]
+        params.extend({"id": row_id, "rank": rank} for row_id, rank in zip(ids, _rank_sequence(len(ids))))
+    if params:
+        conn.execute(sa.text(f"UPDATE {table} SET rank = :rank WHERE id = :id"), params)
+
+
+def upgrade() -> None:
+    op.add_column('columns', sa.Column('rank', sa.String(length=64), nullable=True))
+    op.add_column('tasks', sa.Column('rank', sa.String(length=64), nullable=True))
+
+    _backfill('columns', 'board_id')
+    # Tasks without a column are ranked per board
+    _backfill('tasks', 'board_id, column_id')
+
+    op.drop_index('ix_columns_board_id_position', table_name='columns')
+    op.drop_index('ix_tasks_board_id_column_id_position', table_name='tasks')
+    op.drop_index('ix_tasks_column_id', table_name='tasks')
+
+    with op.batch_alter_table('columns') as batch_op:
+        batch_op.alter_column('rank', existing_type=sa.String(length=64), nullable=False)
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.alter_column('rank', existing_type=sa.String(length=64), nullable=False)
+
+    op.create_index('ix_columns_board_id_rank', 'columns', ['board_id', 'rank'], unique=False)
+    op.create_index('ix_tasks_board_id_column_id_rank', 'tasks', ['board_id', 'column_id', 'rank'], unique=False)
+    op.create_index('ix_tasks_column_id_rank', 'tasks', ['column_id', 'rank'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_column_id_rank', table_name='tasks')
+    op.drop_index('ix_tasks_board_id_column_id_rank', table_name='tasks')
+    op.drop_index('ix_columns_board_id_rank', table_name='columns')
+
+    # Turn the rank order back into dense positions
+    conn = op.get_bind()
+    for table, group_by in (('columns', 'board_id'), ('tasks', 'board_id, column_id')):
+        rows = conn.execute(sa.text(
+            f"SELECT id, {group_by} FROM {table} ORDER BY {group_by}, rank, id"
+        )).fetchall()
+        params = []
+        for _, group in groupby(rows, key=lambda row: tuple(row[1:])):
+            params.extend({"id": row[0], "position": i} for i, row in enumerate(group))
+        if params:
+            conn.execute(sa.text(f"UPDATE {table} SET position = :position WHERE id = :id"), params)
+
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('rank')
+    with op.batch_alter_table('columns') as batch_op:
+        batch_op.drop_column('rank')
+
+    op.create_index('ix_tasks_column_id', 'tasks', ['column_id'], unique=False)
+    op.create_index('ix_tasks_board_id_column_id_position', 'tasks', ['board_id', 'column_id', 'position'], unique=False)
+    op.create_index('ix_columns_board_id_position', 'columns', ['board_id', 'position'], unique=False)
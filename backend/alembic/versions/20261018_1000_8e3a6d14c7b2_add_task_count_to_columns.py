@@ -0,0 +1,32 @@
+"""Add task_count to columns
+
+Cached number of tasks per column, maintained by the task endpoints and
+used for WIP limit checks. Backfilled from the tasks table.
+
+Revision ID: 8e3a6d14c7b2
+Revises: 5c0e9b7a2f41
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e3a6d14c7b2'
+down_revision = '5c0e9b7a2f41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('columns', sa.Column('task_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE columns SET task_count = "
+        "(SELECT count(*) FROM tasks WHERE tasks.column_id = columns.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('columns') as batch_op:
+        batch_op.drop_column('task_count')
@@ -0,0 +1,39 @@
+"""Add task listing indexes
+
+Composite (project_id, [filter,] sort key, id) indexes for the keyset
+paginated task listing. ix_tasks_project_id is a prefix of them and is
+dropped.
+
+Revision ID: f27b90c4e5d3
+Revises: 8e3a6d14c7b2
+Create Date: 2026-10-18 10:30:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f27b90c4e5d3'
+down_revision = '8e3a6d14c7b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_project_id_created_at_id', 'tasks', ['project_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_updated_at_id', 'tasks', ['project_id', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_due_date_id', 'tasks', ['project_id', 'due_date', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_status_created_at_id', 'tasks', ['project_id', 'status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_priority_created_at_id', 'tasks', ['project_id', 'priority', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_type_created_at_id', 'tasks', ['project_id', 'type', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_tasks_project_id', table_name='tasks')
+
+
+def downgrade() -> None:
+    op.create_index('ix_tasks_project_id', 'tasks', ['project_id'], unique=False)
+    op.drop_index('ix_tasks_project_id_type_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_priority_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_status_created_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_due_date_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_created_at_id', table_name='tasks')
@@ -0,0 +1,63 @@
+"""Add project task counters
+
+Adds project_task_counters, the last task number allocated per project,
+and a unique (project_id, task_number) constraint on tasks. Existing
+duplicate numbers are renumbered past the project's maximum (the lowest
+task id keeps its number) before the constraint is created.
+
+Revision ID: 3a9f5e02b6c8
+Revises: f27b90c4e5d3
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a9f5e02b6c8'
+down_revision = 'f27b90c4e5d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'project_task_counters',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('last_number', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id')
+    )
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, project_id, task_number FROM tasks ORDER BY project_id, task_number, id"
+    )).fetchall()
+    last_numbers = {}
+    for _, project_id, task_number in rows:
+        last_numbers[project_id] = max(last_numbers.get(project_id, 0), task_number)
+    seen = set()
+    params = []
+    for task_id, project_id, task_number in rows:
+        if (project_id, task_number) in seen:
+            last_numbers[project_id] += 1
+            params.append({"id": task_id, "task_number": last_numbers[project_id]})
+        else:
+            seen.add((project_id, task_number))
+    if params:
+        conn.execute(sa.text("UPDATE tasks SET task_number = :task_number WHERE id = :id"), params)
+    if last_numbers:
+        conn.execute(
+            sa.text("INSERT INTO project_task_counters (project_id, last_number) VALUES (:project_id, :last_number)"),
+            [{"project_id": p, "last_number": n} for p, n in last_numbers.items()],
+        )
+
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.create_unique_constraint('uix_project_task_number', ['project_id', 'task_number'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_constraint('uix_project_task_number', type_='unique')
+    op.drop_table('project_task_counters')
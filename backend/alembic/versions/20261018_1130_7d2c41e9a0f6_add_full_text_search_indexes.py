@@ -0,0 +1,93 @@
+"""Add full-text search indexes
+
+Full-text indexes over tasks (title, description) and comments
+(content), used by app.services.search. They are not part of the models
+and are kept current by the database itself:
+
+- PostgreSQL: a stored generated tsvector column, search_vector, on each
+  table with a GIN index. The "simple" configuration is used (lowercasing,
+  no stemming) since projects mix languages.
+- SQLite: external-content FTS5 tables, tasks_fts and comments_fts, kept
+  in sync by triggers.
+
+On SQLite, a later batch_alter_table on tasks or comments recreates the
+table and drops its triggers; such a migration must recreate them.
+
+Revision ID: 7d2c41e9a0f6
+Revises: 3a9f5e02b6c8
+Create Date: 2026-10-18 11:30:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2c41e9a0f6'
+down_revision = '3a9f5e02b6c8'
+branch_labels = None
+depends_on = None
+
+# (table, indexed columns, PostgreSQL tsvector expression)
+SEARCH_TABLES = [
+    (
+        'tasks',
+        ('title', 'description'),
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+    ),
+    (
+        'comments',
+        ('content',),
+        "to_tsvector('simple', coalesce(content, ''))",
+    ),
+]
+
+
+def _sqlite_upgrade(table, columns) -> None:
+    fts = f'{table}_fts'
+    cols = ', '.join(columns)
+    new = ', '.join(f'new.{c}' for c in columns)
+    old = ', '.join(f'old.{c}' for c in columns)
+    op.execute(
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END"
+    )
+    op.execute(
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END"
+    )
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, columns, expression in SEARCH_TABLES:
+        if dialect == 'postgresql':
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector "
+                f"GENERATED ALWAYS AS ({expression}) STORED"
+            )
+            op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING gin (search_vector)")
+        elif dialect == 'sqlite':
+            _sqlite_upgrade(table, columns)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, _, _ in reversed(SEARCH_TABLES):
+        if dialect == 'postgresql':
+            op.execute(f"DROP INDEX ix_{table}_search_vector")
+            op.execute(f"ALTER TABLE {table} DROP COLUMN search_vector")
+        elif dialect == 'sqlite':
+            for suffix in ('au', 'ad', 'ai'):
+                op.execute(f"DROP TRIGGER {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE {table}_fts")
@@ -0,0 +1,75 @@
+"""Add subtask roll-ups to tasks
+
+Totals over all descendant subtasks (story points, estimated and actual
+hours, done and total counts), maintained by app.services.rollups.
+Backfilled from the current hierarchy.
+
+Columns are added and dropped without batch mode so SQLite keeps the
+full-text search triggers on tasks.
+
+Revision ID: b6e1f3a94d27
+Revises: 7d2c41e9a0f6
+Create Date: 2026-10-18 12:00:00.000000+00:00
+
+"""
+from decimal import Decimal
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e1f3a94d27'
+down_revision = '7d2c41e9a0f6'
+branch_labels = None
+depends_on = None
+
+ROLLUP_COLUMNS = [
+    ('rollup_story_points', sa.Integer()),
+    ('rollup_estimated_hours', sa.Numeric(12, 2)),
+    ('rollup_actual_hours', sa.Numeric(12, 2)),
+    ('rollup_done_count', sa.Integer()),
+    ('rollup_task_count', sa.Integer()),
+]
+
+
+def upgrade() -> None:
+    for name, type_ in ROLLUP_COLUMNS:
+        op.add_column('tasks', sa.Column(name, type_, server_default='0', nullable=False))
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.text(
+        "SELECT id, parent_task_id, story_points, estimated_hours, actual_hours, status FROM tasks"
+    )).fetchall()
+    parents = {row.id: row.parent_task_id for row in rows}
+    totals = {}
+    for row in rows:
+        own = (
+            row.story_points or 0,
+            Decimal(str(row.estimated_hours or 0)),
+            Decimal(str(row.actual_hours or 0)),
+            1 if row.status == 'done' else 0,
+            1,
+        )
+        seen = {row.id}
+        ancestor = parents.get(row.id)
+        while ancestor is not None and ancestor in parents and ancestor not in seen:
+            seen.add(ancestor)
+            total = totals.setdefault(ancestor, [0, Decimal(0), Decimal(0), 0, 0])
+            for i, value in enumerate(own):
+                total[i] += value
+            ancestor = parents[ancestor]
+
+    if totals:
+        names = [name for name, _ in ROLLUP_COLUMNS]
+        conn.execute(
+            sa.text(
+                "UPDATE tasks SET " + ", ".join(f"{name} = :{name}" for name in names) + " WHERE id = :id"
+            ).bindparams(*(sa.bindparam(name, type_=type_) for name, type_ in ROLLUP_COLUMNS)),
+            [dict(zip(names, total), id=task_id) for task_id, total in totals.items()],
+        )
+
+
+def downgrade() -> None:
+    for name, _ in reversed(ROLLUP_COLUMNS):
+        op.drop_column('tasks', name)
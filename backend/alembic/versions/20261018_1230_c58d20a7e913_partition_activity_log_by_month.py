@@ -0,0 +1,113 @@
+"""Partition activity_log by month
+
+PostgreSQL: activity_log becomes a table range-partitioned on created_at,
+one partition per month (activity_log_yYYYYmMM) plus a default partition
+for rows outside every month. Existing rows are copied over. Partitions
+ahead of time are created by app.services.activity_archive, which also
+archives and drops partitions past the retention period. The primary key
+becomes (id, created_at) since it must include the partition key; ids
+still come from the same sequence.
+
+SQLite has no partitioning; only created_at becomes NOT NULL there.
+
+Revision ID: c58d20a7e913
+Revises: b6e1f3a94d27
+Create Date: 2026-10-18 12:30:00.000000+00:00
+
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c58d20a7e913'
+down_revision = 'b6e1f3a94d27'
+branch_labels = None
+depends_on = None
+
+# Months created ahead of the current one
+PARTITIONS_AHEAD = 3
+
+INDEXED_COLUMNS = ['created_at', 'project_id', 'task_id', 'user_id']
+
+COLUMNS = "id, user_id, project_id, task_id, action, entity_type, entity_id, changes, created_at"
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_table(partitioned: bool) -> None:
+    op.execute(f"""
+        CREATE TABLE activity_log (
+            id integer NOT NULL DEFAULT nextval('activity_log_id_seq'),
+            user_id integer REFERENCES users (id),
+            project_id integer REFERENCES projects (id) ON DELETE CASCADE,
+            task_id integer REFERENCES tasks (id) ON DELETE CASCADE,
+            action varchar(100) NOT NULL,
+            entity_type varchar(50) NOT NULL,
+            entity_id integer NOT NULL,
+            changes jsonb,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            CONSTRAINT activity_log_pkey PRIMARY KEY ({'id, created_at' if partitioned else 'id'})
+        ){' PARTITION BY RANGE (created_at)' if partitioned else ''}
+    """)
+    op.execute("ALTER SEQUENCE activity_log_id_seq OWNED BY activity_log.id")
+
+
+def _replace_table(partitioned: bool) -> None:
+    """Move rows into a new activity_log, partitioned or plain"""
+    op.execute("UPDATE activity_log SET created_at = now() WHERE created_at IS NULL")
+    op.execute("ALTER TABLE activity_log RENAME TO activity_log_old")
+    op.execute("ALTER TABLE activity_log_old RENAME CONSTRAINT activity_log_pkey TO activity_log_old_pkey")
+    for column in INDEXED_COLUMNS:
+        op.drop_index(f'ix_activity_log_{column}', table_name='activity_log_old')
+    # The sequence would go with the old table
+    op.execute("ALTER SEQUENCE activity_log_id_seq OWNED BY NONE")
+
+    _create_table(partitioned)
+    if partitioned:
+        op.execute("CREATE TABLE activity_log_default PARTITION OF activity_log DEFAULT")
+        oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM activity_log_old")).scalar()
+        now = datetime.now(timezone.utc)
+        first = oldest.astimezone(timezone.utc) if oldest else now
+        month = date(first.year, first.month, 1)
+        today = now.date()
+        last = _add_months(date(today.year, today.month, 1), PARTITIONS_AHEAD)
+        while month <= last:
+            following = _add_months(month, 1)
+            op.execute(
+                f"CREATE TABLE activity_log_y{month.year}m{month.month:02d} PARTITION OF activity_log "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00+00') TO ('{following.isoformat()} 00:00+00')"
+            )
+            month = following
+    for column in INDEXED_COLUMNS:
+        op.create_index(f'ix_activity_log_{column}', 'activity_log', [column], unique=False)
+
+    op.execute(
+        f"INSERT INTO activity_log ({COLUMNS}) "
+        f"SELECT {COLUMNS.replace('changes', 'changes::jsonb')} FROM activity_log_old"
+    )
+    op.execute("DROP TABLE activity_log_old")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _replace_table(partitioned=True)
+    else:
+        op.execute("UPDATE activity_log SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+        with op.batch_alter_table('activity_log') as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        # Dropping the partitioned table drops its partitions too
+        _replace_table(partitioned=False)
+        op.execute("ALTER TABLE activity_log ALTER COLUMN created_at DROP NOT NULL")
+    else:
+        with op.batch_alter_table('activity_log') as batch_op:
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=True)
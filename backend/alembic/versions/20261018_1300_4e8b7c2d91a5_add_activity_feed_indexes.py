@@ -0,0 +1,34 @@
+"""Add activity feed indexes
+
+Replaces the project_id and task_id indexes of activity_log with
+(project_id, created_at, id) and (task_id, created_at, id), which serve
+the keyset-paginated activity feeds and still cover the foreign keys.
+On PostgreSQL each is created on every partition.
+
+Revision ID: 4e8b7c2d91a5
+Revises: c58d20a7e913
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '4e8b7c2d91a5'
+down_revision = 'c58d20a7e913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_activity_log_project_id_created_at_id', 'activity_log', ['project_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_activity_log_task_id_created_at_id', 'activity_log', ['task_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_activity_log_project_id', table_name='activity_log')
+    op.drop_index('ix_activity_log_task_id', table_name='activity_log')
+
+
+def downgrade() -> None:
+    op.create_index('ix_activity_log_task_id', 'activity_log', ['task_id'], unique=False)
+    op.create_index('ix_activity_log_project_id', 'activity_log', ['project_id'], unique=False)
+    op.drop_index('ix_activity_log_task_id_created_at_id', table_name='activity_log')
+    op.drop_index('ix_activity_log_project_id_created_at_id', table_name='activity_log')
@@ -0,0 +1,60 @@
+"""Add notification counters
+
+Adds notification_counters, the unread notifications per user, filled
+from the current notifications. On notifications, is_read becomes NOT
+NULL, the single-column user_id and is_read indexes are replaced by
+(user_id, created_at, id) and a partial index over unread rows only.
+
+Revision ID: 9b1f6e3c2a70
+Revises: 4e8b7c2d91a5
+Create Date: 2026-10-18 13:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b1f6e3c2a70'
+down_revision = '4e8b7c2d91a5'
+branch_labels = None
+depends_on = None
+
+UNREAD = sa.column('is_read').is_(False)
+
+
+def upgrade() -> None:
+    op.execute("UPDATE notifications SET is_read = false WHERE is_read IS NULL")
+    with op.batch_alter_table('notifications') as batch_op:
+        batch_op.alter_column(
+            'is_read', existing_type=sa.Boolean(), nullable=False, server_default=sa.false()
+        )
+    op.drop_index('ix_notifications_user_id', table_name='notifications')
+    op.drop_index('ix_notifications_is_read', table_name='notifications')
+    op.create_index('ix_notifications_user_id_created_at_id', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index(
+        'ix_notifications_user_id_unread', 'notifications', ['user_id', 'created_at', 'id'], unique=False,
+        postgresql_where=UNREAD, sqlite_where=UNREAD,
+    )
+
+    op.create_table(
+        'notification_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('unread_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread_count) "
+        "SELECT user_id, count(*) FROM notifications WHERE is_read = false GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('notification_counters')
+    op.drop_index('ix_notifications_user_id_unread', table_name='notifications')
+    op.drop_index('ix_notifications_user_id_created_at_id', table_name='notifications')
+    op.create_index('ix_notifications_is_read', 'notifications', ['is_read'], unique=False)
+    op.create_index('ix_notifications_user_id', 'notifications', ['user_id'], unique=False)
+    with op.batch_alter_table('notifications') as batch_op:
+        batch_op.alter_column('is_read', existing_type=sa.Boolean(), nullable=True, server_default=None)
@@ -0,0 +1,43 @@
+"""Add deadline scan watermark
+
+Adds job_watermarks, where incremental scheduled jobs record how far
+they got, and notifications.dedupe_key with a partial unique index per
+user, so a notification with a key is inserted at most once.
+
+Revision ID: 2d7a9c4e6b13
+Revises: 9b1f6e3c2a70
+Create Date: 2026-10-18 14:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2d7a9c4e6b13'
+down_revision = '9b1f6e3c2a70'
+branch_labels = None
+depends_on = None
+
+HAS_KEY = sa.column('dedupe_key').is_not(None)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'job_watermarks',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('value', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('name')
+    )
+    op.add_column('notifications', sa.Column('dedupe_key', sa.String(length=200), nullable=True))
+    op.create_index(
+        'uix_notifications_user_id_dedupe_key', 'notifications', ['user_id', 'dedupe_key'], unique=True,
+        postgresql_where=HAS_KEY, sqlite_where=HAS_KEY,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uix_notifications_user_id_dedupe_key', table_name='notifications')
+    op.drop_column('notifications', 'dedupe_key')
+    op.drop_table('job_watermarks')
@@ -0,0 +1,37 @@
+"""Add notification compaction
+
+Adds notifications.repeat_count, the number of repeated notifications
+collapsed into a row, and an index on (created_at, is_read) for the
+retention job's oldest-first deletes of read notifications and its
+lookup of recently notified users. is_read is second so that per-user
+unread queries keep using ix_notifications_user_id_unread.
+
+Revision ID: 7c3e5a1f9d28
+Revises: 2d7a9c4e6b13
+Create Date: 2026-10-18 14:30:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e5a1f9d28'
+down_revision = '2d7a9c4e6b13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'notifications',
+        sa.Column('repeat_count', sa.Integer(), server_default='1', nullable=False),
+    )
+    op.create_index(
+        'ix_notifications_created_at_is_read', 'notifications', ['created_at', 'is_read'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_created_at_is_read', table_name='notifications')
+    op.drop_column('notifications', 'repeat_count')
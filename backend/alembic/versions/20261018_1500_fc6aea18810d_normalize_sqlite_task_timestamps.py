@@ -0,0 +1,38 @@
+"""Normalize SQLite task timestamps
+
+Tasks used to get created_at and updated_at from CURRENT_TIMESTAMP,
+which SQLite stores without fractional seconds ('2026-10-18 05:07:28'),
+while values bound by SQLAlchemy carry them ('... 05:07:28.000000').
+SQLite compares both as text, so a task listing cursor on such a row
+matched the row itself again. The model now sets both columns in
+Python; this rewrites existing values into the same format. PostgreSQL
+stores real timestamps and is unaffected.
+
+Revision ID: fc6aea18810d
+Revises: 7c3e5a1f9d28
+Create Date: 2026-10-18 15:00:00.000000+00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'fc6aea18810d'
+down_revision = '7c3e5a1f9d28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for column in ('created_at', 'updated_at'):
+        op.execute(
+            f"UPDATE tasks SET {column} = {column} || '.000000' "
+            f"WHERE length({column}) = 19"
+        )
+
+
+def downgrade() -> None:
+    # The rewritten values denote the same instants
+    pass
@@ -2,27 +2,36 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.user import UserCreate, User, Token, UserLogin
 from app.models.user import User as UserModel
 from app.models.organization import Organization as OrgModel, OrganizationMember
 from app.utils.security import (
-    verify_password,
-    get_password_hash,
     create_access_token,
     create_refresh_token,
     decode_token,
 )
+from app.services.password_hasher import password_hasher, HasherSaturatedError
 from app.config import settings
 
 router = APIRouter()
 
 
+def _hasher_busy() -> HTTPException:
+    """Error returned when the password hashing pool is saturated"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Register a new user.
 
@@ -34,34 +43,42 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         User: Created user object
 
     Raises:
-        HTTPException: If email or username already exists
+        HTTPException: If email or username already exists, or the
+            password hashing pool is saturated
     """
     # Check if email already exists
-    if db.query(UserModel).filter(UserModel.email == user_data.email).first():
+    if await db.scalar(select(UserModel.id).where(UserModel.email == user_data.email)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
     # Check if username already exists
-    if db.query(UserModel).filter(UserModel.username == user_data.username).first():
+    if await db.scalar(select(UserModel.id).where(UserModel.username == user_data.username)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
 
+    # Return the connection to the pool while the hash is computed
+    await db.close()
+
+    try:
+        password_hash = await password_hasher.hash(user_data.password)
+    except HasherSaturatedError:
+        raise _hasher_busy()
+
     # Create new user
     db_user = UserModel(
         email=user_data.email,
         username=user_data.username,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
     )
 
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.flush()
 
     # Auto-create default organization for new user
     org_name = f"{user_data.username}'s Organization" if user_data.username else f"{user_data.email}'s Organization"
@@ -71,8 +88,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         owner_id=db_user.id,
     )
     db.add(default_org)
-    db.commit()
-    db.refresh(default_org)
+    await db.flush()
 
     # Add user as organization admin
     org_member = OrganizationMember(
@@ -81,13 +97,14 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         role="admin"
     )
     db.add(org_member)
-    db.commit()
+    await db.commit()
+    await db.refresh(db_user)
 
     return db_user
 
 
 @router.post("/login", response_model=Token)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """
     Login user and return access and refresh tokens.
 
@@ -99,12 +116,23 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
         Token: Access and refresh tokens
 
     Raises:
-        HTTPException: If credentials are invalid
+        HTTPException: If credentials are invalid, or the password hashing
+            pool is saturated
     """
     # Find user by email
-    user = db.query(UserModel).filter(UserModel.email == user_data.email).first()
+    user = await db.scalar(select(UserModel).where(UserModel.email == user_data.email))
+
+    # Return the connection to the pool while the hash is verified
+    await db.close()
+
+    try:
+        password_valid = user is not None and await password_hasher.verify(
+            user_data.password, user.password_hash
+        )
+    except HasherSaturatedError:
+        raise _hasher_busy()
 
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -129,7 +157,7 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
+async def refresh_token(refresh_token: str, db: AsyncSession = Depends(get_async_db)):
     """
     Refresh access token using refresh token.
 
@@ -160,7 +188,7 @@ async def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
             )
 
         # Verify user exists and is active
-        user = db.query(UserModel).filter(UserModel.id == int(user_id)).first()
+        user = await db.get(UserModel, int(user_id))
         if not user or not user.is_active:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,51 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from typing import List
 
 from ...database import get_db
 from ...models.user import User as UserModel
 from ...models.board import Board as BoardModel, Column as ColumnModel
-from ...models.project import Project as ProjectModel, ProjectMember
 from ...schemas.board import (
     Board,
     BoardCreate,
     BoardUpdate,
+    BoardSnapshot,
     BoardWithColumns,
     Column,
     ColumnCreate,
     ColumnUpdate,
 )
 from ...dependencies import get_current_user
+from ...utils.rank import rank_sequence
+from ...services import access, ordering
+from ...services.board_snapshot import load_board_snapshot
 
 router = APIRouter()
 
 
-def check_project_access(project_id: int, user: UserModel, db: Session) -> ProjectModel:
-    """Check if user has access to project"""
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Check if user is project member
-    is_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user.id
-    ).first()
-    
-    if not is_member:
-        raise HTTPException(status_code=403, detail="Access denied")
-    
-    return project
+def check_project_access(project_id: int, user: UserModel, db: Session) -> str:
+    """Check if user has access to project, returns the user's role"""
+    return access.require_project_access(db, project_id, user)
 
 
 def check_board_access(board_id: int, user: UserModel, db: Session) -> BoardModel:
     """Check if user has access to board"""
-    board = db.query(BoardModel).filter(BoardModel.id == board_id).first()
-    if not board:
-        raise HTTPException(status_code=404, detail="Board not found")
-    
-    check_project_access(board.project_id, user, db)
-    return board
+    return access.resolve_board(db, board_id, user)
 
 
 @router.get("/project/{project_id}", response_model=List[Board])
@@ -76,7 +61,7 @@ def get_board(
     # Get columns
     columns = db.query(ColumnModel).filter(
         ColumnModel.board_id == board_id
-    ).order_by(ColumnModel.position).all()
+    ).order_by(ColumnModel.rank, ColumnModel.id).all()
     
     return BoardWithColumns(
         **board.__dict__,
@@ -84,6 +69,22 @@ def get_board(
     )
 
 
+@router.get("/{board_id}/snapshot", response_model=BoardSnapshot)
+def get_board_snapshot(
+    board_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Get a board with its columns, tasks, assignees and labels.
+
+    Tasks reference users and labels by id; each user and label is listed
+    once. Costs a constant number of queries regardless of board size.
+    """
+    board = check_board_access(board_id, current_user, db)
+    return load_board_snapshot(db, board)
+
+
 @router.post("/", response_model=Board, status_code=status.HTTP_201_CREATED)
 def create_board(
     board_data: BoardCreate,
@@ -111,11 +112,13 @@ def create_board(
         {"name": "Готово", "position": 2},
     ]
     
-    for col_data in default_columns:
+    ranks = rank_sequence(len(default_columns))
+    for col_data, rank in zip(default_columns, ranks):
         column = ColumnModel(
             board_id=db_board.id,
             name=col_data["name"],
             position=col_data["position"],
+            rank=rank,
         )
         db.add(column)
     
@@ -174,6 +177,7 @@ def create_column(
         board_id=column_data.board_id,
         name=column_data.name,
         position=column_data.position,
+        rank=ordering.rank_for_position(db, ColumnModel, column_data.board_id, column_data.position),
         wip_limit=column_data.wip_limit,
     )
     db.add(db_column)
@@ -191,13 +195,15 @@ def update_column(
     current_user: UserModel = Depends(get_current_user),
 ):
     """Update column"""
-    column = db.query(ColumnModel).filter(ColumnModel.id == column_id).first()
-    if not column:
-        raise HTTPException(status_code=404, detail="Column not found")
-    
-    check_board_access(column.board_id, current_user, db)
+    column, _ = access.resolve_column(db, column_id, current_user)
     
     update_data = column_data.model_dump(exclude_unset=True)
+    if update_data.get("position") is not None:
+        # Reordering touches only this row; the position index of the
+        # others is refreshed when the board is rebalanced
+        column.rank = ordering.rank_for_position(
+            db, ColumnModel, column.board_id, update_data["position"], exclude_id=column.id
+        )
     for field, value in update_data.items():
         setattr(column, field, value)
     
@@ -214,11 +220,7 @@ def delete_column(
     current_user: UserModel = Depends(get_current_user),
 ):
     """Delete column"""
-    column = db.query(ColumnModel).filter(ColumnModel.id == column_id).first()
-    if not column:
-        raise HTTPException(status_code=404, detail="Column not found")
-    
-    check_board_access(column.board_id, current_user, db)
+    column, _ = access.resolve_column(db, column_id, current_user)
     
     db.delete(column)
     db.commit()
@@ -0,0 +1,118 @@
+"""Notification API endpoints"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from ...config import settings
+from ...database import get_db
+from ...models.notification import Notification as NotificationModel
+from ...models.user import User as UserModel
+from ...schemas.notification import NotificationPage, NotificationsMarkedRead, UnreadCount
+from ...dependencies import get_current_user
+from ...services.notification_counts import UNREAD, apply_unread_deltas, unread_count
+from ...utils.pagination import decode_cursor, encode_cursor, keyset_after
+
+router = APIRouter()
+
+
+@router.get("/", response_model=NotificationPage)
+def get_notifications(
+    unread_only: bool = False,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    List the current user's notifications, newest first, using cursor
+    pagination. With unread_only, only the partial unread index is read.
+    """
+    cursor_name = "notifications:unread" if unread_only else "notifications"
+    keys = (NotificationModel.created_at, NotificationModel.id)
+    query = select(NotificationModel).where(NotificationModel.user_id == current_user.id)
+    if unread_only:
+        query = query.where(UNREAD)
+    if cursor:
+        query = query.where(keyset_after(keys, decode_cursor(cursor, cursor_name), descending=True))
+    items = db.scalars(
+        query.order_by(NotificationModel.created_at.desc(), NotificationModel.id.desc()).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(cursor_name, [items[-1].created_at, items[-1].id])
+    return {"items": items, "next_cursor": next_cursor}
+
+
+@router.get("/unread-count", response_model=UnreadCount)
+def get_unread_count(
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Number of unread notifications, from the cached counter"""
+    return {"unread_count": unread_count(db, current_user.id)}
+
+
+@router.post("/read-all", response_model=NotificationsMarkedRead)
+def mark_all_read(
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Mark every unread notification read, in one UPDATE"""
+    result = db.execute(
+        update(NotificationModel)
+        .where(NotificationModel.user_id == current_user.id, UNREAD)
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    )
+    apply_unread_deltas(db, {current_user.id: -result.rowcount})
+    db.commit()
+    return {"updated": result.rowcount, "unread_count": unread_count(db, current_user.id)}
+
+
+@router.post("/{notification_id}/read", response_model=NotificationsMarkedRead)
+def mark_read(
+    notification_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Mark a notification read; marking a read one again changes nothing"""
+    result = db.execute(
+        update(NotificationModel)
+        .where(NotificationModel.id == notification_id, NotificationModel.user_id == current_user.id, UNREAD)
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        apply_unread_deltas(db, {current_user.id: -1})
+        db.commit()
+    elif db.scalar(
+        select(NotificationModel.id)
+        .where(NotificationModel.id == notification_id, NotificationModel.user_id == current_user.id)
+    ) is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return {"updated": result.rowcount, "unread_count": unread_count(db, current_user.id)}
+
+
+@router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_notification(
+    notification_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Delete a notification"""
+    was_read = db.scalar(
+        delete(NotificationModel)
+        .where(NotificationModel.id == notification_id, NotificationModel.user_id == current_user.id)
+        .returning(NotificationModel.is_read)
+        .execution_options(synchronize_session=False)
+    )
+    if was_read is None:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    if not was_read:
+        apply_unread_deltas(db, {current_user.id: -1})
+    db.commit()
@@ -1,10 +1,12 @@
 """Organization API endpoints"""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from typing import List
 
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.organization import (
     Organization,
     OrganizationCreate,
@@ -25,7 +27,7 @@ router = APIRouter()
 async def create_organization(
     org_data: OrganizationCreate,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new organization."""
     # Create organization
@@ -34,7 +36,7 @@ async def create_organization(
         owner_id=current_user.id
     )
     db.add(org)
-    db.flush()
+    await db.flush()
 
     # Add creator as owner
     member = OrgMemberModel(
@@ -43,8 +45,8 @@ async def create_organization(
         role=UserRole.OWNER
     )
     db.add(member)
-    db.commit()
-    db.refresh(org)
+    await db.commit()
+    await db.refresh(org)
 
     return org
 
@@ -54,28 +56,34 @@ async def list_organizations(
     skip: int = 0,
     limit: int = 50,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List organizations where user is a member."""
-    # Get user's organization memberships
-    memberships = db.query(OrgMemberModel).filter(
-        OrgMemberModel.user_id == current_user.id
-    ).all()
-
-    org_ids = [m.organization_id for m in memberships]
-    orgs = db.query(OrgModel).filter(OrgModel.id.in_(org_ids)).offset(skip).limit(limit).all()
+    # Organizations the user is a member of
+    result = await db.scalars(
+        select(OrgModel)
+        .join(OrgMemberModel, OrgMemberModel.organization_id == OrgModel.id)
+        .where(OrgMemberModel.user_id == current_user.id)
+        .order_by(OrgModel.id)
+        .offset(skip)
+        .limit(limit)
+    )
 
-    return orgs
+    return result.all()
 
 
 @router.get("/{org_id}", response_model=OrganizationWithMembers)
 async def get_organization(
     org_id: int,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get organization by ID."""
-    org = db.query(OrgModel).filter(OrgModel.id == org_id).first()
+    org = await db.scalar(
+        select(OrgModel)
+        .where(OrgModel.id == org_id)
+        .options(selectinload(OrgModel.members).selectinload(OrgMemberModel.user))
+    )
 
     if not org:
         raise HTTPException(
@@ -84,10 +92,7 @@ async def get_organization(
         )
 
     # Check if user is a member
-    is_member = db.query(OrgMemberModel).filter(
-        OrgMemberModel.organization_id == org_id,
-        OrgMemberModel.user_id == current_user.id
-    ).first()
+    is_member = any(m.user_id == current_user.id for m in org.members)
 
     if not is_member:
         raise HTTPException(
@@ -103,11 +108,11 @@ async def update_organization(
     org_id: int,
     org_update: OrganizationUpdate,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update organization."""
     # TODO: Check if user has permission to update (owner or admin)
-    org = db.query(OrgModel).filter(OrgModel.id == org_id).first()
+    org = await db.get(OrgModel, org_id)
 
     if not org:
         raise HTTPException(
@@ -119,8 +124,8 @@ async def update_organization(
     for field, value in update_data.items():
         setattr(org, field, value)
 
-    db.commit()
-    db.refresh(org)
+    await db.commit()
+    await db.refresh(org)
 
     return org
 
@@ -129,11 +134,11 @@ async def update_organization(
 async def delete_organization(
     org_id: int,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete organization."""
     # TODO: Check if user is owner
-    org = db.query(OrgModel).filter(OrgModel.id == org_id).first()
+    org = await db.get(OrgModel, org_id)
 
     if not org:
         raise HTTPException(
@@ -141,8 +146,8 @@ async def delete_organization(
             detail="Organization not found"
         )
 
-    db.delete(org)
-    db.commit()
+    await db.delete(org)
+    await db.commit()
 
 
 @router.post("/{org_id}/members", response_model=OrganizationMember, status_code=status.HTTP_201_CREATED)
@@ -150,7 +155,7 @@ async def add_organization_member(
     org_id: int,
     member_data: OrganizationMemberCreate,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Add member to organization."""
     # TODO: Check if current user has permission to add members
@@ -160,8 +165,15 @@ async def add_organization_member(
         **member_data.model_dump()
     )
     db.add(member)
-    db.commit()
-    db.refresh(member)
+    await db.commit()
+
+    # Reload with the user eagerly loaded; lazy loads are unavailable on AsyncSession
+    member = await db.scalar(
+        select(OrgMemberModel)
+        .where(OrgMemberModel.id == member.id)
+        .options(selectinload(OrgMemberModel.user))
+        .execution_options(populate_existing=True)
+    )
 
     return member
 
@@ -170,11 +182,13 @@ async def add_organization_member(
 async def list_organization_members(
     org_id: int,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List organization members."""
-    members = db.query(OrgMemberModel).filter(
-        OrgMemberModel.organization_id == org_id
-    ).all()
+    result = await db.scalars(
+        select(OrgMemberModel)
+        .where(OrgMemberModel.organization_id == org_id)
+        .options(selectinload(OrgMemberModel.user))
+    )
 
-    return members
+    return result.all()
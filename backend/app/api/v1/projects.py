@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 
+from ...config import settings
 from ...database import get_db
 from ...models.user import User as UserModel
 from ...models.organization import Organization as OrgModel, OrganizationMember
 from ...models.project import Project as ProjectModel, ProjectMember
+from ...schemas.activity import ActivityPage
 from ...schemas.project import Project, ProjectCreate, ProjectUpdate
 from ...dependencies import get_current_user
+from ...services import access
+from ...services.activity_feed import activity_feed
 
 router = APIRouter()
 
@@ -18,18 +22,10 @@ def get_user_projects(
     current_user: UserModel = Depends(get_current_user),
 ):
     """Get all projects where user is a member"""
-    # Get project IDs where user is a member
-    project_memberships = db.query(ProjectMember.project_id).filter(
+    projects = db.query(ProjectModel).join(
+        ProjectMember, ProjectMember.project_id == ProjectModel.id
+    ).filter(
         ProjectMember.user_id == current_user.id
-    ).all()
-    
-    project_ids = [pm.project_id for pm in project_memberships]
-    
-    if not project_ids:
-        return []
-    
-    projects = db.query(ProjectModel).filter(
-        ProjectModel.id.in_(project_ids)
     ).order_by(ProjectModel.created_at.desc()).all()
     
     return projects
@@ -42,20 +38,20 @@ def get_project(
     current_user: UserModel = Depends(get_current_user),
 ):
     """Get project by ID"""
-    # Check if user is project member
-    is_member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not is_member:
-        raise HTTPException(status_code=403, detail="Access denied")
-    
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    return project
+    return access.resolve_project(db, project_id, current_user)
+
+
+@router.get("/{project_id}/activity", response_model=ActivityPage)
+def get_project_activity(
+    project_id: int,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Get activity across a project, newest first, using cursor pagination"""
+    access.require_project_access(db, project_id, current_user)
+    return activity_feed(db, project_id=project_id, limit=limit, cursor=cursor)
 
 
 @router.post("/", response_model=Project, status_code=status.HTTP_201_CREATED)
@@ -122,18 +118,8 @@ def update_project(
     current_user: UserModel = Depends(get_current_user),
 ):
     """Update project"""
-    # Check if user is project admin
-    member = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == current_user.id
-    ).first()
-    
-    if not member or member.role not in ["admin", "owner"]:
-        raise HTTPException(status_code=403, detail="Admin access required")
-    
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Only project admins may update
+    project = access.resolve_project(db, project_id, current_user, roles=access.ADMIN_ROLES)
     
     update_data = project_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
@@ -1,16 +1,512 @@
 """Task API endpoints - TODO: Implement full CRUD"""
 
-from fastapi import APIRouter
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import Session
+
+from ...config import settings
+from ...database import get_db
+from ...models.user import User as UserModel
+from ...models.board import Column as ColumnModel
+from ...models.label import Label as LabelModel, TaskLabel
+from ...models.project import ProjectMember
+from ...models.task import Task as TaskModel, TaskAssignee
+from ...schemas.activity import ActivityPage
+from ...schemas.task import (
+    Task,
+    TaskBatchMove,
+    TaskBatchMoveResult,
+    TaskCreate,
+    TaskMove,
+    TaskMoveOperation,
+    TaskPage,
+    TaskSearchPage,
+    TaskTree,
+    TaskUpdate,
+)
+from ...dependencies import get_current_user
+from ...services import access, notifications, ordering, rollups
+from ...services.activity import jsonable, log_activity
+from ...services.activity_feed import activity_feed
+from ...services.column_counts import apply_task_count_deltas
+from ...services.events import Event, publish_after_commit
+from ...services.search import search_tasks
+from ...services.task_export import stream_export
+from ...services.task_import import stream_import
+from ...services.task_listing import list_tasks
+from ...services.task_moves import move_tasks
+from ...services.task_numbers import allocate_task_numbers
+from ...services.task_tree import task_ancestors, task_subtree
+from ...utils.constants import (
+    DataFormat,
+    NotificationType,
+    SortOrder,
+    TaskPriority,
+    TaskSortField,
+    TaskStatus,
+    TaskType,
+)
+from ...utils.rank import rank_between
 
 router = APIRouter()
 
 # TODO: Implement task operations
-# - POST / - create task
-# - GET / - list tasks with filters
 # - GET /{id} - get task details
-# - PUT /{id} - update task
-# - DELETE /{id} - delete task
-# - PUT /{id}/move - move task to different column
 # - POST /{id}/assign - assign user to task
 # - POST /{id}/labels - add label to task
-# - GET /{id}/activity - get task activity
+
+
+def task_response(task: TaskModel, creator=None, assignees=(), labels=()) -> dict:
+    """Task columns plus the related objects expected by the Task schema"""
+    data = {attr.key: getattr(task, attr.key) for attr in inspect(TaskModel).column_attrs}
+    data.update(creator=creator, assignees=list(assignees), labels=list(labels))
+    return data
+
+
+def load_task_response(db: Session, task: TaskModel) -> dict:
+    """Task response with creator, assignees and labels loaded"""
+    creator = db.get(UserModel, task.creator_id) if task.creator_id is not None else None
+    assignees = db.scalars(
+        select(UserModel)
+        .join(TaskAssignee, TaskAssignee.user_id == UserModel.id)
+        .where(TaskAssignee.task_id == task.id)
+        .order_by(TaskAssignee.assigned_at, UserModel.id)
+    ).all()
+    labels = db.scalars(
+        select(LabelModel)
+        .join(TaskLabel, TaskLabel.label_id == LabelModel.id)
+        .where(TaskLabel.task_id == task.id)
+        .order_by(LabelModel.name)
+    ).all()
+    return task_response(task, creator=creator, assignees=assignees, labels=labels)
+
+
+@router.post("/", response_model=Task, status_code=status.HTTP_201_CREATED)
+def create_task(
+    task_data: TaskCreate,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Create a new task, at the end of its column (the board's first column by default)"""
+    board = access.resolve_board(db, task_data.board_id, current_user)
+    if board.project_id != task_data.project_id:
+        raise HTTPException(status_code=400, detail="Board does not belong to the project")
+
+    column_query = select(ColumnModel.id, ColumnModel.board_id, ColumnModel.task_count)
+    if task_data.column_id is None:
+        column = db.execute(
+            column_query.where(ColumnModel.board_id == board.id)
+            .order_by(ColumnModel.rank, ColumnModel.id).limit(1)
+        ).first()
+    else:
+        column = db.execute(column_query.where(ColumnModel.id == task_data.column_id)).first()
+        if column is None or column.board_id != board.id:
+            raise HTTPException(status_code=404, detail="Column not found")
+
+    if task_data.parent_task_id is not None:
+        parent_project_id = db.scalar(
+            select(TaskModel.project_id).where(TaskModel.id == task_data.parent_task_id)
+        )
+        if parent_project_id != board.project_id:
+            raise HTTPException(status_code=404, detail="Parent task not found")
+
+    assignees = []
+    if task_data.assignee_ids:
+        assignee_ids = set(task_data.assignee_ids)
+        assignees = db.scalars(
+            select(UserModel)
+            .join(ProjectMember, ProjectMember.user_id == UserModel.id)
+            .where(ProjectMember.project_id == board.project_id, UserModel.id.in_(assignee_ids))
+            .order_by(UserModel.id)
+        ).all()
+        if len(assignees) != len(assignee_ids):
+            raise HTTPException(status_code=400, detail="Assignees must be project members")
+
+    # Committed on its own, before this session writes anything
+    task_number = allocate_task_numbers(db, board.project_id)[0]
+
+    if column is not None:
+        apply_task_count_deltas(db, {column.id: 1})
+        rank = ordering.rank_at_end(db, TaskModel, column.id)
+    else:
+        rank = rank_between(None, None)
+
+    task = TaskModel(
+        project_id=board.project_id,
+        board_id=board.id,
+        column_id=column.id if column is not None else None,
+        title=task_data.title,
+        description=task_data.description,
+        task_number=task_number,
+        priority=task_data.priority.value,
+        type=task_data.type.value,
+        story_points=task_data.story_points,
+        estimated_hours=task_data.estimated_hours,
+        start_date=task_data.start_date,
+        due_date=task_data.due_date,
+        position=column.task_count if column is not None else 0,
+        rank=rank,
+        creator_id=current_user.id,
+        parent_task_id=task_data.parent_task_id,
+        assignees=[TaskAssignee(user_id=user.id) for user in assignees],
+    )
+    db.add(task)
+    db.flush()
+    rollups.propagate(
+        db,
+        task.parent_task_id,
+        rollups.own_contribution(task.story_points, task.estimated_hours, task.actual_hours, task.status),
+    )
+    log_activity(
+        db,
+        action="created",
+        entity_type="task",
+        entity_id=task.id,
+        user_id=current_user.id,
+        project_id=task.project_id,
+        task_id=task.id,
+    )
+    if assignees:
+        notifications.notify_after_commit(db, notifications.Fanout(
+            type=NotificationType.TASK_ASSIGNED,
+            title=f"You were assigned to {task.title}",
+            link=notifications.task_link(task),
+            recipients=notifications.users(user.id for user in assignees),
+            exclude_user_id=current_user.id,
+        ))
+    publish_after_commit(
+        db,
+        Event(
+            type="task.created",
+            project_id=task.project_id,
+            board_id=task.board_id,
+            data={"id": task.id, "column_id": task.column_id, "rank": task.rank},
+        ),
+    )
+    db.commit()
+    db.refresh(task)
+
+    return task_response(task, creator=current_user, assignees=assignees)
+
+
+@router.get("/", response_model=TaskPage)
+def get_tasks(
+    project_id: int,
+    board_id: Optional[int] = None,
+    column_id: Optional[int] = None,
+    status: Optional[List[TaskStatus]] = Query(None),
+    priority: Optional[List[TaskPriority]] = Query(None),
+    type: Optional[List[TaskType]] = Query(None),
+    assignee_id: Optional[int] = None,
+    label_id: Optional[int] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+    sort: TaskSortField = TaskSortField.CREATED_AT,
+    order: SortOrder = SortOrder.DESC,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    List project tasks with filters, using cursor pagination.
+
+    Pass the returned next_cursor to get the following page; it is null on
+    the last page. status, priority and type may be repeated. Sorted by
+    due date, tasks without one come after all others.
+    """
+    access.require_project_access(db, project_id, current_user)
+
+    return list_tasks(
+        db,
+        project_id,
+        board_id=board_id,
+        column_id=column_id,
+        status=status,
+        priority=priority,
+        type=type,
+        assignee_id=assignee_id,
+        label_id=label_id,
+        due_from=due_from,
+        due_to=due_to,
+        sort=sort,
+        order=order,
+        limit=limit,
+        cursor=cursor,
+    )
+
+
+@router.get("/search", response_model=TaskSearchPage)
+def search_project_tasks(
+    project_id: int,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Full-text search over task titles, descriptions and comments.
+
+    Results are ranked, best first; every word must match and the last
+    one matches as a prefix. Pass next_cursor to get the following page.
+    """
+    access.require_project_access(db, project_id, current_user)
+    return search_tasks(db, project_id, q, limit=limit, cursor=cursor)
+
+
+@router.get("/export")
+def export_tasks(
+    project_id: int,
+    board_id: Optional[int] = None,
+    format: DataFormat = DataFormat.NDJSON,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Export all tasks of a project (or board) as NDJSON or CSV.
+
+    Rows are streamed as they are read, with assignees, labels and custom
+    field values. CSV exports can be fed back to POST /import.
+    """
+    access.require_project_access(db, project_id, current_user)
+    if board_id is not None:
+        board = access.resolve_board(db, board_id, current_user)
+        if board.project_id != project_id:
+            raise HTTPException(status_code=400, detail="Board does not belong to the project")
+
+    media_type = "text/csv" if format is DataFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        stream_export(format, project_id, board_id),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks-{project_id}.{format.value}"'},
+    )
+
+
+@router.post("/import")
+def import_tasks(
+    project_id: int,
+    board_id: int,
+    format: DataFormat = DataFormat.CSV,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Import tasks into a board from a CSV or NDJSON upload.
+
+    The response is an NDJSON stream: an "error" line per rejected record,
+    a "progress" line after each committed batch and a final "done" line.
+    Batches are committed as they go, so an interrupted import keeps what
+    was already reported. See app.services.task_import for the fields.
+    """
+    board = access.resolve_board(db, board_id, current_user)
+    if board.project_id != project_id:
+        raise HTTPException(status_code=400, detail="Board does not belong to the project")
+    if file.size is not None and file.size > settings.IMPORT_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    return StreamingResponse(
+        stream_import(file.file, format, project_id, board_id, creator_id=current_user.id),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/move", response_model=TaskBatchMoveResult)
+def batch_move_tasks(
+    move_data: TaskBatchMove,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Move several tasks of one board in a single transaction.
+
+    Operations are applied in order, so "move these cards to the top of
+    column X" can be sent as positions 0, 1, 2... The response lists every
+    task whose rank changed.
+    """
+    result = move_tasks(db, move_data.operations, current_user)
+    db.commit()
+    return result
+
+
+@router.put("/{task_id}", response_model=Task)
+def update_task(
+    task_id: int,
+    task_data: TaskUpdate,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Update task fields; only the fields sent are changed.
+
+    Changing estimates, hours or status updates the roll-ups along the
+    task's ancestor path. Re-parenting moves the task's whole contribution
+    from the old ancestor path to the new one.
+    """
+    task = access.resolve_task(db, task_id, current_user)
+    changes = task_data.model_dump(exclude_unset=True)
+    for field in ("title", "priority", "status", "type"):
+        if field in changes and changes[field] is None:
+            del changes[field]
+
+    old_parent_id = task.parent_task_id
+    new_parent_id = changes.get("parent_task_id", old_parent_id)
+    if new_parent_id != old_parent_id and new_parent_id is not None:
+        parent_project_id = db.scalar(select(TaskModel.project_id).where(TaskModel.id == new_parent_id))
+        if parent_project_id != task.project_id:
+            raise HTTPException(status_code=404, detail="Parent task not found")
+        if rollups.is_descendant_or_self(db, task.id, new_parent_id):
+            raise HTTPException(status_code=400, detail="A task cannot become a subtask of itself or its subtasks")
+
+    before = rollups.subtree_contribution(task)
+    diff = {}
+    for field, value in changes.items():
+        value = getattr(value, "value", value)
+        if getattr(task, field) != value:
+            diff[field] = [jsonable(getattr(task, field)), jsonable(value)]
+        setattr(task, field, value)
+    if "status" in changes:
+        if task.status == TaskStatus.DONE.value:
+            task.completed_at = task.completed_at or datetime.now(timezone.utc)
+        else:
+            task.completed_at = None
+    after = rollups.subtree_contribution(task)
+
+    if new_parent_id == old_parent_id:
+        rollups.propagate(db, old_parent_id, rollups.difference(after, before))
+    else:
+        rollups.propagate(db, old_parent_id, rollups.negate(before))
+        rollups.propagate(db, new_parent_id, after)
+
+    if diff:
+        log_activity(
+            db,
+            action="updated",
+            entity_type="task",
+            entity_id=task.id,
+            user_id=current_user.id,
+            project_id=task.project_id,
+            task_id=task.id,
+            changes=diff,
+        )
+        notifications.notify_after_commit(db, notifications.Fanout(
+            type=NotificationType.TASK_UPDATED,
+            title=f"{current_user.username} updated {task.title}",
+            content=", ".join(diff),
+            link=notifications.task_link(task),
+            recipients=notifications.task_watchers(task.id),
+            exclude_user_id=current_user.id,
+        ))
+    publish_after_commit(
+        db,
+        Event(
+            type="task.updated",
+            project_id=task.project_id,
+            board_id=task.board_id,
+            data={"id": task.id, "fields": sorted(changes)},
+        ),
+    )
+    db.commit()
+    db.refresh(task)
+
+    return load_task_response(db, task)
+
+
+@router.put("/{task_id}/move", response_model=TaskBatchMoveResult)
+def move_task(
+    task_id: int,
+    move_data: TaskMove,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Move a task to a column, at an index or rank"""
+    operation = TaskMoveOperation(task_id=task_id, **move_data.model_dump())
+    result = move_tasks(db, [operation], current_user)
+    db.commit()
+    return result
+
+
+@router.get("/{task_id}/subtree", response_model=TaskTree)
+def get_task_subtree(
+    task_id: int,
+    depth: int = Query(settings.TASK_TREE_MAX_DEPTH, ge=1, le=settings.TASK_TREE_MAX_DEPTH),
+    limit: int = Query(500, ge=1, le=settings.TASK_TREE_MAX_NODES),
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Get a task and its subtasks, down to depth levels, in one query.
+
+    Nodes are listed breadth-first with their parent_task_id; truncated is
+    set when more than limit nodes exist.
+    """
+    access.resolve_task(db, task_id, current_user)
+    return task_subtree(db, task_id, max_depth=depth, limit=limit)
+
+
+@router.get("/{task_id}/ancestors", response_model=TaskTree)
+def get_task_ancestors(
+    task_id: int,
+    depth: int = Query(settings.TASK_TREE_MAX_DEPTH, ge=1, le=settings.TASK_TREE_MAX_DEPTH),
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Get a task and its parent chain, nearest first, in one query"""
+    access.resolve_task(db, task_id, current_user)
+    return task_ancestors(db, task_id, max_depth=depth)
+
+
+@router.get("/{task_id}/activity", response_model=ActivityPage)
+def get_task_activity(
+    task_id: int,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """
+    Get task activity, newest first, using cursor pagination.
+
+    Recent changes may take up to ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS to
+    appear.
+    """
+    access.resolve_task(db, task_id, current_user)
+    return activity_feed(db, task_id=task_id, limit=limit, cursor=cursor)
+
+
+@router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_task(
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user),
+):
+    """Delete task"""
+    task = access.resolve_task(db, task_id, current_user)
+
+    apply_task_count_deltas(db, {task.column_id: -1})
+    # Subtasks are detached and keep their own roll-ups
+    rollups.propagate(db, task.parent_task_id, rollups.negate(rollups.subtree_contribution(task)))
+    # Written with the delete; no task_id, the row is going away
+    log_activity(
+        db,
+        action="deleted",
+        entity_type="task",
+        entity_id=task.id,
+        user_id=current_user.id,
+        project_id=task.project_id,
+        changes={"title": task.title, "task_number": task.task_number},
+        durable=True,
+    )
+    publish_after_commit(
+        db,
+        Event(type="task.deleted", project_id=task.project_id, board_id=task.board_id, data={"id": task.id}),
+    )
+    db.delete(task)
+    db.commit()
+
+    return None
@@ -1,10 +1,11 @@
 """User API endpoints"""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
-from app.database import get_db
+from app.database import get_async_db
 from app.schemas.user import User, UserUpdate
 from app.models.user import User as UserModel
 from app.dependencies import get_current_active_user
@@ -33,7 +34,7 @@ async def get_current_user_profile(
 async def update_current_user_profile(
     user_update: UserUpdate,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update current user profile.
@@ -51,8 +52,8 @@ async def update_current_user_profile(
     for field, value in update_data.items():
         setattr(current_user, field, value)
 
-    db.commit()
-    db.refresh(current_user)
+    await db.commit()
+    await db.refresh(current_user)
 
     return current_user
 
@@ -60,7 +61,7 @@ async def update_current_user_profile(
 @router.get("/{user_id}", response_model=User)
 async def get_user(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserModel = Depends(get_current_active_user)
 ):
     """
@@ -77,7 +78,7 @@ async def get_user(
     Raises:
         HTTPException: If user not found
     """
-    user = db.query(UserModel).filter(UserModel.id == user_id).first()
+    user = await db.get(UserModel, user_id)
 
     if not user:
         raise HTTPException(
@@ -92,7 +93,7 @@ async def get_user(
 async def list_users(
     skip: int = 0,
     limit: int = 50,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserModel = Depends(get_current_active_user)
 ):
     """
@@ -107,5 +108,5 @@ async def list_users(
     Returns:
         List[User]: List of users
     """
-    users = db.query(UserModel).offset(skip).limit(limit).all()
-    return users
+    result = await db.scalars(select(UserModel).order_by(UserModel.id).offset(skip).limit(limit))
+    return result.all()
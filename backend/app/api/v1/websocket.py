@@ -1,30 +1,129 @@
-"""WebSocket API endpoints - TODO: Implement"""
+"""WebSocket API endpoints"""
 
-from fastapi import APIRouter, WebSocket
+import asyncio
+import json
+import time
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, WebSocket, status
+from fastapi.concurrency import run_in_threadpool
+from jose import jwt
+
+from ...database import AsyncSessionLocal, SessionLocal
+from ...dependencies import authenticate_token
+from ...models.user import User as UserModel
+from ...services.access import require_project_access, resolve_board
+from ...services.realtime import Connection, Room, hub, parse_room
 
 router = APIRouter()
 
 
+def _authorize(user: UserModel, room: Room) -> None:
+    """Check that the user may join a room (runs in the threadpool)"""
+    kind, room_id = room
+    db = SessionLocal()
+    try:
+        if kind == "board":
+            try:
+                resolve_board(db, room_id, user)
+            except HTTPException as exc:
+                # Subscribing must not tell which board IDs exist
+                if exc.status_code == 404:
+                    raise HTTPException(status_code=403, detail="Access denied")
+                raise
+        else:
+            require_project_access(db, room_id, user)
+    finally:
+        db.close()
+
+
+async def _handle(connection: Connection, user: UserModel, text: str) -> None:
+    """Answer one client message"""
+    try:
+        message = json.loads(text)
+        action = message.get("action")
+    except (ValueError, AttributeError):
+        connection.send({"type": "error", "detail": "Messages must be JSON objects"})
+        return
+
+    if action == "ping":
+        connection.send({"type": "pong"})
+        return
+    if action not in ("subscribe", "unsubscribe"):
+        connection.send({"type": "error", "detail": f"Unknown action: {action}"})
+        return
+
+    room = parse_room(message.get("room", ""))
+    if room is None:
+        connection.send({"type": "error", "detail": "Room must be board:<id> or project:<id>"})
+        return
+    name = f"{room[0]}:{room[1]}"
+    if action == "unsubscribe":
+        hub.leave(connection, room)
+        connection.send({"type": "unsubscribed", "room": name})
+        return
+
+    try:
+        await run_in_threadpool(_authorize, user, room)
+    except HTTPException as exc:
+        connection.send({"type": "error", "room": name, "detail": exc.detail})
+        return
+    if not hub.join(connection, room):
+        connection.send({"type": "error", "room": name, "detail": "Too many subscriptions"})
+        return
+    connection.send({"type": "subscribed", "room": name})
+
+
 @router.websocket("/")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(websocket: WebSocket, token: Optional[str] = None):
     """
-    WebSocket endpoint for real-time updates.
-
-    TODO: Implement WebSocket connection handling:
-    - Accept connection
-    - Authenticate user
-    - Handle incoming messages
-    - Broadcast updates to connected clients
-    - Handle disconnection
+    Real-time change events of boards and projects.
+
+    Authenticate with ``?token=<access token>`` (browsers cannot set
+    headers on WebSocket requests) or an ``Authorization: Bearer``
+    header. The socket is closed once the token expires.
+
+    Client messages:
+        {"action": "subscribe", "room": "board:<id>"}  (or "project:<id>")
+        {"action": "unsubscribe", "room": "board:<id>"}
+        {"action": "ping"}
+
+    Server messages are events such as ``{"type": "task.updated",
+    "project_id": 1, "board_id": 2, "data": {...}}``, replies to the
+    above, and ``{"type": "resync"}`` when events were dropped because
+    the client fell behind and its rooms must be reloaded.
     """
-    await websocket.accept()
+    if token is None:
+        scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+        token = credentials if scheme.lower() == "bearer" else None
+    try:
+        if token is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+        async with AsyncSessionLocal() as db:
+            user = await authenticate_token(token, db)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    connection = hub.connect(websocket, user.id)
+    if connection is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
 
+    expiry = None
+    exp = jwt.get_unverified_claims(token).get("exp")
+    if exp is not None:
+        expiry = asyncio.get_running_loop().call_later(
+            max(exp - time.time(), 0), connection.close, status.WS_1008_POLICY_VIOLATION, "Token expired"
+        )
     try:
+        await websocket.accept()
         while True:
-            data = await websocket.receive_text()
-            # TODO: Process message and broadcast to other clients
-            await websocket.send_text(f"Echo: {data}")
-    except Exception as e:
-        print(f"WebSocket error: {e}")
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            await _handle(connection, user, message.get("text") or "")
     finally:
-        await websocket.close()
+        if expiry is not None:
+            expiry.cancel()
+        hub.disconnect(connection)
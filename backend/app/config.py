@@ -22,6 +22,75 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Auth cache
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60
+
+    # Project access cache
+    ACCESS_CACHE_MAX_SIZE: int = 10000
+    ACCESS_CACHE_TTL_SECONDS: int = 30
+
+    # Password hashing
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Activity log: entries are buffered and written in batches
+    ACTIVITY_LOG_BATCH_SIZE: int = 500
+    ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+    ACTIVITY_LOG_MAX_BUFFER: int = 10000
+    # Activity log retention: older months are archived to gzipped NDJSON
+    ACTIVITY_LOG_RETENTION_MONTHS: int = 12
+    ACTIVITY_LOG_PARTITIONS_AHEAD: int = 3  # PostgreSQL monthly partitions created in advance
+    ACTIVITY_LOG_ARCHIVE_DIR: str = "/app/archive/activity_log"
+    ACTIVITY_LOG_MAINTENANCE_INTERVAL_SECONDS: int = 86400
+
+    # Notifications: fan-outs waiting for the background worker
+    NOTIFICATION_QUEUE_SIZE: int = 1000
+    # How often cached unread counts are checked against notifications
+    NOTIFICATION_COUNT_RECONCILE_INTERVAL_SECONDS: int = 3600
+    # Notification retention: read ones expire, repeats collapse, per-user cap
+    NOTIFICATION_RETENTION_DAYS: int = 90
+    NOTIFICATION_MAX_PER_USER: int = 1000
+    NOTIFICATION_COMPACTION_BATCH_SIZE: int = 5000  # Expired rows deleted per transaction
+    NOTIFICATION_COMPACTION_INTERVAL_SECONDS: int = 3600
+    # Deadline notices: sent once a due date is this close
+    DEADLINE_NOTICE_HOURS: int = 24
+    DEADLINE_SCAN_INTERVAL_SECONDS: int = 300
+    DEADLINE_SCAN_CHUNK_SIZE: int = 1000  # Tasks per recipient query and insert
+
+    # WebSocket hub (per worker)
+    WS_MAX_CONNECTIONS: int = 10000
+    WS_MAX_ROOMS_PER_CONNECTION: int = 50
+    WS_SEND_QUEUE_SIZE: int = 256  # Beyond this a client loses its backlog and is told to resync
+    WS_SEND_TIMEOUT_SECONDS: float = 10.0  # Clients not taking a message this long are disconnected
+
+    # Background jobs
+    SCHEDULER_ENABLED: bool = True
+
+    # Rank ordering: lists whose sort keys grow longer than this are respaced
+    RANK_REBALANCE_LENGTH: int = 16
+    RANK_REBALANCE_INTERVAL_SECONDS: int = 300
+
+    # Column task counts: how often cached counts are checked against tasks
+    TASK_COUNT_RECONCILE_INTERVAL_SECONDS: int = 900
+
+    # Subtask roll-ups: how often they are recomputed and drift corrected
+    ROLLUP_VERIFY_INTERVAL_SECONDS: int = 3600
+
+    # Bulk task import
+    IMPORT_BATCH_SIZE: int = 5000
+    IMPORT_MAX_BYTES: int = 536870912  # 512MB
+
+    # Task export
+    EXPORT_CHUNK_SIZE: int = 1000
+
+    # Task hierarchy
+    TASK_TREE_MAX_DEPTH: int = 20
+    TASK_TREE_MAX_NODES: int = 2000
+
+    # Search
+    SEARCH_MAX_CANDIDATES: int = 5000  # Matches ranked per query and source
+
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
 
@@ -36,6 +105,16 @@ class Settings(BaseSettings):
     EMAIL_USERNAME: str = ""
     EMAIL_PASSWORD: str = ""
     EMAIL_FROM: str = "noreply@yourapp.com"
+    EMAIL_USE_TLS: bool = False  # Implicit TLS (port 465); STARTTLS is used whenever offered
+    EMAIL_TIMEOUT_SECONDS: float = 30.0
+    # Notification emails: one digest per user per window, over pooled connections
+    EMAIL_ENABLED: bool = False
+    EMAIL_DIGEST_WINDOW_SECONDS: float = 60.0
+    EMAIL_POOL_SIZE: int = 4
+    EMAIL_IDLE_TIMEOUT_SECONDS: float = 60.0  # Pooled connections unused this long are closed
+    EMAIL_MAX_PENDING: int = 50000  # Notifications waiting for a digest
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BACKOFF_SECONDS: float = 2.0  # Doubled after every failed attempt
 
     # File Upload
     MAX_FILE_SIZE: int = 10485760  # 10MB
@@ -1,15 +1,42 @@
 """Database configuration and session management"""
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from app.config import settings
 
 # Determine if we're using SQLite
 is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 
+
+def get_async_database_url(url: str) -> str:
+    """
+    Map a database URL to its asyncio driver.
+
+    PostgreSQL URLs use asyncpg and SQLite URLs use aiosqlite, whatever
+    sync driver the configured URL names.
+
+    Args:
+        url: Database URL as configured in DATABASE_URL
+
+    Returns:
+        str: URL for create_async_engine
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    elif backend == "sqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+async_database_url = get_async_database_url(settings.DATABASE_URL)
+
 # Create SQLAlchemy engine with appropriate settings
 if is_sqlite:
     # SQLite specific settings
@@ -18,6 +45,7 @@ if is_sqlite:
         connect_args={"check_same_thread": False},  # Required for SQLite
         echo=settings.DEBUG
     )
+    async_engine = create_async_engine(async_database_url, echo=settings.DEBUG)
 else:
     # PostgreSQL settings
     engine = create_engine(
@@ -27,10 +55,26 @@ else:
         max_overflow=20,
         echo=settings.DEBUG
     )
+    async_engine = create_async_engine(
+        async_database_url,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+        echo=settings.DEBUG
+    )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async sessions don't expire on commit: a lazy refresh would need
+# blocking IO outside of an await
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -49,6 +93,17 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an asyncio database session.
+
+    Yields:
+        AsyncSession: SQLAlchemy asyncio database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db() -> None:
     """Initialize database - create all tables"""
     Base.metadata.create_all(bind=engine)
@@ -2,73 +2,151 @@
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 from typing import Optional
 
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.config import settings
 from app.models.user import User
+from app.services import auth_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
 
-async def get_current_user(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _token_user_id(token: str) -> int:
+    """Verify a token (or find it in the cache) and return its user ID"""
+    user_id: Optional[int] = auth_cache.get_token_user_id(token)
+    if user_id is None:
+        try:
+            payload = jwt.decode(
+                token,
+                settings.JWT_SECRET_KEY,
+                algorithms=[settings.JWT_ALGORITHM]
+            )
+            sub = payload.get("sub")
+            if sub is None:
+                raise _credentials_exception()
+            user_id = int(sub)
+        except (JWTError, ValueError):
+            raise _credentials_exception()
+        auth_cache.cache_token(token, user_id, payload.get("exp"))
+    return user_id
+
+
+def _require_active(user: User) -> User:
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user"
+        )
+    return user
+
+
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> User:
     """
-    Get current authenticated user from JWT token.
+    Get current authenticated user from JWT token, for sync endpoints.
+
+    Uses the request's get_db session, so a sync endpoint holds a single
+    connection. Async endpoints use get_current_active_user instead.
 
     Args:
         token: JWT token from request header
-        db: Database session
+        db: Database session, shared with the endpoint
 
     Returns:
         User: Current authenticated user
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid, user not found or inactive
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    user_id = _token_user_id(token)
 
-    try:
-        payload = jwt.decode(
-            token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
-        user_id: Optional[int] = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
+    # Steady state: attach the cached snapshot without touching the database
+    cached_user = auth_cache.get_cached_user(user_id)
+    if cached_user is not None:
+        user = db.merge(cached_user, load=False)
+    else:
+        user = db.get(User, user_id)
+        if user is None:
+            raise _credentials_exception()
+        auth_cache.cache_user(user)
+    return _require_active(user)
 
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
-        raise credentials_exception
 
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Inactive user"
-        )
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Get current authenticated user from JWT token, for async endpoints.
 
-    return user
+    Args:
+        token: JWT token from request header
+        db: Async database session, shared with async endpoints of the
+            same request so the returned user can be modified and committed
+
+    Returns:
+        User: Current authenticated user
+
+    Raises:
+        HTTPException: If token is invalid, user not found or inactive
+    """
+    return await authenticate_token(token, db)
+
+
+async def authenticate_token(token: str, db: AsyncSession) -> User:
+    """
+    Resolve an access token to its active user.
+
+    Verified tokens and user rows are cached in-process (see
+    app.services.auth_cache), so repeated requests with the same token
+    skip both JWT verification and the user lookup.
+
+    Args:
+        token: Raw JWT
+        db: Async database session the user is attached to
+
+    Returns:
+        User: Authenticated user
+
+    Raises:
+        HTTPException: If token is invalid, user not found or inactive
+    """
+    user_id = _token_user_id(token)
+
+    # Steady state: attach the cached snapshot without touching the database
+    cached_user = auth_cache.get_cached_user(user_id)
+    if cached_user is not None:
+        user = await db.merge(cached_user, load=False)
+    else:
+        user = await db.get(User, user_id)
+        if user is None:
+            raise _credentials_exception()
+        auth_cache.cache_user(user)
+    return _require_active(user)
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_async)
 ) -> User:
     """
-    Get current active user.
+    Get current active user, for async endpoints.
 
     Args:
-        current_user: Current user from get_current_user dependency
+        current_user: Current user from get_current_user_async dependency
 
     Returns:
         User: Current active user
@@ -1,5 +1,7 @@
 """Main FastAPI application"""
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -7,13 +9,45 @@ import os
 
 from app.config import settings
 from app.api.v1 import auth, users, organizations, projects, boards, tasks
-from app.api.v1 import comments, time_tracking, gantt, analytics, websocket
+from app.api.v1 import comments, time_tracking, gantt, analytics, websocket, notifications
+from app.services.activity import activity_writer
+from app.services.events import bus
+from app.services.mailer import email_dispatcher
+from app.services.notifications import notification_worker
+from app.services.password_hasher import password_hasher
+from app.services.realtime import hub
+from app.services.scheduler import start_scheduler, shutdown_scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background services"""
+    password_hasher.start()
+    activity_writer.start()
+    notification_worker.start()
+    if settings.EMAIL_ENABLED:
+        email_dispatcher.start()
+    bus.bind_loop(asyncio.get_running_loop())
+    hub.start()
+    start_scheduler()
+    yield
+    shutdown_scheduler()
+    await hub.shutdown()
+    bus.bind_loop(None)
+    # Delivers queued fan-outs and writes out buffered entries
+    notification_worker.shutdown()
+    # Sends the digests of everything delivered above
+    await email_dispatcher.shutdown()
+    activity_writer.shutdown()
+    password_hasher.shutdown()
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json"
@@ -46,6 +80,7 @@ app.include_router(comments.router, prefix=f"{settings.API_V1_PREFIX}/comments",
 app.include_router(time_tracking.router, prefix=f"{settings.API_V1_PREFIX}/time-entries", tags=["Time Tracking"])
 app.include_router(gantt.router, prefix=f"{settings.API_V1_PREFIX}/gantt", tags=["Gantt"])
 app.include_router(analytics.router, prefix=f"{settings.API_V1_PREFIX}/analytics", tags=["Analytics"])
+app.include_router(notifications.router, prefix=f"{settings.API_V1_PREFIX}/notifications", tags=["Notifications"])
 app.include_router(websocket.router, prefix=f"{settings.API_V1_PREFIX}/ws", tags=["WebSocket"])
 
 
@@ -65,11 +100,25 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Queue and buffer statistics of this worker"""
+    return {
+        "activity_log": activity_writer.stats(),
+        "email": email_dispatcher.stats(),
+        "notifications": notification_worker.stats(),
+        "password_hasher": password_hasher.stats(),
+        "websocket": hub.stats(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # Compression state is ~100 KB per socket; events are small
+        ws_per_message_deflate=False,
     )
@@ -2,7 +2,7 @@
 
 from app.models.user import User
 from app.models.organization import Organization, OrganizationMember
-from app.models.project import Project, ProjectMember
+from app.models.project import Project, ProjectMember, ProjectTaskCounter
 from app.models.board import Board, Column
 from app.models.task import Task, TaskAssignee, TaskDependency
 from app.models.label import Label, TaskLabel
@@ -10,9 +10,10 @@ from app.models.comment import Comment
 from app.models.attachment import Attachment
 from app.models.checklist import Checklist, ChecklistItem
 from app.models.time_entry import TimeEntry
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationCounter
 from app.models.activity_log import ActivityLog
 from app.models.custom_field import CustomField, TaskCustomFieldValue
+from app.models.job_watermark import JobWatermark
 
 __all__ = [
     "User",
@@ -20,6 +21,7 @@ __all__ = [
     "OrganizationMember",
     "Project",
     "ProjectMember",
+    "ProjectTaskCounter",
     "Board",
     "Column",
     "Task",
@@ -33,7 +35,9 @@ __all__ = [
     "ChecklistItem",
     "TimeEntry",
     "Notification",
+    "NotificationCounter",
     "ActivityLog",
     "CustomField",
     "TaskCustomFieldValue",
+    "JobWatermark",
 ]
@@ -1,6 +1,6 @@
 """ActivityLog model"""
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -9,19 +9,32 @@ from app.database import Base
 
 
 class ActivityLog(Base):
-    """Activity log model for tracking changes"""
+    """
+    Activity log model for tracking changes
+
+    On PostgreSQL the table is range-partitioned by month on created_at
+    (see migration c58d20a7e913 and app.services.activity_archive), with
+    (id, created_at) as its primary key. Filter on created_at so queries
+    only scan the partitions they need.
+    """
 
     __tablename__ = "activity_log"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), index=True)
-    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"))
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"))
     action = Column(String(100), nullable=False)  # created, updated, deleted, moved, etc.
     entity_type = Column(String(50), nullable=False)  # task, comment, project, etc.
     entity_id = Column(Integer, nullable=False)
     changes = Column(JSONB)  # Store old and new values
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    # Activity feeds, newest first
+    __table_args__ = (
+        Index("ix_activity_log_project_id_created_at_id", "project_id", "created_at", "id"),
+        Index("ix_activity_log_task_id_created_at_id", "task_id", "created_at", "id"),
+    )
 
     # Relationships
     user = relationship("User", back_populates="activity_logs")
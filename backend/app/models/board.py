@@ -1,6 +1,6 @@
 """Board and Column models for Kanban"""
 
-from sqlalchemy import Column as SQLColumn, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column as SQLColumn, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,7 +12,7 @@ class Board(Base):
 
     __tablename__ = "boards"
 
-    id = SQLColumn(Integer, primary_key=True, index=True)
+    id = SQLColumn(Integer, primary_key=True)
     project_id = SQLColumn(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     name = SQLColumn(String(255), nullable=False)
     description = SQLColumn(Text)
@@ -21,9 +21,11 @@ class Board(Base):
     created_at = SQLColumn(DateTime(timezone=True), server_default=func.now())
     updated_at = SQLColumn(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (Index("ix_boards_project_id_created_at", "project_id", "created_at"),)
+
     # Relationships
     project = relationship("Project", back_populates="boards")
-    columns = relationship("Column", back_populates="board", cascade="all, delete-orphan", order_by="Column.position")
+    columns = relationship("Column", back_populates="board", cascade="all, delete-orphan", order_by="Column.rank")
     tasks = relationship("Task", back_populates="board", cascade="all, delete-orphan")
 
     def __repr__(self):
@@ -35,14 +37,18 @@ class Column(Base):
 
     __tablename__ = "columns"
 
-    id = SQLColumn(Integer, primary_key=True, index=True)
+    id = SQLColumn(Integer, primary_key=True)
     board_id = SQLColumn(Integer, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
     name = SQLColumn(String(100), nullable=False)
-    position = SQLColumn(Integer, nullable=False)
+    position = SQLColumn(Integer, nullable=False)  # Dense index, refreshed on rebalance
+    rank = SQLColumn(String(64), nullable=False)  # Fractional sort key, see app.utils.rank
     wip_limit = SQLColumn(Integer)  # Work In Progress limit
+    task_count = SQLColumn(Integer, nullable=False, default=0, server_default="0")  # Maintained by app.services.column_counts
     created_at = SQLColumn(DateTime(timezone=True), server_default=func.now())
     updated_at = SQLColumn(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (Index("ix_columns_board_id_rank", "board_id", "rank"),)
+
     # Relationships
     board = relationship("Board", back_populates="columns")
     tasks = relationship("Task", back_populates="column")
@@ -1,6 +1,6 @@
 """Checklist and ChecklistItem models"""
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,12 +12,14 @@ class Checklist(Base):
 
     __tablename__ = "checklists"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     position = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (Index("ix_checklists_task_id_position", "task_id", "position"),)
+
     # Relationships
     task = relationship("Task", back_populates="checklists")
     items = relationship("ChecklistItem", back_populates="checklist", cascade="all, delete-orphan", order_by="ChecklistItem.position")
@@ -31,7 +33,7 @@ class ChecklistItem(Base):
 
     __tablename__ = "checklist_items"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     checklist_id = Column(Integer, ForeignKey("checklists.id", ondelete="CASCADE"), nullable=False)
     content = Column(String(500), nullable=False)
     is_completed = Column(Boolean, default=False)
@@ -39,6 +41,8 @@ class ChecklistItem(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True))
 
+    __table_args__ = (Index("ix_checklist_items_checklist_id_position", "checklist_id", "position"),)
+
     # Relationships
     checklist = relationship("Checklist", back_populates="items")
 
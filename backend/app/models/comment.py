@@ -12,11 +12,11 @@ class Comment(Base):
 
     __tablename__ = "comments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)
-    parent_comment_id = Column(Integer, ForeignKey("comments.id"))  # For threaded comments
+    parent_comment_id = Column(Integer, ForeignKey("comments.id"), index=True)  # For threaded comments
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -13,8 +13,8 @@ class CustomField(Base):
 
     __tablename__ = "custom_fields"
 
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     field_type = Column(String(50), nullable=False)  # text, number, date, select, multi_select
     options = Column(JSONB)  # For select types
@@ -34,9 +34,9 @@ class TaskCustomFieldValue(Base):
 
     __tablename__ = "task_custom_field_values"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
-    custom_field_id = Column(Integer, ForeignKey("custom_fields.id", ondelete="CASCADE"), nullable=False)
+    custom_field_id = Column(Integer, ForeignKey("custom_fields.id", ondelete="CASCADE"), nullable=False, index=True)
     value = Column(Text)
 
     # Unique constraint
@@ -0,0 +1,18 @@
+"""JobWatermark model"""
+
+from sqlalchemy import Column, String, DateTime
+
+from app.database import Base
+
+
+class JobWatermark(Base):
+    """How far an incremental scheduled job has processed, e.g. app.services.deadlines"""
+
+    __tablename__ = "job_watermarks"
+
+    name = Column(String(100), primary_key=True)
+    value = Column(DateTime(timezone=True), nullable=False)  # Processed up to here
+    updated_at = Column(DateTime(timezone=True), nullable=False)  # Start of the last run
+
+    def __repr__(self):
+        return f"<JobWatermark(name={self.name}, value={self.value})>"
@@ -1,6 +1,6 @@
 """Label and TaskLabel models"""
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,7 +12,7 @@ class Label(Base):
 
     __tablename__ = "labels"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
     color = Column(String(7), nullable=False)  # HEX color code
@@ -34,12 +34,15 @@ class TaskLabel(Base):
 
     __tablename__ = "task_labels"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     label_id = Column(Integer, ForeignKey("labels.id", ondelete="CASCADE"), nullable=False)
 
     # Unique constraint
-    __table_args__ = (UniqueConstraint("task_id", "label_id", name="uix_task_label"),)
+    __table_args__ = (
+        UniqueConstraint("task_id", "label_id", name="uix_task_label"),
+        Index("ix_task_labels_label_id_task_id", "label_id", "task_id"),
+    )
 
     # Relationships
     task = relationship("Task", back_populates="labels")
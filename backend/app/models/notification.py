@@ -1,6 +1,6 @@
 """Notification model"""
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index, false
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,17 +12,54 @@ class Notification(Base):
 
     __tablename__ = "notifications"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     type = Column(String(100), nullable=False)  # task_assigned, comment, mention, etc.
     title = Column(String(255), nullable=False)
     content = Column(Text)
     link = Column(String(500))
-    is_read = Column(Boolean, default=False, index=True)
+    is_read = Column(Boolean, default=False, server_default=false(), nullable=False)
+    # Set for notifications sent at most once per user, e.g. "deadline:<task>:<due>"
+    dedupe_key = Column(String(200))
+    # Notifications collapsed into this one, see app.services.notification_retention
+    repeat_count = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Listing a user's notifications, newest first
+        Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Retention: expired read notifications, and users notified since a time
+        Index("ix_notifications_created_at_is_read", "created_at", "is_read"),
+        # Unread rows only: counting and listing them never reads read rows
+        Index(
+            "ix_notifications_user_id_unread",
+            "user_id", "created_at", "id",
+            postgresql_where=is_read.is_(False),
+            sqlite_where=is_read.is_(False),
+        ),
+        Index(
+            "uix_notifications_user_id_dedupe_key",
+            "user_id", "dedupe_key",
+            unique=True,
+            postgresql_where=dedupe_key.is_not(None),
+            sqlite_where=dedupe_key.is_not(None),
+        ),
+    )
+
     # Relationships
     user = relationship("User", back_populates="notifications")
 
     def __repr__(self):
         return f"<Notification(id={self.id}, type={self.type}, user_id={self.user_id})>"
+
+
+class NotificationCounter(Base):
+    """Unread notifications of a user, see app.services.notification_counts"""
+
+    __tablename__ = "notification_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<NotificationCounter(user_id={self.user_id}, unread_count={self.unread_count})>"
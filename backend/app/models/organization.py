@@ -1,6 +1,6 @@
 """Organization and OrganizationMember models"""
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,11 +12,11 @@ class Organization(Base):
 
     __tablename__ = "organizations"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     logo_url = Column(String(500))
-    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -33,14 +33,17 @@ class OrganizationMember(Base):
 
     __tablename__ = "organization_members"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     role = Column(String(50), nullable=False)  # owner, admin, member, viewer
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Unique constraint
-    __table_args__ = (UniqueConstraint("organization_id", "user_id", name="uix_org_user"),)
+    # Unique constraint; the index serves "organizations of a user"
+    __table_args__ = (
+        UniqueConstraint("organization_id", "user_id", name="uix_org_user"),
+        Index("ix_organization_members_user_id_organization_id", "user_id", "organization_id"),
+    )
 
     # Relationships
     organization = relationship("Organization", back_populates="members")
@@ -1,6 +1,6 @@
 """Project and ProjectMember models"""
 
-from sqlalchemy import Column, Integer, String, Text, Date, Numeric, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, Date, Numeric, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -12,7 +12,7 @@ class Project(Base):
 
     __tablename__ = "projects"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     organization_id = Column(Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     key = Column(String(10), nullable=False)  # Short project code (PROJ, DEV, etc.)
@@ -21,7 +21,7 @@ class Project(Base):
     start_date = Column(Date)
     end_date = Column(Date)
     budget = Column(Numeric(15, 2))
-    owner_id = Column(Integer, ForeignKey("users.id"))
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -46,14 +46,17 @@ class ProjectMember(Base):
 
     __tablename__ = "project_members"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     role = Column(String(50), nullable=False)  # manager, developer, viewer
     joined_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    # Unique constraint
-    __table_args__ = (UniqueConstraint("project_id", "user_id", name="uix_project_user"),)
+    # Unique constraint; the index serves "projects of a user"
+    __table_args__ = (
+        UniqueConstraint("project_id", "user_id", name="uix_project_user"),
+        Index("ix_project_members_user_id_project_id", "user_id", "project_id"),
+    )
 
     # Relationships
     project = relationship("Project", back_populates="members")
@@ -61,3 +64,15 @@ class ProjectMember(Base):
 
     def __repr__(self):
         return f"<ProjectMember(project_id={self.project_id}, user_id={self.user_id}, role={self.role})>"
+
+
+class ProjectTaskCounter(Base):
+    """Last task number allocated in a project, see app.services.task_numbers"""
+
+    __tablename__ = "project_task_counters"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    last_number = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<ProjectTaskCounter(project_id={self.project_id}, last_number={self.last_number})>"
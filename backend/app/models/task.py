@@ -1,24 +1,30 @@
 """Task and related models"""
 
-from sqlalchemy import Column, Integer, String, Text, Numeric, DateTime, ForeignKey, UniqueConstraint
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, Text, Numeric, DateTime, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Task(Base):
     """Task model"""
 
     __tablename__ = "tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
-    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False, index=True)
-    column_id = Column(Integer, ForeignKey("columns.id", ondelete="SET NULL"), index=True)
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    board_id = Column(Integer, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    column_id = Column(Integer, ForeignKey("columns.id", ondelete="SET NULL"))
     title = Column(String(500), nullable=False)
     description = Column(Text)
-    task_number = Column(Integer, nullable=False)  # Auto-increment per project (PROJ-1, PROJ-2)
+    task_number = Column(Integer, nullable=False)  # Per project (PROJ-1, PROJ-2), see app.services.task_numbers
     priority = Column(String(50), default="medium")  # low, medium, high, critical
     status = Column(String(50), default="new")  # new, active, on_hold, done
     type = Column(String(50), default="task")  # task, bug, feature, epic
@@ -28,11 +34,37 @@ class Task(Base):
     start_date = Column(DateTime(timezone=True))
     due_date = Column(DateTime(timezone=True), index=True)
     completed_at = Column(DateTime(timezone=True))
-    position = Column(Integer, default=0)  # Position in column
+    position = Column(Integer, default=0)  # Position in column, refreshed on rebalance
+    rank = Column(String(64), nullable=False)  # Fractional sort key in column, see app.utils.rank
+    # Totals over all descendant subtasks, maintained by app.services.rollups
+    rollup_story_points = Column(Integer, nullable=False, default=0, server_default="0")
+    rollup_estimated_hours = Column(Numeric(12, 2), nullable=False, default=0, server_default="0")
+    rollup_actual_hours = Column(Numeric(12, 2), nullable=False, default=0, server_default="0")
+    rollup_done_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rollup_task_count = Column(Integer, nullable=False, default=0, server_default="0")
     creator_id = Column(Integer, ForeignKey("users.id"), index=True)
-    parent_task_id = Column(Integer, ForeignKey("tasks.id"))  # For subtasks
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    parent_task_id = Column(Integer, ForeignKey("tasks.id"), index=True)  # For subtasks
+    # Set here rather than by the database: SQLite's CURRENT_TIMESTAMP has
+    # no fractional seconds, and such values do not compare equal to the
+    # same instant bound as a parameter (listing cursors)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now(), onupdate=_utcnow)
+
+    # Board rendering reads tasks per board and column in rank order; moves
+    # look up the neighbours of a rank within one column. The project
+    # listing is keyset-paginated over (sort key, id), optionally after an
+    # equality filter, see app.services.task_listing.
+    __table_args__ = (
+        Index("ix_tasks_board_id_column_id_rank", "board_id", "column_id", "rank"),
+        Index("ix_tasks_column_id_rank", "column_id", "rank"),
+        Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_id_updated_at_id", "project_id", "updated_at", "id"),
+        Index("ix_tasks_project_id_due_date_id", "project_id", "due_date", "id"),
+        Index("ix_tasks_project_id_status_created_at_id", "project_id", "status", "created_at", "id"),
+        Index("ix_tasks_project_id_priority_created_at_id", "project_id", "priority", "created_at", "id"),
+        Index("ix_tasks_project_id_type_created_at_id", "project_id", "type", "created_at", "id"),
+        UniqueConstraint("project_id", "task_number", name="uix_project_task_number"),
+    )
 
     # Relationships
     project = relationship("Project", back_populates="tasks")
@@ -79,13 +111,16 @@ class TaskAssignee(Base):
 
     __tablename__ = "task_assignees"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     assigned_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Unique constraint
-    __table_args__ = (UniqueConstraint("task_id", "user_id", name="uix_task_user"),)
+    __table_args__ = (
+        UniqueConstraint("task_id", "user_id", name="uix_task_user"),
+        Index("ix_task_assignees_user_id_task_id", "user_id", "task_id"),
+    )
 
     # Relationships
     task = relationship("Task", back_populates="assignees")
@@ -100,9 +135,9 @@ class TaskDependency(Base):
 
     __tablename__ = "task_dependencies"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
-    depends_on_task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    depends_on_task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
     dependency_type = Column(String(50), default="finish_to_start")
     # finish_to_start, start_to_start, finish_to_finish, start_to_finish
     created_at = Column(DateTime(timezone=True), server_default=func.now())
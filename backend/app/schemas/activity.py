@@ -0,0 +1,33 @@
+"""Activity feed schemas"""
+
+from pydantic import BaseModel
+from typing import Any, List, Optional
+from datetime import datetime
+
+
+class ActivityUser(BaseModel):
+    """User shown next to an activity entry"""
+    id: int
+    username: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+
+class ActivityEntry(BaseModel):
+    """Activity log entry"""
+    id: int
+    action: str
+    entity_type: str
+    entity_id: int
+    project_id: Optional[int] = None
+    task_id: Optional[int] = None
+    changes: Optional[Any] = None
+    created_at: datetime
+    user: Optional[ActivityUser] = None
+
+
+class ActivityPage(BaseModel):
+    """Page of an activity feed, newest first"""
+    items: List[ActivityEntry]
+    next_cursor: Optional[str] = None
@@ -2,6 +2,8 @@ from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from app.schemas.label import Label
+
 
 # Board schemas
 class BoardBase(BaseModel):
@@ -50,6 +52,8 @@ class ColumnUpdate(BaseModel):
 class Column(ColumnBase):
     id: int
     board_id: int
+    rank: str
+    task_count: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -60,3 +64,36 @@ class Column(ColumnBase):
 # Board with columns
 class BoardWithColumns(Board):
     columns: list[Column] = []
+
+
+# Board snapshot: the whole board in one normalized payload
+class SnapshotTask(BaseModel):
+    id: int
+    column_id: Optional[int] = None
+    task_number: int
+    title: str
+    priority: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+    position: Optional[int] = None
+    rank: str
+    story_points: Optional[int] = None
+    due_date: Optional[datetime] = None
+    parent_task_id: Optional[int] = None
+    assignee_ids: list[int] = []
+    label_ids: list[int] = []
+
+
+class SnapshotUser(BaseModel):
+    id: int
+    username: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+
+class BoardSnapshot(Board):
+    columns: list[Column] = []
+    tasks: list[SnapshotTask] = []
+    users: list[SnapshotUser] = []
+    labels: list[Label] = []
@@ -1,7 +1,7 @@
 """Notification schemas"""
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 from app.utils.constants import NotificationType
@@ -25,6 +25,23 @@ class Notification(NotificationBase):
     id: int
     user_id: int
     is_read: bool
+    repeat_count: int = 1  # Repeated notifications collapsed into this one
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class NotificationPage(BaseModel):
+    """Page of notifications, newest first"""
+    items: List[Notification]
+    next_cursor: Optional[str] = None
+
+
+class UnreadCount(BaseModel):
+    """Unread notifications of the current user"""
+    unread_count: int
+
+
+class NotificationsMarkedRead(UnreadCount):
+    """Result of marking notifications read"""
+    updated: int
@@ -1,6 +1,6 @@
 """Task schemas"""
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 from typing import Optional, List
 from datetime import datetime
 from decimal import Decimal
@@ -40,18 +40,54 @@ class TaskUpdate(BaseModel):
     type: Optional[TaskType] = None
     story_points: Optional[int] = None
     estimated_hours: Optional[Decimal] = None
+    actual_hours: Optional[Decimal] = None
     start_date: Optional[datetime] = None
     due_date: Optional[datetime] = None
-    column_id: Optional[int] = None
-    position: Optional[int] = None
+    parent_task_id: Optional[int] = None  # null detaches from the parent; moves use PUT /{id}/move
 
 
 class TaskMove(BaseModel):
-    """Schema for moving a task"""
+    """
+    Schema for moving a task.
+
+    Give either the target index in the column or an exact rank (e.g.
+    computed client-side between the neighbours' ranks).
+    """
+    column_id: int
+    position: Optional[int] = Field(None, ge=0)
+    rank: Optional[str] = Field(None, max_length=64, pattern="^[0-9a-z]*[1-9a-z]$")
+
+    @model_validator(mode="after")
+    def check_target(self) -> "TaskMove":
+        if (self.position is None) == (self.rank is None):
+            raise ValueError("Exactly one of position or rank is required")
+        return self
+
+
+class TaskMoveOperation(TaskMove):
+    """Single move in a batch"""
+    task_id: int
+
+
+class TaskBatchMove(BaseModel):
+    """Schema for moving several tasks of one board at once, applied in order"""
+    operations: List[TaskMoveOperation] = Field(..., min_length=1, max_length=500)
+
+
+class TaskMoved(BaseModel):
+    """New place of a moved task"""
+    id: int
     column_id: int
+    rank: str
     position: int
 
 
+class TaskBatchMoveResult(BaseModel):
+    """Result of a batch move"""
+    board_id: int
+    tasks: List[TaskMoved]
+
+
 class TaskAssigneeCreate(BaseModel):
     """Schema for assigning a user to task"""
     user_id: int
@@ -76,8 +112,14 @@ class Task(TaskBase):
     due_date: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     position: int
+    rank: str
     creator_id: Optional[int] = None
     parent_task_id: Optional[int] = None
+    rollup_story_points: int = 0
+    rollup_estimated_hours: Decimal = Decimal(0)
+    rollup_actual_hours: Decimal = Decimal(0)
+    rollup_done_count: int = 0
+    rollup_task_count: int = 0
     created_at: datetime
     updated_at: datetime
 
@@ -89,6 +131,69 @@ class Task(TaskBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskListItem(BaseModel):
+    """Task row in a listing, related users and labels by id"""
+    id: int
+    project_id: int
+    board_id: int
+    column_id: Optional[int] = None
+    task_number: int
+    title: str
+    priority: TaskPriority
+    status: TaskStatus
+    type: TaskType
+    story_points: Optional[int] = None
+    due_date: Optional[datetime] = None
+    parent_task_id: Optional[int] = None
+    created_at: datetime
+    updated_at: datetime
+    assignee_ids: List[int] = []
+    label_ids: List[int] = []
+
+
+class TaskPage(BaseModel):
+    """Page of a task listing"""
+    items: List[TaskListItem]
+    next_cursor: Optional[str] = None
+
+
+class TaskTreeNode(BaseModel):
+    """Node of a task hierarchy; parent_task_id links it to its parent"""
+    id: int
+    parent_task_id: Optional[int] = None
+    board_id: int
+    column_id: Optional[int] = None
+    task_number: int
+    title: str
+    priority: TaskPriority
+    status: TaskStatus
+    type: TaskType
+    story_points: Optional[int] = None
+    due_date: Optional[datetime] = None
+    rollup_story_points: int
+    rollup_done_count: int
+    rollup_task_count: int
+    depth: int
+    has_children: bool
+
+
+class TaskTree(BaseModel):
+    """Flat list of hierarchy nodes, by depth"""
+    items: List[TaskTreeNode]
+    truncated: bool = False
+
+
+class TaskSearchHit(TaskListItem):
+    """Task matching a search, higher scores first"""
+    score: float
+
+
+class TaskSearchPage(BaseModel):
+    """Page of search results"""
+    items: List[TaskSearchHit]
+    next_cursor: Optional[str] = None
+
+
 class TaskWithDetails(Task):
     """Task with all related details"""
     comments_count: int = 0
@@ -0,0 +1,313 @@
+"""Project and board access resolution"""
+
+from typing import Iterable, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, event, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.board import Board, Column
+from app.models.project import Project, ProjectMember
+from app.models.task import Task
+from app.models.user import User
+from app.utils.cache import TTLCache
+
+# (user_id, project_id) -> role, or None for "not a member". Memberships
+# changed through the ORM invalidate entries; the TTL bounds staleness for
+# changes made by other workers.
+_role_cache = TTLCache(
+    max_size=settings.ACCESS_CACHE_MAX_SIZE,
+    default_ttl=settings.ACCESS_CACHE_TTL_SECONDS,
+)
+
+_MISSING = object()
+_MEMO_KEY = "access_memo"
+_PENDING_KEY = "access_invalidated"
+
+ADMIN_ROLES = ("admin", "owner")
+
+
+def _memo(db: Session) -> dict:
+    """Per-request memo, stored on the request's session"""
+    return db.info.setdefault(_MEMO_KEY, {})
+
+
+def _require_member(role: Optional[str], roles: Optional[Iterable[str]]) -> str:
+    if role is None:
+        raise HTTPException(status_code=403, detail="Access denied")
+    if roles is not None and role not in roles:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return role
+
+
+def get_project_role(db: Session, project_id: int, user: User) -> Optional[str]:
+    """
+    Get the user's role in a project.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        user: Current user
+
+    Returns:
+        Optional[str]: Role, or None if the user is not a member or the
+            project does not exist (callers answer both with the same 403,
+            so that project IDs are not disclosed)
+    """
+    role = _role_cache.get((user.id, project_id), _MISSING)
+    if role is not _MISSING:
+        return role
+
+    memo = _memo(db)
+    key = ("project_role", project_id, user.id)
+    if key not in memo:
+        row = db.execute(
+            select(Project.id, ProjectMember.role)
+            .outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Project.id, ProjectMember.user_id == user.id),
+            )
+            .where(Project.id == project_id)
+        ).first()
+        role = row.role if row is not None else None
+        memo[key] = role
+        _role_cache.set((user.id, project_id), role)
+    return memo[key]
+
+
+def require_project_access(
+    db: Session,
+    project_id: int,
+    user: User,
+    roles: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Check that the user is a member of a project.
+
+    Served from the role cache when possible, so it usually costs no query.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        user: Current user
+        roles: Roles allowed, any member if None
+
+    Returns:
+        str: The user's role in the project
+
+    Raises:
+        HTTPException: 403 if the user is not a member, or the project
+            does not exist
+    """
+    return _require_member(get_project_role(db, project_id, user), roles)
+
+
+def resolve_project(
+    db: Session,
+    project_id: int,
+    user: User,
+    roles: Optional[Iterable[str]] = None,
+) -> Project:
+    """
+    Load a project and check membership in a single query.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        user: Current user
+        roles: Roles allowed, any member if None
+
+    Returns:
+        Project: The project
+
+    Raises:
+        HTTPException: 403 if the user is not a member, or the project
+            does not exist
+    """
+    memo = _memo(db)
+    key = ("project", project_id, user.id)
+    if key not in memo:
+        row = db.execute(
+            select(Project, ProjectMember.role)
+            .outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Project.id, ProjectMember.user_id == user.id),
+            )
+            .where(Project.id == project_id)
+        ).first()
+        # A missing project is denied like a project of others
+        memo[key] = (row.Project, row.role) if row is not None else (None, None)
+        _role_cache.set((user.id, project_id), memo[key][1])
+
+    project, role = memo[key]
+    _require_member(role, roles)
+    return project
+
+
+def resolve_board(
+    db: Session,
+    board_id: int,
+    user: User,
+    roles: Optional[Iterable[str]] = None,
+) -> Board:
+    """
+    Load a board and check membership in its project in a single query.
+
+    Args:
+        db: Database session
+        board_id: Board ID
+        user: Current user
+        roles: Roles allowed, any member if None
+
+    Returns:
+        Board: The board
+
+    Raises:
+        HTTPException: If board not found or access denied
+    """
+    memo = _memo(db)
+    key = ("board", board_id, user.id)
+    if key not in memo:
+        row = db.execute(
+            select(Board, ProjectMember.role)
+            .outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Board.project_id, ProjectMember.user_id == user.id),
+            )
+            .where(Board.id == board_id)
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Board not found")
+        memo[key] = (row.Board, row.role)
+        _role_cache.set((user.id, row.Board.project_id), row.role)
+
+    board, role = memo[key]
+    _require_member(role, roles)
+    return board
+
+
+def resolve_column(
+    db: Session,
+    column_id: int,
+    user: User,
+    roles: Optional[Iterable[str]] = None,
+) -> Tuple[Column, int]:
+    """
+    Load a column and check membership in its board's project in a single query.
+
+    Args:
+        db: Database session
+        column_id: Column ID
+        user: Current user
+        roles: Roles allowed, any member if None
+
+    Returns:
+        Tuple[Column, int]: The column and its project ID
+
+    Raises:
+        HTTPException: If column not found or access denied
+    """
+    memo = _memo(db)
+    key = ("column", column_id, user.id)
+    if key not in memo:
+        row = db.execute(
+            select(Column, Board.project_id, ProjectMember.role)
+            .join(Board, Board.id == Column.board_id)
+            .outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Board.project_id, ProjectMember.user_id == user.id),
+            )
+            .where(Column.id == column_id)
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Column not found")
+        memo[key] = (row.Column, row.project_id, row.role)
+        _role_cache.set((user.id, row.project_id), row.role)
+
+    column, project_id, role = memo[key]
+    _require_member(role, roles)
+    return column, project_id
+
+
+def resolve_task(
+    db: Session,
+    task_id: int,
+    user: User,
+    roles: Optional[Iterable[str]] = None,
+) -> Task:
+    """
+    Load a task and check membership in its project in a single query.
+
+    Args:
+        db: Database session
+        task_id: Task ID
+        user: Current user
+        roles: Roles allowed, any member if None
+
+    Returns:
+        Task: The task
+
+    Raises:
+        HTTPException: If task not found or access denied
+    """
+    memo = _memo(db)
+    key = ("task", task_id, user.id)
+    if key not in memo:
+        row = db.execute(
+            select(Task, ProjectMember.role)
+            .outerjoin(
+                ProjectMember,
+                and_(ProjectMember.project_id == Task.project_id, ProjectMember.user_id == user.id),
+            )
+            .where(Task.id == task_id)
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        memo[key] = (row.Task, row.role)
+        _role_cache.set((user.id, row.Task.project_id), row.role)
+
+    task, role = memo[key]
+    _require_member(role, roles)
+    return task
+
+
+def invalidate_project(project_id: int, user_id: Optional[int] = None) -> None:
+    """
+    Drop cached roles for a project.
+
+    Args:
+        project_id: Project ID
+        user_id: Only drop this user's role if given
+    """
+    if user_id is not None:
+        _role_cache.pop((user_id, project_id))
+    else:
+        _role_cache.pop_where(lambda key: key[1] == project_id)
+
+
+def _invalidate(pairs) -> None:
+    for project_id, user_id in pairs:
+        invalidate_project(project_id, user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_membership_changes(session: Session, flush_context) -> None:
+    """Invalidate roles of memberships and projects changed in this flush"""
+    pairs = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, ProjectMember):
+            pairs.add((obj.project_id, obj.user_id))
+        elif isinstance(obj, Project) and obj in session.deleted:
+            pairs.add((obj.id, None))
+    if not pairs:
+        return
+    session.info.pop(_MEMO_KEY, None)
+    _invalidate(pairs)
+    session.info.setdefault(_PENDING_KEY, set()).update(pairs)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    """Invalidate again once the change is visible to other sessions"""
+    _invalidate(session.info.pop(_PENDING_KEY, ()))
@@ -0,0 +1,263 @@
+"""
+Activity log pipeline.
+
+Mutations record entries with log_activity. By default an entry waits in
+the session until the transaction commits (entries of rolled-back
+transactions are dropped), then joins an in-memory buffer that a
+background thread writes in multi-row INSERTs, once
+ACTIVITY_LOG_BATCH_SIZE entries are waiting or every
+ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS. Requests no longer pay for an extra
+row in their own transaction. Entries that must not be lost with the
+process (durable=True) are written in the caller's transaction instead.
+"""
+
+import logging
+import threading
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, List, Optional
+
+from sqlalchemy import event as sa_event, insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.activity_log import ActivityLog
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_activity"
+
+_table = ActivityLog.__table__
+
+
+def jsonable(value: Any) -> Any:
+    """Value as stored in ActivityLog.changes"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class ActivityLogWriter:
+    """
+    Buffers activity entries and writes them in batches from a thread.
+
+    The buffer is bounded by ``max_buffer``: a caller that fills it
+    flushes inline, so a slow database pushes back on writers instead of
+    growing memory. Before start() (scripts, CLI) entries are written
+    right away.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, max_buffer: int):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffer: List[dict] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._peak_depth = 0
+        self._flushes = 0
+        self._written = 0
+        self._dropped = 0
+        self._failures = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def start(self) -> None:
+        """Start the flushing thread (idempotent)"""
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="activity-log-writer", daemon=True)
+            self._thread.start()
+
+    def shutdown(self) -> None:
+        """Stop the thread and write whatever is still buffered"""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def add(self, entries: Iterable[dict]) -> None:
+        """
+        Queue entries for writing. Safe to call from any thread.
+
+        Args:
+            entries: ActivityLog column values
+        """
+        with self._lock:
+            self._buffer.extend(entries)
+            depth = len(self._buffer)
+            self._peak_depth = max(self._peak_depth, depth)
+        if self._thread is None or depth >= self.max_buffer:
+            self.flush()
+        elif depth >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """
+        Write every buffered entry now.
+
+        Returns:
+            int: Number of entries written
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            started = time.perf_counter()
+            written = self._write(rows)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._flushes += 1
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+            return written
+
+    def stats(self) -> dict:
+        """Buffer depth, throughput and flush latency"""
+        return {
+            "buffered": len(self._buffer),
+            "peak_buffered": self._peak_depth,
+            "max_buffer": self.max_buffer,
+            "batch_size": self.batch_size,
+            "flushes": self._flushes,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failures": self._failures,
+            "last_flush_ms": round(self._last_flush_ms, 2),
+            "max_flush_ms": round(self._max_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self._flushes, 2) if self._flushes else 0.0,
+        }
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Activity log flush failed")
+
+    def _write(self, rows: List[dict]) -> int:
+        written = 0
+        db = SessionLocal()
+        try:
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                try:
+                    db.execute(insert(_table), chunk)
+                    db.commit()
+                    written += len(chunk)
+                except IntegrityError:
+                    # A row referencing something deleted meanwhile must not
+                    # take the rest of the batch with it
+                    db.rollback()
+                    written += self._write_rows(db, chunk)
+                except SQLAlchemyError:
+                    db.rollback()
+                    self._failures += 1
+                    self._requeue(rows[start:])
+                    logger.exception("Activity log write failed, %d entries requeued", len(rows) - start)
+                    break
+        finally:
+            db.close()
+        self._written += written
+        return written
+
+    def _write_rows(self, db: Session, rows: List[dict]) -> int:
+        written = 0
+        for row in rows:
+            try:
+                db.execute(insert(_table), [row])
+                db.commit()
+                written += 1
+            except IntegrityError:
+                db.rollback()
+                self._dropped += 1
+                logger.warning("Dropped activity entry %s %s %s", row["action"], row["entity_type"], row["entity_id"])
+        return written
+
+    def _requeue(self, rows: List[dict]) -> None:
+        """Put unwritten rows back in front, within the buffer bound"""
+        with self._lock:
+            room = max(self.max_buffer - len(self._buffer), 0)
+            self._dropped += max(len(rows) - room, 0)
+            self._buffer[:0] = rows[:room]
+
+
+activity_writer = ActivityLogWriter(
+    batch_size=settings.ACTIVITY_LOG_BATCH_SIZE,
+    flush_interval=settings.ACTIVITY_LOG_FLUSH_INTERVAL_SECONDS,
+    max_buffer=settings.ACTIVITY_LOG_MAX_BUFFER,
+)
+
+
+def log_activity(
+    db: Session,
+    *,
+    action: str,
+    entity_type: str,
+    entity_id: int,
+    user_id: Optional[int] = None,
+    project_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    changes: Optional[dict] = None,
+    durable: bool = False,
+) -> None:
+    """
+    Record an activity entry for the session's current transaction.
+
+    Args:
+        db: Session making the change
+        action: What happened, e.g. "created", "moved"
+        entity_type: Kind of the changed entity, e.g. "task"
+        entity_id: ID of the changed entity
+        user_id: User who made the change
+        project_id: Project of the entity
+        task_id: Task the entry belongs to; must still exist when the
+            entry is written, so leave it out when deleting the task
+        changes: JSON-compatible details, e.g. {"status": [old, new]}
+        durable: Write the entry in the caller's transaction instead of
+            buffering it
+    """
+    entry = {
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "user_id": user_id,
+        "project_id": project_id,
+        "task_id": task_id,
+        "changes": changes,
+        # The buffered row is written later; keep the time of the change
+        "created_at": datetime.now(timezone.utc),
+    }
+    if durable:
+        db.add(ActivityLog(**entry))
+    else:
+        db.info.setdefault(_PENDING_KEY, []).append(entry)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _queue_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        activity_writer.add(pending)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
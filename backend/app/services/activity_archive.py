@@ -0,0 +1,242 @@
+"""
+Activity log partitions and archival.
+
+On PostgreSQL activity_log is range-partitioned by month on created_at
+(migration c58d20a7e913). The maintenance job creates the partitions of
+the coming months ahead of time and archives every month older than
+ACTIVITY_LOG_RETENTION_MONTHS: its rows are written to
+``activity_log-YYYY-MM.ndjson.gz`` in ACTIVITY_LOG_ARCHIVE_DIR, then its
+partition is detached and dropped, which frees the space at once instead
+of leaving dead rows for vacuum. On SQLite, which has no partitions,
+archived months are deleted instead.
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import tempfile
+from datetime import date, datetime, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, engine
+from app.models.activity_log import ActivityLog
+from app.services.activity import jsonable
+
+logger = logging.getLogger(__name__)
+
+_table = ActivityLog.__table__
+
+_PARTITION_NAME = re.compile(r"^activity_log_y(\d{4})m(\d{2})$")
+
+# pg_try_advisory_lock key, so only one worker maintains the table at a time
+_LOCK_KEY = 0x61637476  # "actv"
+
+_EXPORT_CHUNK = 5000
+
+
+def add_months(month: date, count: int) -> date:
+    """First day of the month ``count`` months after ``month``"""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"activity_log_y{month.year}m{month.month:02d}"
+
+
+def archive_path(month: date) -> str:
+    """
+    Path for a new archive of a month.
+
+    Existing archives are never overwritten: a month archived again (rows
+    that arrived late, or a run interrupted before its delete committed,
+    whose entries then appear twice) gets a numbered file next to it.
+    """
+    base = os.path.join(settings.ACTIVITY_LOG_ARCHIVE_DIR, f"activity_log-{month.year}-{month.month:02d}")
+    path, number = f"{base}.ndjson.gz", 1
+    while os.path.exists(path):
+        path, number = f"{base}.{number}.ndjson.gz", number + 1
+    return path
+
+
+def _month_bounds(month: date):
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    following = add_months(month, 1)
+    return start, datetime(following.year, following.month, 1, tzinfo=timezone.utc)
+
+
+def _partitions(db: Session) -> List[date]:
+    """Months that have a partition"""
+    names = db.scalars(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = 'activity_log'"
+    ))
+    months = []
+    for name in names:
+        match = _PARTITION_NAME.match(name)
+        if match:
+            months.append(date(int(match.group(1)), int(match.group(2)), 1))
+    return sorted(months)
+
+
+def ensure_partitions(db: Session, months_ahead: int) -> List[str]:
+    """
+    Create the partitions of the current month and the next ones.
+
+    A month whose rows are already in the default partition cannot get
+    its own partition; it is logged and left in the default partition.
+
+    Args:
+        db: Session on PostgreSQL
+        months_ahead: Months after the current one to create
+
+    Returns:
+        List[str]: Names of the created partitions
+    """
+    existing = set(_partitions(db))
+    current = month_start(datetime.now(timezone.utc).date())
+    created = []
+    for count in range(months_ahead + 1):
+        month = add_months(current, count)
+        if month in existing:
+            continue
+        start, end = _month_bounds(month)
+        try:
+            with db.begin_nested():
+                db.execute(text(
+                    f"CREATE TABLE {partition_name(month)} PARTITION OF activity_log "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                ))
+            created.append(partition_name(month))
+        except Exception:
+            logger.exception("Could not create activity log partition %s", partition_name(month))
+    db.commit()
+    return created
+
+
+def _write_archive(db: Session, month: date) -> Tuple[int, str]:
+    """
+    Write a month's rows to its archive file.
+
+    The file is written under a temporary name and renamed once complete,
+    so a file with the final name is always whole.
+
+    Returns:
+        tuple: Number of entries, path of the file
+    """
+    start, end = _month_bounds(month)
+    os.makedirs(settings.ACTIVITY_LOG_ARCHIVE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=settings.ACTIVITY_LOG_ARCHIVE_DIR, suffix=".tmp")
+    count = 0
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as out:
+            rows = db.execute(
+                select(_table)
+                .where(_table.c.created_at >= start, _table.c.created_at < end)
+                .order_by(_table.c.id)
+                .execution_options(yield_per=_EXPORT_CHUNK)
+            )
+            for row in rows.mappings():
+                out.write(json.dumps({key: jsonable(value) for key, value in row.items()}) + "\n")
+                count += 1
+            out.close()
+            raw.flush()
+            os.fsync(raw.fileno())
+        path = archive_path(month)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count, path
+
+
+def archive_month(db: Session, month: date) -> int:
+    """
+    Archive one month of activity and remove it from the database.
+
+    Args:
+        db: Database session
+        month: First day of the month
+
+    Returns:
+        int: Number of archived entries
+    """
+    count, path = _write_archive(db, month)
+    start, end = _month_bounds(month)
+    if db.get_bind().dialect.name == "postgresql" and month in _partitions(db):
+        name = partition_name(month)
+        db.execute(text(f"ALTER TABLE activity_log DETACH PARTITION {name}"))
+        db.execute(text(f"DROP TABLE {name}"))
+    # Rows of the month left in the default partition (or in the table on SQLite)
+    db.execute(delete(_table).where(_table.c.created_at >= start, _table.c.created_at < end))
+    db.commit()
+    logger.info("Archived %d activity entries of %s to %s", count, month.strftime("%Y-%m"), path)
+    return count
+
+
+def _archive_before(db: Session, cutoff: date) -> int:
+    """Archive every month before cutoff that still has a partition or rows"""
+    archived = 0
+    if db.get_bind().dialect.name == "postgresql":
+        for month in _partitions(db):
+            if month < cutoff:
+                archived += archive_month(db, month)
+    # Months without a partition of their own, oldest first
+    end = _month_bounds(cutoff)[0]
+    while True:
+        oldest: Optional[datetime] = db.scalar(select(func.min(_table.c.created_at)).where(_table.c.created_at < end))
+        if oldest is None:
+            return archived
+        if oldest.tzinfo is not None:
+            oldest = oldest.astimezone(timezone.utc)
+        archived += archive_month(db, month_start(oldest.date()))
+
+
+def _maintain(cutoff: date, create_partitions: bool) -> int:
+    db = SessionLocal()
+    try:
+        if create_partitions:
+            ensure_partitions(db, settings.ACTIVITY_LOG_PARTITIONS_AHEAD)
+        return _archive_before(db, cutoff)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def maintain_activity_log() -> int:
+    """
+    Scheduled job: create upcoming partitions and archive expired months.
+
+    On PostgreSQL an advisory lock keeps other workers from running it at
+    the same time; they skip the run.
+
+    Returns:
+        int: Number of archived entries
+    """
+    cutoff = add_months(month_start(datetime.now(timezone.utc).date()), -settings.ACTIVITY_LOG_RETENTION_MONTHS)
+    if engine.dialect.name != "postgresql":
+        return _maintain(cutoff, create_partitions=False)
+
+    # The session returns its connection to the pool on every commit, so
+    # the lock is held on a connection of its own
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock:
+        if not lock.scalar(text("SELECT pg_try_advisory_lock(:key)"), {"key": _LOCK_KEY}):
+            return 0
+        try:
+            return _maintain(cutoff, create_partitions=True)
+        finally:
+            lock.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _LOCK_KEY})
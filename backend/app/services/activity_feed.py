@@ -0,0 +1,89 @@
+"""
+Activity feeds of a project or a task.
+
+Feeds are keyset-paginated newest first over (created_at, id), each a
+range scan of ix_activity_log_project_id_created_at_id or
+ix_activity_log_task_id_created_at_id. Users are loaded for the whole
+page in one query, so a page costs two statements at any depth.
+"""
+
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.activity_log import ActivityLog
+from app.models.user import User
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_after
+
+_ENTRY_COLUMNS = (
+    ActivityLog.id,
+    ActivityLog.user_id,
+    ActivityLog.action,
+    ActivityLog.entity_type,
+    ActivityLog.entity_id,
+    ActivityLog.project_id,
+    ActivityLog.task_id,
+    ActivityLog.changes,
+    ActivityLog.created_at,
+)
+
+_USER_COLUMNS = (User.id, User.username, User.first_name, User.last_name, User.avatar_url)
+
+
+def activity_feed(
+    db: Session,
+    *,
+    project_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Get a page of a project's or a task's activity, newest first.
+
+    Args:
+        db: Database session
+        project_id: Project ID, already access-checked
+        task_id: Task ID, already access-checked; takes precedence over
+            project_id
+        limit: Page size
+        cursor: next_cursor of the previous page
+
+    Returns:
+        dict: Page matching schemas.activity.ActivityPage
+
+    Raises:
+        HTTPException: If the cursor is invalid or from another feed
+    """
+    if task_id is not None:
+        scope, cursor_name = ActivityLog.task_id == task_id, "activity:task"
+    else:
+        scope, cursor_name = ActivityLog.project_id == project_id, "activity:project"
+
+    keys = (ActivityLog.created_at, ActivityLog.id)
+    query = select(*_ENTRY_COLUMNS).where(scope)
+    if cursor:
+        values = decode_cursor(cursor, cursor_name)
+        query = query.where(keyset_after(keys, values, descending=True))
+        # Row-value comparisons do not prune partitions; a plain bound does
+        query = query.where(ActivityLog.created_at <= values[0])
+    query = query.order_by(ActivityLog.created_at.desc(), ActivityLog.id.desc()).limit(limit + 1)
+
+    rows = db.execute(query).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(cursor_name, [rows[-1].created_at, rows[-1].id])
+
+    user_ids = {row.user_id for row in rows if row.user_id is not None}
+    users = {}
+    if user_ids:
+        users = {user.id: user._asdict() for user in db.execute(select(*_USER_COLUMNS).where(User.id.in_(user_ids)))}
+
+    items = []
+    for row in rows:
+        item = row._asdict()
+        item["user"] = users.get(item.pop("user_id"))
+        items.append(item)
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,118 @@
+"""In-process cache for verified access tokens and authenticated users"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models.user import User
+from app.utils.cache import TTLCache
+
+# token -> user id, kept until the token's own ``exp``
+_token_cache = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    default_ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400,
+)
+
+# user id -> detached User snapshot. Other workers cannot invalidate this
+# process, so entries are additionally capped by AUTH_CACHE_TTL_SECONDS.
+_user_cache = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE,
+    default_ttl=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+_PENDING_KEY = "auth_cache_invalidated_user_ids"
+
+
+def get_token_user_id(token: str) -> Optional[int]:
+    """
+    Get the user id of an already verified token.
+
+    Args:
+        token: Raw JWT
+
+    Returns:
+        Optional[int]: User id, or None if the token has not been verified yet
+    """
+    return _token_cache.get(token)
+
+
+def cache_token(token: str, user_id: int, exp: Optional[float]) -> None:
+    """
+    Remember a verified token until it expires.
+
+    Args:
+        token: Raw JWT
+        user_id: Value of the ``sub`` claim
+        exp: Value of the ``exp`` claim (unix timestamp)
+    """
+    if exp is None:
+        return
+    _token_cache.set(token, user_id, ttl=exp - time.time())
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    Get a detached snapshot of a user.
+
+    The snapshot is shared between requests and must not be modified;
+    attach it to a session with ``Session.merge(user, load=False)``.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Optional[User]: Detached user or None on a miss
+    """
+    return _user_cache.get(user_id)
+
+
+def cache_user(user: User) -> None:
+    """
+    Store a detached snapshot of a freshly loaded user.
+
+    Args:
+        user: User loaded in the current session
+    """
+    data = {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    snapshot = User(**data)
+    make_transient_to_detached(snapshot)
+    _user_cache.set(user.id, snapshot)
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop the cached snapshot of a user.
+
+    Args:
+        user_id: User ID
+    """
+    _user_cache.pop(user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    """Invalidate users changed or deleted through the ORM in this flush"""
+    changed = {
+        obj.id
+        for obj in list(session.dirty) + list(session.deleted)
+        if isinstance(obj, User) and obj.id is not None
+        and (obj in session.deleted or session.is_modified(obj))
+    }
+    if not changed:
+        return
+    for user_id in changed:
+        invalidate_user(user_id)
+    session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """
+    Invalidate again once the change is visible to other sessions, so a
+    concurrent request cannot re-cache the pre-commit row.
+    """
+    for user_id in session.info.pop(_PENDING_KEY, ()):
+        invalidate_user(user_id)
@@ -0,0 +1,107 @@
+"""Whole-board loading for the board snapshot endpoint"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.board import Board, Column
+from app.models.label import Label, TaskLabel
+from app.models.task import Task, TaskAssignee
+from app.models.user import User
+
+# Only what a board card needs; descriptions and the rest of the task are
+# fetched per task when it is opened
+_TASK_COLUMNS = (
+    Task.id,
+    Task.column_id,
+    Task.task_number,
+    Task.title,
+    Task.priority,
+    Task.status,
+    Task.type,
+    Task.position,
+    Task.rank,
+    Task.story_points,
+    Task.due_date,
+    Task.parent_task_id,
+)
+
+_USER_COLUMNS = (User.id, User.username, User.first_name, User.last_name, User.avatar_url)
+
+
+def load_board_snapshot(db: Session, board: Board) -> dict:
+    """
+    Load a board with its columns, tasks, assignees and labels.
+
+    Runs a fixed number of statements regardless of board size (columns,
+    tasks, assignees, task labels, users, labels). Rows are read as plain
+    tuples rather than ORM objects, and related rows are returned once and
+    referenced by id from the tasks.
+
+    Args:
+        db: Database session
+        board: Board, already access-checked
+
+    Returns:
+        dict: Payload matching schemas.board.BoardSnapshot
+    """
+    columns = db.scalars(
+        select(Column).where(Column.board_id == board.id).order_by(Column.rank, Column.id)
+    ).all()
+
+    tasks = {}
+    for row in db.execute(
+        select(*_TASK_COLUMNS)
+        .where(Task.board_id == board.id)
+        .order_by(Task.column_id, Task.rank, Task.id)
+    ):
+        task = row._asdict()
+        task["assignee_ids"] = []
+        task["label_ids"] = []
+        tasks[row.id] = task
+
+    user_ids = set()
+    for task_id, user_id in db.execute(
+        select(TaskAssignee.task_id, TaskAssignee.user_id)
+        .join(Task, Task.id == TaskAssignee.task_id)
+        .where(Task.board_id == board.id)
+        .order_by(TaskAssignee.task_id, TaskAssignee.assigned_at)
+    ):
+        tasks[task_id]["assignee_ids"].append(user_id)
+        user_ids.add(user_id)
+
+    for task_id, label_id in db.execute(
+        select(TaskLabel.task_id, TaskLabel.label_id)
+        .join(Task, Task.id == TaskLabel.task_id)
+        .where(Task.board_id == board.id)
+        .order_by(TaskLabel.task_id, TaskLabel.label_id)
+    ):
+        tasks[task_id]["label_ids"].append(label_id)
+
+    users = []
+    if user_ids:
+        users = [
+            row._asdict()
+            for row in db.execute(
+                select(*_USER_COLUMNS).where(User.id.in_(user_ids)).order_by(User.id)
+            )
+        ]
+
+    # All project labels, not just the used ones: the board's label picker
+    # needs them too
+    labels = db.scalars(
+        select(Label).where(Label.project_id == board.project_id).order_by(Label.name)
+    ).all()
+
+    return {
+        "id": board.id,
+        "project_id": board.project_id,
+        "name": board.name,
+        "description": board.description,
+        "is_default": board.is_default,
+        "created_at": board.created_at,
+        "updated_at": board.updated_at,
+        "columns": columns,
+        "tasks": list(tasks.values()),
+        "users": users,
+        "labels": labels,
+    }
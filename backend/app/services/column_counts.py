@@ -0,0 +1,89 @@
+"""Cached per-column task counts and WIP limit enforcement"""
+
+import logging
+from typing import Dict
+
+from fastapi import HTTPException
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.board import Column
+from app.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+
+def apply_task_count_deltas(db: Session, deltas: Dict[int, int], enforce_wip: bool = True) -> None:
+    """
+    Adjust the task counts of columns in the current transaction.
+
+    All columns are updated by one statement. Growing columns are only
+    updated while they stay within their WIP limit; the check runs inside
+    the UPDATE, so concurrent moves cannot overshoot the limit together.
+
+    Args:
+        db: Database session
+        deltas: Column ID -> change in task count
+        enforce_wip: Reject changes that would exceed a WIP limit
+
+    Raises:
+        HTTPException: 409 if a column would exceed its WIP limit
+    """
+    deltas = {column_id: delta for column_id, delta in deltas.items() if column_id is not None and delta}
+    if not deltas:
+        return
+
+    delta = case(deltas, value=Column.id)
+    query = update(Column).where(Column.id.in_(deltas)).values(task_count=Column.task_count + delta)
+    if enforce_wip:
+        query = query.where(
+            or_(delta <= 0, Column.wip_limit.is_(None), Column.task_count + delta <= Column.wip_limit)
+        )
+    result = db.execute(query.execution_options(synchronize_session=False))
+
+    if result.rowcount != len(deltas):
+        names = db.scalars(
+            select(Column.name).where(
+                Column.id.in_([column_id for column_id, d in deltas.items() if d > 0]),
+                Column.wip_limit.is_not(None),
+                Column.task_count + case(deltas, value=Column.id) > Column.wip_limit,
+            )
+        ).all()
+        raise HTTPException(
+            status_code=409,
+            detail=f"WIP limit reached for column {', '.join(names) or 'unknown'}",
+        )
+
+
+def reconcile_task_counts() -> int:
+    """
+    Scheduled job: recount the tasks of every column whose cached count
+    has drifted (e.g. after bulk SQL or a crash between statements).
+
+    Returns:
+        int: Number of corrected columns
+    """
+    actual = (
+        select(func.count(Task.id))
+        .where(Task.column_id == Column.id)
+        .correlate(Column)
+        .scalar_subquery()
+    )
+    db = SessionLocal()
+    try:
+        result = db.execute(
+            update(Column)
+            .where(Column.task_count != actual)
+            .values(task_count=actual)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount:
+            logger.warning("Corrected task counts of %d columns", result.rowcount)
+        return result.rowcount
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
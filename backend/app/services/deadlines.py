@@ -0,0 +1,127 @@
+"""
+Deadline-approaching notifications.
+
+A task is due soon once its due_date is less than DEADLINE_NOTICE_HOURS
+away. Instead of scanning every open task, the job keeps a watermark in
+job_watermarks: the horizon (now + threshold) its last run reached. A
+run reads, through ix_tasks_due_date, only the due dates that entered
+the threshold since, (watermark, now + threshold], plus tasks updated
+since the last run whose new due date falls in the already-scanned part
+(now, watermark]. Both are index range scans bounded by the threshold,
+not by the size of tasks. The second window reaches back a few minutes
+before the last run: a task's updated_at is stamped before its
+transaction commits, so an update that committed after a run started may
+carry an earlier time.
+
+Each notice carries a dedupe key per task and due date, so a task is
+notified once per deadline even if a run is repeated; a rescheduled task
+gets a new notice.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.job_watermark import JobWatermark
+from app.models.task import Task, TaskAssignee
+from app.services.notifications import insert_notifications, task_link
+from app.utils.constants import NotificationType, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "deadline_scan"
+
+# Tasks updated just before a run may commit after it looked
+_OVERLAP = timedelta(minutes=5)
+
+_TASK_COLUMNS = (Task.id, Task.board_id, Task.title, Task.due_date, Task.creator_id)
+
+
+def _utc(value: datetime) -> datetime:
+    """SQLite returns naive datetimes, stored as UTC"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def dedupe_key(task_id: int, due_date: datetime) -> str:
+    return f"deadline:{task_id}:{_utc(due_date).isoformat(timespec='seconds')}"
+
+
+def _notify(db: Session, tasks: List) -> int:
+    """Insert the notices of a chunk of tasks: assignees, else the creator"""
+    recipients: Dict[int, List[int]] = {task.id: [] for task in tasks}
+    for row in db.execute(
+        select(TaskAssignee.task_id, TaskAssignee.user_id).where(TaskAssignee.task_id.in_(recipients))
+    ):
+        recipients[row.task_id].append(row.user_id)
+
+    rows = []
+    for task in tasks:
+        due = _utc(task.due_date)
+        for user_id in recipients[task.id] or ([task.creator_id] if task.creator_id else []):
+            rows.append({
+                "user_id": user_id,
+                "type": NotificationType.DEADLINE_APPROACHING.value,
+                "title": f"{task.title} is due soon",
+                "content": f"Due {due:%Y-%m-%d %H:%M} UTC",
+                "link": task_link(task),
+                "dedupe_key": dedupe_key(task.id, due),
+            })
+    return len(insert_notifications(db, rows))
+
+
+def scan_deadlines() -> int:
+    """
+    Scheduled job: notify assignees of open tasks that became due soon
+    since the last run.
+
+    Runs in one transaction with the watermark row locked, so concurrent
+    runs on other workers wait instead of scanning the same window.
+
+    Returns:
+        int: Number of notifications sent
+    """
+    now = datetime.now(timezone.utc)
+    horizon = now + timedelta(hours=settings.DEADLINE_NOTICE_HOURS)
+    db = SessionLocal()
+    try:
+        watermark = db.scalars(
+            select(JobWatermark).where(JobWatermark.name == JOB_NAME).with_for_update()
+        ).first()
+        if watermark is None:
+            # First run: everything already within the threshold is new
+            watermark = JobWatermark(name=JOB_NAME, value=now, updated_at=now)
+            db.add(watermark)
+        scanned, last_run = _utc(watermark.value), _utc(watermark.updated_at)
+
+        open_task = Task.status != TaskStatus.DONE.value
+        windows = [
+            select(*_TASK_COLUMNS).where(Task.due_date > scanned, Task.due_date <= horizon, open_task),
+            select(*_TASK_COLUMNS).where(
+                Task.due_date > now,
+                Task.due_date <= scanned,
+                Task.updated_at >= last_run - _OVERLAP,
+                open_task,
+            ),
+        ]
+        sent = 0
+        for window in windows:
+            rows = db.execute(window.execution_options(yield_per=settings.DEADLINE_SCAN_CHUNK_SIZE))
+            for chunk in rows.partitions():
+                sent += _notify(db, chunk)
+
+        watermark.value = max(scanned, horizon)
+        watermark.updated_at = now
+        db.commit()
+        if sent:
+            logger.info("Sent %d deadline notifications", sent)
+        return sent
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
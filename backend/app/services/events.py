@@ -0,0 +1,126 @@
+"""In-process change events"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional, Union
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_events"
+
+
+@dataclass(frozen=True)
+class Event:
+    """A committed change, e.g. ``tasks.moved``"""
+    type: str
+    project_id: int
+    board_id: Optional[int] = None
+    data: dict = field(default_factory=dict)
+
+
+Handler = Callable[[Event], Union[None, Awaitable[None]]]
+
+
+class EventBus:
+    """
+    Publish/subscribe within one worker process.
+
+    Handlers may be plain functions or coroutine functions. Once bound to
+    the application's event loop, events published from threadpool
+    endpoints are handed over to the loop, so handlers always run there;
+    without a loop (scripts, CLI) plain handlers run inline.
+    """
+
+    def __init__(self):
+        self._handlers: List[Handler] = []
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Deliver events on this loop (None to unbind)"""
+        self._loop = loop
+
+    def subscribe(self, handler: Handler) -> Callable[[], None]:
+        """
+        Register a handler.
+
+        Args:
+            handler: Called with each published Event
+
+        Returns:
+            Callable[[], None]: Unsubscribes the handler
+        """
+        with self._lock:
+            self._handlers.append(handler)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if handler in self._handlers:
+                    self._handlers.remove(handler)
+
+        return unsubscribe
+
+    def publish(self, event: Event) -> None:
+        """
+        Deliver an event to every handler. Safe to call from any thread.
+
+        Args:
+            event: Event to publish
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._dispatch(event)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._dispatch(event)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, event)
+
+    def _dispatch(self, event: Event) -> None:
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    asyncio.ensure_future(result)
+            except Exception:
+                logger.exception("Event handler failed for %s", event.type)
+
+
+bus = EventBus()
+
+
+def publish_after_commit(db: Session, event: Event) -> None:
+    """
+    Publish an event once the session's transaction commits.
+
+    Events are dropped if the transaction rolls back, so subscribers never
+    see changes that did not happen.
+
+    Args:
+        db: Session making the change
+        event: Event to publish
+    """
+    db.info.setdefault(_PENDING_KEY, []).append(event)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    for pending in session.info.pop(_PENDING_KEY, ()):
+        bus.publish(pending)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
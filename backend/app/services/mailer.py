@@ -0,0 +1,372 @@
+"""
+Notification emails.
+
+Notifications committed by insert_notifications are handed to the
+EmailDispatcher on the event loop. It buffers them per user and, once per
+EMAIL_DIGEST_WINDOW_SECONDS, sends every user one email covering all of
+their new notifications, so a burst of thousands of notifications becomes
+one message per recipient. Messages go out over a small pool of
+persistent SMTP connections; transient failures are retried with
+exponential backoff, permanent (5xx) rejections are not.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from email.header import Header
+from email.mime.text import MIMEText
+from typing import Dict, Iterable, List, Optional, Set
+
+import aiosmtplib
+from sqlalchemy import event as sa_event, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_emails"
+
+# Users whose messages are rendered per thread hand-off
+_BUILD_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class MailItem:
+    """One notification to mention in a user's next email"""
+    user_id: int
+    title: str
+    content: Optional[str] = None
+    link: Optional[str] = None
+
+
+@dataclass
+class _Job:
+    recipient: str
+    message: bytes
+    notifications: int
+    attempts: int = 0
+
+
+def compose(user: User, items: List[MailItem]) -> MIMEText:
+    """
+    Build the email of one user: the notification itself, or a digest of
+    several.
+
+    Args:
+        user: Recipient
+        items: Notifications of the user, oldest first
+
+    Returns:
+        MIMEText: Message ready to send
+    """
+    lines = [f"Hi {user.full_name},", ""]
+    for item in items:
+        lines.append(f"- {item.title}")
+        if item.content:
+            lines.append(f"  {item.content}")
+        if item.link:
+            lines.append(f"  {settings.FRONTEND_URL}{item.link}")
+    # MIMEText (compat32) rather than EmailMessage: the default policy's
+    # header parsing made composing several times slower than sending
+    message = MIMEText("\n".join(lines) + "\n", "plain", "utf-8")
+    subject = items[0].title if len(items) == 1 else f"You have {len(items)} new notifications"
+    message["Subject"] = subject if subject.isascii() else Header(subject, "utf-8")
+    message["From"] = settings.EMAIL_FROM
+    message["To"] = user.email
+    return message
+
+
+def _build(pending: Dict[int, List[MailItem]]) -> List[_Job]:
+    """Load the recipients and render their messages (runs in a thread)"""
+    db = SessionLocal()
+    try:
+        users = db.scalars(select(User).where(User.id.in_(list(pending)), User.is_active.is_(True))).all()
+        return [
+            _Job(user.email, compose(user, pending[user.id]).as_bytes(), len(pending[user.id]))
+            for user in users
+        ]
+    finally:
+        db.close()
+
+
+def _connection_usable(exc: Exception) -> bool:
+    """The server refused the message but keeps the session open"""
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        return True
+    return isinstance(exc, aiosmtplib.SMTPResponseException) and exc.code != 421
+
+
+def _is_permanent(exc: Exception) -> bool:
+    """5xx replies mean retrying the same message cannot succeed"""
+    if isinstance(exc, aiosmtplib.SMTPRecipientsRefused):
+        return all(refused.code >= 500 for refused in exc.recipients)
+    return isinstance(exc, aiosmtplib.SMTPResponseException) and exc.code >= 500
+
+
+class EmailDispatcher:
+    """
+    Coalesces notifications into per-user digests and sends them over a
+    pool of persistent SMTP connections.
+
+    Everything runs on the event loop that called start(); submit() may be
+    called from any thread. At most ``max_pending`` notifications wait for
+    the next digest; beyond that they are dropped and counted. Before
+    start(), or with EMAIL_ENABLED off, nothing is mailed.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_size: int,
+        digest_window: float,
+        max_pending: int,
+        max_attempts: int,
+        retry_backoff: float,
+        idle_timeout: float,
+    ):
+        self.pool_size = pool_size
+        self.digest_window = digest_window
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.idle_timeout = idle_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing = False
+        self._pending: Dict[int, List[MailItem]] = defaultdict(list)
+        self._pending_count = 0
+        self._flush_now: Optional[asyncio.Event] = None
+        self._outbox: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._connections = 0
+        self._sent = 0
+        self._notifications = 0
+        self._dropped = 0
+        self._retried = 0
+        self._failed = 0
+        self._last_flush_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None
+
+    def start(self) -> None:
+        """Start the digest and sender tasks on the running loop (idempotent)"""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._closing = False
+        self._flush_now = asyncio.Event()
+        # Bounded so that digests are built no faster than they are sent
+        self._outbox = asyncio.Queue(maxsize=self.pool_size * 100)
+        self._tasks = [asyncio.create_task(self._flush_loop(), name="email-digests")]
+        self._tasks += [
+            asyncio.create_task(self._sender(), name=f"email-sender-{index}")
+            for index in range(self.pool_size)
+        ]
+
+    async def shutdown(self, timeout: float = 30.0) -> None:
+        """
+        Send the buffered digests, then close the SMTP connections.
+
+        Args:
+            timeout: Seconds to wait for queued messages; messages still
+                queued or waiting for a retry after that are dropped
+        """
+        if self._loop is None:
+            return
+        # The digest task sends what is buffered, then exits
+        self._closing = True
+        self._flush_now.set()
+        await self._tasks[0]
+        await self._flush()
+        try:
+            await asyncio.wait_for(self._outbox.join(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        dropped = self._outbox.qsize() + len(self._retries)
+        if dropped:
+            logger.warning("Dropped %d unsent emails on shutdown", dropped)
+        for task in [*self._tasks, *self._retries]:
+            task.cancel()
+        await asyncio.gather(*self._tasks, *self._retries, return_exceptions=True)
+        self._tasks, self._retries = [], set()
+        self._loop = None
+
+    def submit(self, items: Iterable[MailItem]) -> None:
+        """
+        Add notifications to their users' next digest. Safe to call from
+        any thread.
+
+        Args:
+            items: Committed notifications
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(self._add, list(items))
+
+    def stats(self) -> dict:
+        """Buffer depth, pool usage and delivery counts"""
+        return {
+            "pending_notifications": self._pending_count,
+            "pending_users": len(self._pending),
+            "max_pending": self.max_pending,
+            "queued_messages": self._outbox.qsize() if self._outbox else 0,
+            "waiting_retry": len(self._retries),
+            "connections": self._connections,
+            "pool_size": self.pool_size,
+            "sent": self._sent,
+            "notifications_mailed": self._notifications,
+            "dropped": self._dropped,
+            "retried": self._retried,
+            "failed": self._failed,
+            "last_flush_ms": round(self._last_flush_ms, 2),
+        }
+
+    def _add(self, items: List[MailItem]) -> None:
+        for item in items:
+            if self._pending_count >= self.max_pending:
+                self._dropped += 1
+                continue
+            self._pending[item.user_id].append(item)
+            self._pending_count += 1
+        if self._pending_count >= self.max_pending:
+            # Send early instead of dropping the rest of the window
+            self._flush_now.set()
+
+    async def _flush_loop(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.digest_window)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Turn the buffered notifications into one message per user and
+        queue them for sending"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, defaultdict(list)
+        self._pending_count = 0
+        started = time.perf_counter()
+        user_ids = list(pending)
+        # Chunked so that sending starts early and the IN list stays short
+        for start in range(0, len(user_ids), _BUILD_CHUNK):
+            chunk = {user_id: pending[user_id] for user_id in user_ids[start:start + _BUILD_CHUNK]}
+            try:
+                jobs = await asyncio.to_thread(_build, chunk)
+            except Exception:
+                self._dropped += sum(len(items) for items in chunk.values())
+                logger.exception("Building notification emails failed")
+                continue
+            for job in jobs:
+                await self._outbox.put(job)
+        self._last_flush_ms = (time.perf_counter() - started) * 1000
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=settings.EMAIL_HOST,
+            port=settings.EMAIL_PORT,
+            username=settings.EMAIL_USERNAME or None,
+            password=settings.EMAIL_PASSWORD or None,
+            use_tls=settings.EMAIL_USE_TLS,
+            timeout=settings.EMAIL_TIMEOUT_SECONDS,
+        )
+        await client.connect()
+        self._connections += 1
+        return client
+
+    async def _sender(self) -> None:
+        """Send queued messages over one connection, kept open while busy"""
+        client: Optional[aiosmtplib.SMTP] = None
+        try:
+            while True:
+                try:
+                    job = await asyncio.wait_for(self._outbox.get(), self.idle_timeout if client else None)
+                except asyncio.TimeoutError:
+                    # Idle: let the server go rather than have it drop us
+                    client = await self._close(client)
+                    continue
+                try:
+                    if client is None:
+                        client = await self._connect()
+                    await client.sendmail(settings.EMAIL_FROM, [job.recipient], job.message)
+                    self._sent += 1
+                    self._notifications += job.notifications
+                except (aiosmtplib.SMTPException, OSError) as exc:
+                    if not _connection_usable(exc):
+                        # The next message reconnects
+                        client = await self._close(client)
+                    self._retry(job, exc)
+                finally:
+                    self._outbox.task_done()
+        finally:
+            await self._close(client)
+
+    async def _close(self, client: Optional[aiosmtplib.SMTP]) -> None:
+        if client is not None:
+            self._connections -= 1
+            try:
+                await client.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                client.close()
+        return None
+
+    def _retry(self, job: _Job, exc: Exception) -> None:
+        job.attempts += 1
+        if _is_permanent(exc) or job.attempts >= self.max_attempts:
+            self._failed += 1
+            logger.error("Giving up on email to %s after %d attempts: %s", job.recipient, job.attempts, exc)
+            return
+        self._retried += 1
+        delay = self.retry_backoff * 2 ** (job.attempts - 1) * random.uniform(0.5, 1.5)
+        task = asyncio.create_task(self._requeue(job, delay))
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+
+    async def _requeue(self, job: _Job, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._outbox.put(job)
+
+
+email_dispatcher = EmailDispatcher(
+    pool_size=settings.EMAIL_POOL_SIZE,
+    digest_window=settings.EMAIL_DIGEST_WINDOW_SECONDS,
+    max_pending=settings.EMAIL_MAX_PENDING,
+    max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+    retry_backoff=settings.EMAIL_RETRY_BACKOFF_SECONDS,
+    idle_timeout=settings.EMAIL_IDLE_TIMEOUT_SECONDS,
+)
+
+
+def mail_after_commit(db: Session, items: Iterable[MailItem]) -> None:
+    """
+    Email notifications once the session's transaction commits.
+
+    Args:
+        db: Session inserting the notifications
+        items: Notifications to mention in the users' next digest
+    """
+    if settings.EMAIL_ENABLED:
+        db.info.setdefault(_PENDING_KEY, []).extend(items)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _submit_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        email_dispatcher.submit(pending)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,138 @@
+"""
+Cached unread-notification counts.
+
+notification_counters holds each user's number of unread notifications,
+so the unread badge is a primary key lookup instead of a count. Every
+write that creates, reads or deletes unread notifications adjusts the
+counters in the same transaction; a scheduled job corrects drift.
+"""
+
+import logging
+from typing import Dict
+
+from sqlalchemy import case, exists, func, select, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.notification import Notification, NotificationCounter
+
+logger = logging.getLogger(__name__)
+
+_counters = NotificationCounter.__table__
+
+# Matches the predicate of ix_notifications_user_id_unread
+UNREAD = Notification.is_read.is_(False)
+
+
+def _upsert(db: Session):
+    return postgresql.insert(_counters) if db.get_bind().dialect.name == "postgresql" else sqlite.insert(_counters)
+
+
+def apply_unread_deltas(db: Session, deltas: Dict[int, int]) -> None:
+    """
+    Adjust the unread counts of users in the current transaction.
+
+    Increments are one ``INSERT ... ON CONFLICT DO UPDATE`` executemany,
+    creating counters that do not exist yet; decrements are one UPDATE.
+
+    Args:
+        db: Database session
+        deltas: User ID -> change in unread notifications
+    """
+    increments = {user_id: delta for user_id, delta in deltas.items() if delta > 0}
+    decrements = {user_id: delta for user_id, delta in deltas.items() if delta < 0}
+    if increments:
+        stmt = _upsert(db)
+        db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[_counters.c.user_id],
+                set_={"unread_count": _counters.c.unread_count + stmt.excluded.unread_count},
+            ),
+            [{"user_id": user_id, "unread_count": delta} for user_id, delta in increments.items()],
+        )
+    if decrements:
+        db.execute(
+            update(_counters)
+            .where(_counters.c.user_id.in_(decrements))
+            .values(unread_count=_counters.c.unread_count + case(decrements, value=_counters.c.user_id))
+        )
+
+
+def unread_count(db: Session, user_id: int) -> int:
+    """Number of unread notifications of a user"""
+    return db.scalar(select(_counters.c.unread_count).where(_counters.c.user_id == user_id)) or 0
+
+
+def reconcile_unread_counts() -> int:
+    """
+    Scheduled job: recount the unread notifications of every user whose
+    cached count has drifted.
+
+    The drifted users are found without locks, then their counter rows
+    are locked and recounted in the same transaction, so that a write
+    committing in between is neither counted twice nor overwritten:
+    writers adjust the counters under the same row locks.
+
+    Returns:
+        int: Number of corrected counters
+    """
+    actual = (
+        select(Notification.user_id, func.count().label("unread_count"))
+        .where(UNREAD)
+        .group_by(Notification.user_id)
+        .subquery()
+    )
+    drifted = union_all(
+        # Users with unread notifications and a missing or wrong counter
+        select(actual.c.user_id)
+        .outerjoin(_counters, _counters.c.user_id == actual.c.user_id)
+        .where(func.coalesce(_counters.c.unread_count, -1) != actual.c.unread_count),
+        # Counters above zero of users without unread notifications
+        select(_counters.c.user_id)
+        .where(
+            _counters.c.unread_count != 0,
+            ~exists().where(Notification.user_id == _counters.c.user_id, UNREAD),
+        ),
+    )
+    db = SessionLocal()
+    try:
+        user_ids = sorted(set(db.scalars(drifted)))
+        if not user_ids:
+            return 0
+        # Missing counters are created so that they can be locked; on
+        # SQLite, this first write also takes the database write lock
+        db.execute(
+            _upsert(db).on_conflict_do_nothing(index_elements=[_counters.c.user_id]),
+            [{"user_id": user_id, "unread_count": 0} for user_id in user_ids],
+        )
+        cached = dict(db.execute(
+            select(_counters.c.user_id, _counters.c.unread_count)
+            .where(_counters.c.user_id.in_(user_ids))
+            .order_by(_counters.c.user_id)
+            .with_for_update()
+        ).all())
+        counts = dict(db.execute(
+            select(Notification.user_id, func.count())
+            .where(UNREAD, Notification.user_id.in_(user_ids))
+            .group_by(Notification.user_id)
+        ).all())
+        corrections = {
+            user_id: counts.get(user_id, 0)
+            for user_id in user_ids
+            if cached[user_id] != counts.get(user_id, 0)
+        }
+        if corrections:
+            db.execute(
+                update(_counters)
+                .where(_counters.c.user_id.in_(corrections))
+                .values(unread_count=case(corrections, value=_counters.c.user_id))
+            )
+            logger.warning("Corrected unread notification counts of %d users", len(corrections))
+        db.commit()
+        return len(corrections)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,202 @@
+"""
+Notification retention.
+
+Without it notifications only grow, and so do the indexes every unread
+lookup reads. A scheduled job keeps the table bounded:
+
+- read notifications older than NOTIFICATION_RETENTION_DAYS are deleted,
+  oldest first, NOTIFICATION_COMPACTION_BATCH_SIZE rows per transaction
+- repeated notifications of a user with the same type and link (say,
+  twenty updates of one task) are collapsed into the newest of them,
+  whose repeat_count records how many it stands for
+- each user keeps at most NOTIFICATION_MAX_PER_USER notifications, the
+  oldest go
+
+Only users notified since the previous run can have new repeats or be
+over the cap, so the last two steps read just those users' rows.
+Unread counters are adjusted in the same transactions.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, List, Tuple
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.job_watermark import JobWatermark
+from app.models.notification import Notification
+from app.services.notification_counts import apply_unread_deltas
+
+logger = logging.getLogger(__name__)
+
+JOB_NAME = "notification_compaction"
+
+# Notifications created just before a run may commit after it looked
+_OVERLAP = timedelta(minutes=5)
+
+# Users whose notifications are compacted per transaction
+_USER_CHUNK = 100
+
+_table = Notification.__table__
+
+_collapse = (
+    update(_table)
+    .where(_table.c.id == bindparam("_id"))
+    .values(repeat_count=bindparam("_repeat_count"), is_read=bindparam("_is_read"))
+)
+
+
+def delete_expired(db: Session, cutoff: datetime, batch_size: int) -> int:
+    """
+    Delete read notifications created before a cutoff, committing every
+    batch so no transaction holds many row locks.
+
+    Args:
+        db: Database session, committed here
+        cutoff: Read notifications older than this are deleted
+        batch_size: Rows deleted per transaction
+
+    Returns:
+        int: Number of deleted notifications
+    """
+    expired = (
+        select(_table.c.id)
+        .where(_table.c.is_read.is_(True), _table.c.created_at < cutoff)
+        .order_by(_table.c.created_at)
+        .limit(batch_size)
+        .scalar_subquery()
+    )
+    deleted = 0
+    while True:
+        count = db.execute(delete(_table).where(_table.c.id.in_(expired))).rowcount
+        db.commit()
+        deleted += count
+        if count < batch_size:
+            return deleted
+
+
+def compact_users(db: Session, user_ids: List[int], max_per_user: int) -> Tuple[int, int]:
+    """
+    Collapse repeated notifications of some users and trim them to the
+    cap, without committing.
+
+    A group of repeats (same type and link, no dedupe_key) becomes its
+    newest notification, unread if any of the group was unread.
+
+    Args:
+        db: Database session
+        user_ids: Users to compact
+        max_per_user: Notifications kept per user
+
+    Returns:
+        Tuple[int, int]: Notifications removed by collapsing, and by the cap
+    """
+    rows = db.execute(
+        select(
+            _table.c.id, _table.c.user_id, _table.c.type, _table.c.link,
+            _table.c.dedupe_key, _table.c.is_read, _table.c.repeat_count,
+        )
+        .where(_table.c.user_id.in_(user_ids))
+        .order_by(_table.c.user_id, _table.c.created_at.desc(), _table.c.id.desc())
+        .with_for_update()
+    ).all()
+
+    collapsed: Dict[int, dict] = {}
+    removed: List[int] = []
+    deltas: Counter = Counter()
+    trimmed = 0
+    for user_id, user_rows in groupby(rows, key=attrgetter("user_id")):
+        kept = []
+        groups: Dict[tuple, list] = {}
+        for row in user_rows:
+            if row.link is None or row.dedupe_key is not None:
+                kept.append(row)
+            elif (row.type, row.link) in groups:
+                groups[row.type, row.link].append(row)
+            else:
+                groups[row.type, row.link] = [row]
+                kept.append(row)
+
+        for newest, *repeats in groups.values():
+            if not repeats:
+                continue
+            unread = sum(not row.is_read for row in (newest, *repeats))
+            collapsed[newest.id] = {
+                "_id": newest.id,
+                "_repeat_count": newest.repeat_count + sum(row.repeat_count for row in repeats),
+                "_is_read": unread == 0,
+            }
+            removed.extend(row.id for row in repeats)
+            deltas[user_id] += min(unread, 1) - unread
+
+        for row in kept[max_per_user:]:
+            is_read = collapsed.pop(row.id)["_is_read"] if row.id in collapsed else row.is_read
+            if not is_read:
+                deltas[user_id] -= 1
+            removed.append(row.id)
+            trimmed += 1
+
+    if collapsed:
+        db.execute(_collapse, list(collapsed.values()))
+    for start in range(0, len(removed), 1000):
+        db.execute(delete(_table).where(_table.c.id.in_(removed[start:start + 1000])))
+    apply_unread_deltas(db, {user_id: delta for user_id, delta in deltas.items() if delta})
+    return len(removed) - trimmed, trimmed
+
+
+def compact_notifications() -> int:
+    """
+    Scheduled job: delete expired read notifications, then collapse
+    repeats and enforce the per-user cap for users notified since the
+    last run.
+
+    Returns:
+        int: Number of notifications removed
+    """
+    started = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        expired = delete_expired(
+            db,
+            started - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS),
+            settings.NOTIFICATION_COMPACTION_BATCH_SIZE,
+        )
+
+        watermark = db.get(JobWatermark, JOB_NAME)
+        if watermark is None:
+            user_ids = list(db.scalars(select(_table.c.user_id).distinct()))
+        else:
+            # Deduplicated here: with DISTINCT the planner may walk a user_id
+            # index instead of the recent range of ix_notifications_created_at_is_read
+            recent = select(_table.c.user_id).where(_table.c.created_at >= watermark.value - _OVERLAP)
+            user_ids = sorted(set(db.scalars(recent)))
+
+        collapsed = trimmed = 0
+        for start in range(0, len(user_ids), _USER_CHUNK):
+            removed = compact_users(db, user_ids[start:start + _USER_CHUNK], settings.NOTIFICATION_MAX_PER_USER)
+            db.commit()
+            collapsed += removed[0]
+            trimmed += removed[1]
+
+        if watermark is None:
+            db.add(JobWatermark(name=JOB_NAME, value=started, updated_at=started))
+        else:
+            watermark.value = watermark.updated_at = started
+        db.commit()
+        if expired or collapsed or trimmed:
+            logger.info(
+                "Notification compaction: %d expired, %d collapsed, %d over the per-user cap",
+                expired, collapsed, trimmed,
+            )
+        return expired + collapsed + trimmed
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
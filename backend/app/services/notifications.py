@@ -0,0 +1,284 @@
+"""
+Notification fan-out.
+
+A change that notifies many users (a comment on a watched task, an
+invitation to a whole team) records one Fanout with notify_after_commit.
+Once the transaction commits, a background thread resolves its
+recipients with one query and writes every notification with one
+multi-row INSERT, so the request never waits for either. Fan-outs of a
+rolled-back transaction are dropped.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from sqlalchemy import event as sa_event, select, union
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Executable
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.comment import Comment
+from app.models.notification import Notification
+from app.models.project import ProjectMember
+from app.models.task import Task, TaskAssignee
+from app.models.user import User
+from app.services.mailer import MailItem, mail_after_commit
+from app.services.notification_counts import apply_unread_deltas
+from app.utils.constants import NotificationType
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_notifications"
+
+_table = Notification.__table__
+
+
+@dataclass(frozen=True)
+class Fanout:
+    """
+    One notification sent to many users.
+
+    ``recipients`` is a select of user IDs, see task_watchers,
+    project_members and users; it is run by the worker after commit, so
+    it sees the committed state.
+    """
+    type: NotificationType
+    title: str
+    recipients: Executable
+    content: Optional[str] = None
+    link: Optional[str] = None
+    exclude_user_id: Optional[int] = None
+    # Recipients who already got a notification with this key are skipped
+    dedupe_key: Optional[str] = None
+
+
+def task_link(task) -> str:
+    """Frontend path of a task"""
+    return f"/boards/{task.board_id}?task={task.id}"
+
+
+def task_watchers(task_id: int):
+    """Select the creator, assignees and commenters of a task"""
+    return union(
+        select(Task.creator_id.label("user_id")).where(Task.id == task_id, Task.creator_id.is_not(None)),
+        select(TaskAssignee.user_id).where(TaskAssignee.task_id == task_id),
+        select(Comment.user_id).where(Comment.task_id == task_id),
+    )
+
+
+def project_members(project_id: int):
+    """Select the members of a project"""
+    return select(ProjectMember.user_id).where(ProjectMember.project_id == project_id)
+
+
+def users(user_ids: Iterable[int]):
+    """Select the given users that are still active"""
+    return select(User.id).where(User.id.in_(list(user_ids)), User.is_active.is_(True))
+
+
+def insert_notifications(db: Session, rows: List[dict]) -> List[int]:
+    """
+    Insert notifications and count them as unread, without committing.
+
+    Rows are written in multi-row INSERTs, and the unread counters of all
+    recipients are updated by one more statement. A row whose dedupe_key
+    the user already has is skipped. Inserted notifications are emailed
+    once the transaction commits.
+
+    Args:
+        db: Database session
+        rows: Notification column values; user_id, type and title are
+            required
+
+    Returns:
+        List[int]: Recipient of each inserted row
+    """
+    if not rows:
+        return []
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    created_at = datetime.now(timezone.utc)
+    rows = [
+        {
+            "user_id": row["user_id"],
+            "type": row["type"],
+            "title": row["title"][:255],
+            "content": row.get("content"),
+            "link": row.get("link"),
+            "dedupe_key": row.get("dedupe_key"),
+            "is_read": False,
+            "created_at": created_at,
+        }
+        for row in rows
+    ]
+    stmt = insert(_table).on_conflict_do_nothing(
+        index_elements=[_table.c.user_id, _table.c.dedupe_key],
+        index_where=_table.c.dedupe_key.is_not(None),
+    )
+    # executemany with RETURNING is sent as multi-row INSERTs
+    # (insertmanyvalues) from one cached compiled statement
+    inserted = db.execute(
+        stmt.returning(_table.c.user_id, _table.c.title, _table.c.content, _table.c.link), rows
+    ).all()
+    recipients = [row.user_id for row in inserted]
+    apply_unread_deltas(db, Counter(recipients))
+    mail_after_commit(db, (MailItem(**row._asdict()) for row in inserted))
+    return recipients
+
+
+def deliver(db: Session, fanout: Fanout) -> List[int]:
+    """
+    Write a fan-out's notifications: one query for the recipients, one
+    multi-row INSERT for the notifications and one for the recipients'
+    unread counters.
+
+    Args:
+        db: Database session, committed here
+        fanout: Notification and recipients
+
+    Returns:
+        List[int]: IDs of the notified users
+    """
+    recipients = sorted(set(db.scalars(fanout.recipients)) - {fanout.exclude_user_id, None})
+    notified = insert_notifications(db, [
+        {
+            "user_id": user_id,
+            "type": fanout.type.value,
+            "title": fanout.title,
+            "content": fanout.content,
+            "link": fanout.link,
+            "dedupe_key": fanout.dedupe_key,
+        }
+        for user_id in recipients
+    ])
+    db.commit()
+    return notified
+
+
+class NotificationWorker:
+    """
+    Delivers fan-outs from a queue on a background thread.
+
+    The queue holds at most ``max_queued`` fan-outs; when it is full, or
+    before start() (scripts, CLI), the caller delivers inline.
+    """
+
+    def __init__(self, max_queued: int):
+        self.max_queued = max_queued
+        self._queue: "queue.Queue[Optional[Fanout]]" = queue.Queue(maxsize=max_queued)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._peak_queued = 0
+        self._fanouts = 0
+        self._notifications = 0
+        self._inline = 0
+        self._failures = 0
+        self._last_ms = 0.0
+        self._max_ms = 0.0
+
+    def start(self) -> None:
+        """Start the delivering thread (idempotent)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="notification-fanout", daemon=True)
+            self._thread.start()
+
+    def shutdown(self) -> None:
+        """Deliver everything queued, then stop the thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, fanouts: Iterable[Fanout]) -> None:
+        """
+        Queue fan-outs for delivery. Safe to call from any thread.
+
+        Args:
+            fanouts: Fan-outs to deliver
+        """
+        for fanout in fanouts:
+            if self._thread is not None:
+                try:
+                    self._queue.put_nowait(fanout)
+                    with self._lock:
+                        self._peak_queued = max(self._peak_queued, self._queue.qsize())
+                    continue
+                except queue.Full:
+                    pass
+            with self._lock:
+                self._inline += 1
+            self._deliver(fanout)
+
+    def stats(self) -> dict:
+        """Queue depth, throughput and delivery latency"""
+        return {
+            "queued": self._queue.qsize(),
+            "peak_queued": self._peak_queued,
+            "max_queued": self.max_queued,
+            "fanouts": self._fanouts,
+            "notifications": self._notifications,
+            "delivered_inline": self._inline,
+            "failures": self._failures,
+            "last_fanout_ms": round(self._last_ms, 2),
+            "max_fanout_ms": round(self._max_ms, 2),
+        }
+
+    def _run(self) -> None:
+        while True:
+            fanout = self._queue.get()
+            if fanout is None:
+                return
+            self._deliver(fanout)
+
+    def _deliver(self, fanout: Fanout) -> None:
+        started = time.perf_counter()
+        db = SessionLocal()
+        try:
+            recipients = deliver(db, fanout)
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._failures += 1
+            logger.exception("Notification fan-out failed: %s %r", fanout.type.value, fanout.title)
+            return
+        finally:
+            db.close()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self._fanouts += 1
+            self._notifications += len(recipients)
+            self._last_ms = elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+
+
+notification_worker = NotificationWorker(max_queued=settings.NOTIFICATION_QUEUE_SIZE)
+
+
+def notify_after_commit(db: Session, fanout: Fanout) -> None:
+    """
+    Deliver a fan-out once the session's transaction commits.
+
+    Args:
+        db: Session making the change
+        fanout: Notification and recipients
+    """
+    db.info.setdefault(_PENDING_KEY, []).append(fanout)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _submit_committed(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        notification_worker.submit(pending)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
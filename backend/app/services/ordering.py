@@ -0,0 +1,172 @@
+"""Rank-based ordering of board columns and tasks"""
+
+import logging
+from typing import Optional, Tuple, Type, Union
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.board import Column
+from app.models.task import Task
+from app.utils.rank import RANK_MAX_LENGTH, rank_between, rank_sequence
+
+logger = logging.getLogger(__name__)
+
+Ordered = Union[Type[Column], Type[Task]]
+
+
+def _scope(model: Ordered, parent_id: int):
+    """The list a row is ordered in: columns per board, tasks per column"""
+    return Column.board_id == parent_id if model is Column else Task.column_id == parent_id
+
+
+def _neighbour_ranks(
+    db: Session,
+    model: Ordered,
+    parent_id: int,
+    position: int,
+    exclude_id: Optional[int],
+) -> Tuple[Optional[str], Optional[str]]:
+    """Ranks of the rows that would precede and follow ``position``"""
+    query = select(model.rank).where(_scope(model, parent_id))
+    if exclude_id is not None:
+        query = query.where(model.id != exclude_id)
+    query = query.order_by(model.rank, model.id)
+
+    if position <= 0:
+        return None, db.scalar(query.limit(1))
+
+    ranks = db.scalars(query.offset(position - 1).limit(2)).all()
+    if not ranks:
+        # Past the end: append
+        return db.scalar(query.order_by(None).order_by(model.rank.desc()).limit(1)), None
+    return ranks[0], ranks[1] if len(ranks) > 1 else None
+
+
+def rank_for_position(
+    db: Session,
+    model: Ordered,
+    parent_id: int,
+    position: int,
+    exclude_id: Optional[int] = None,
+) -> str:
+    """
+    Get the rank placing a row at an index of its list.
+
+    Only the two neighbours are read. If they have collided or the key
+    would outgrow the column, the list is rebalanced first.
+
+    Args:
+        db: Database session
+        model: Column or Task
+        parent_id: Board ID for columns, column ID for tasks
+        position: Target index; past the end appends
+        exclude_id: Row being moved, ignored when counting
+
+    Returns:
+        str: Rank for the row
+    """
+    before, after = _neighbour_ranks(db, model, parent_id, position, exclude_id)
+    try:
+        rank = rank_between(before, after)
+    except ValueError:
+        rank = None
+    if rank is None or len(rank) > RANK_MAX_LENGTH:
+        rebalance(db, model, parent_id)
+        before, after = _neighbour_ranks(db, model, parent_id, position, exclude_id)
+        rank = rank_between(before, after)
+    return rank
+
+
+def rank_at_end(db: Session, model: Ordered, parent_id: int) -> str:
+    """
+    Get the rank appending a row to its list.
+
+    Args:
+        db: Database session
+        model: Column or Task
+        parent_id: Board ID for columns, column ID for tasks
+
+    Returns:
+        str: Rank after the current last row
+    """
+    query = (
+        select(model.rank)
+        .where(_scope(model, parent_id))
+        .order_by(model.rank.desc(), model.id.desc())
+        .limit(1)
+    )
+    rank = rank_between(db.scalar(query), None)
+    if len(rank) > RANK_MAX_LENGTH:
+        rebalance(db, model, parent_id)
+        rank = rank_between(db.scalar(query), None)
+    return rank
+
+
+def rebalance(db: Session, model: Ordered, parent_id: int) -> int:
+    """
+    Respace the ranks of a list and renumber its positions.
+
+    Args:
+        db: Database session
+        model: Column or Task
+        parent_id: Board ID for columns, column ID for tasks
+
+    Returns:
+        int: Number of rows in the list
+    """
+    ids = db.scalars(
+        select(model.id).where(_scope(model, parent_id)).order_by(model.rank, model.id)
+    ).all()
+    if ids:
+        db.execute(
+            update(model),
+            [
+                {"id": row_id, "rank": rank, "position": i}
+                for i, (row_id, rank) in enumerate(zip(ids, rank_sequence(len(ids))))
+            ],
+        )
+    return len(ids)
+
+
+def _lists_to_rebalance(db: Session, model: Ordered, parent) -> list:
+    """Lists with long or duplicate ranks"""
+    return db.scalars(
+        select(parent)
+        .where(parent.is_not(None))
+        .group_by(parent)
+        .having(
+            (func.max(func.length(model.rank)) > settings.RANK_REBALANCE_LENGTH)
+            | (func.count(model.rank) != func.count(model.rank.distinct()))
+        )
+    ).all()
+
+
+def rebalance_long_ranks() -> int:
+    """
+    Scheduled job: rebalance every list whose ranks have grown long or
+    collided.
+
+    Each list is committed separately to keep lock times short.
+
+    Returns:
+        int: Number of rebalanced lists
+    """
+    db = SessionLocal()
+    try:
+        done = 0
+        for model, parent in ((Column, Column.board_id), (Task, Task.column_id)):
+            for parent_id in _lists_to_rebalance(db, model, parent):
+                rebalance(db, model, parent_id)
+                db.commit()
+                done += 1
+        if done:
+            logger.info("Rebalanced ranks of %d lists", done)
+        return done
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
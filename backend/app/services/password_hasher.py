@@ -0,0 +1,108 @@
+"""Password hashing offloaded to a dedicated process pool"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from app.config import settings
+from app.utils.security import get_password_hash, verify_password
+
+
+class HasherSaturatedError(Exception):
+    """Raised when too many hashing jobs are already queued"""
+
+
+class PasswordHasher:
+    """
+    Runs password hashing and verification in worker processes.
+
+    Hashing is CPU-bound and holds the GIL, so running it inline (or in the
+    default thread pool) stalls the event loop for every other request on
+    the worker. Jobs are bounded by ``max_pending``; once that many are in
+    flight new ones fail fast with HasherSaturatedError instead of queueing
+    without limit.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._rejected = 0
+
+    def start(self) -> None:
+        """Start the worker processes (idempotent)"""
+        if self._executor is None:
+            # spawn: forking a process that already runs an event loop and
+            # threadpool threads is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password: Plain text password
+
+        Returns:
+            str: Hashed password
+
+        Raises:
+            HasherSaturatedError: If the queue is full
+        """
+        return await self._submit(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a plain password against a hashed password.
+
+        Args:
+            plain_password: Plain text password
+            hashed_password: Hashed password from database
+
+        Returns:
+            bool: True if password matches, False otherwise
+
+        Raises:
+            HasherSaturatedError: If the queue is full
+        """
+        return await self._submit(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict:
+        """Current queue depth and rejection count"""
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "rejected": self._rejected,
+        }
+
+    async def _submit(self, fn: Callable[..., Any], *args: Any) -> Any:
+        # Only touched from the event loop thread, so no lock is needed
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise HasherSaturatedError("Password hashing queue is full")
+
+        self.start()
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+
+password_hasher = PasswordHasher(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -0,0 +1,276 @@
+"""
+WebSocket hub.
+
+Connections subscribe to board and project rooms; every committed change
+event published on app.services.events.bus is sent to the connections in
+its board's and its project's rooms. The event is serialized once and the
+fan-out never awaits a socket: each connection has a bounded queue and
+its own sender task, started only while there is something to send, so
+an idle connection costs no task beyond its endpoint and a slow one only
+delays itself.
+
+A queued event for the same entity (type and ``data["id"]``) is replaced
+by the newer one; clients treat events as invalidations and refetch. A
+connection whose queue still overflows loses its backlog and gets a
+single ``{"type": "resync"}`` to reload its rooms instead.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from fastapi import WebSocket, status
+
+from app.config import settings
+from app.services.events import Event, bus
+
+logger = logging.getLogger(__name__)
+
+Room = Tuple[str, int]  # ("board", id) or ("project", id)
+
+ROOM_KINDS = ("board", "project")
+
+_RESYNC_KEY = ("resync",)
+_RESYNC = json.dumps({"type": "resync"})
+
+# Keys of messages that are never coalesced
+_unique = itertools.count()
+
+
+def parse_room(name: str) -> Optional[Room]:
+    """
+    Parse a room name such as ``board:12``.
+
+    Args:
+        name: Room name sent by the client
+
+    Returns:
+        Optional[Room]: Room, or None if the name is not valid
+    """
+    kind, _, room_id = str(name).partition(":")
+    if kind not in ROOM_KINDS or not room_id.isdigit():
+        return None
+    return kind, int(room_id)
+
+
+class Connection:
+    """One authenticated socket, its rooms and its send queue"""
+
+    __slots__ = ("websocket", "user_id", "rooms", "_queue", "_sender", "_hub")
+
+    def __init__(self, hub: "Hub", websocket: WebSocket, user_id: int):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.rooms: Set[Room] = set()
+        # Created on demand; None while idle
+        self._queue: Optional["OrderedDict[Hashable, str]"] = None
+        self._sender: Optional[asyncio.Task] = None
+        self._hub = hub
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue) if self._queue else 0
+
+    def push(self, key: Optional[Hashable], text: str) -> None:
+        """
+        Queue a message without waiting.
+
+        Args:
+            key: Messages with equal keys replace each other in the queue,
+                None for a message that is always kept
+            text: Serialized message
+        """
+        if self._queue is None:
+            self._queue = OrderedDict()
+        queue = self._queue
+        if key is None:
+            key = next(_unique)
+        if key not in queue and len(queue) >= self._hub.max_queued:
+            self._hub.dropped += len(queue)
+            queue.clear()
+            key, text = _RESYNC_KEY, _RESYNC
+        queue[key] = text
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._drain())
+
+    def send(self, message: dict) -> None:
+        """Queue a reply to this connection only"""
+        self.push(None, json.dumps(message))
+
+    def close(self, code: int, reason: Optional[str] = None) -> None:
+        """Close the socket; the endpoint then disconnects the connection"""
+        asyncio.create_task(self._close(code, reason))
+
+    async def _close(self, code: int, reason: Optional[str]) -> None:
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            # Already closed
+            pass
+
+    async def _drain(self) -> None:
+        queue = self._queue
+        try:
+            while queue:
+                _, text = queue.popitem(last=False)
+                await asyncio.wait_for(self.websocket.send_text(text), self._hub.send_timeout)
+        except asyncio.TimeoutError:
+            self._hub.timed_out += 1
+            self.close(status.WS_1008_POLICY_VIOLATION, "Too slow")
+        except Exception:
+            # Disconnected; the endpoint cleans up
+            pass
+        finally:
+            self._queue = None
+            self._sender = None
+
+    def cancel(self) -> None:
+        if self._sender is not None:
+            self._sender.cancel()
+
+
+class Hub:
+    """
+    Rooms of the connections of this worker.
+
+    All methods run on the event loop; events published from threadpool
+    endpoints reach it through the bus.
+    """
+
+    def __init__(self, *, max_connections: int, max_rooms: int, max_queued: int, send_timeout: float):
+        self.max_connections = max_connections
+        self.max_rooms = max_rooms
+        self.max_queued = max_queued
+        self.send_timeout = send_timeout
+        self._connections: Set[Connection] = set()
+        self._rooms: Dict[Room, Set[Connection]] = {}
+        self._unsubscribe = None
+        self.events = 0
+        self.messages = 0
+        self.dropped = 0
+        self.timed_out = 0
+        self.rejected = 0
+
+    def start(self) -> None:
+        """Receive events from the bus (idempotent)"""
+        if self._unsubscribe is None:
+            self._unsubscribe = bus.subscribe(self.publish)
+
+    async def shutdown(self) -> None:
+        """Stop receiving events and close every connection"""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        connections = list(self._connections)
+        for connection in connections:
+            connection.cancel()
+        await asyncio.gather(
+            *(connection._close(status.WS_1001_GOING_AWAY, None) for connection in connections),
+            return_exceptions=True,
+        )
+
+    def connect(self, websocket: WebSocket, user_id: int) -> Optional[Connection]:
+        """
+        Register a socket.
+
+        Args:
+            websocket: Socket, not yet accepted
+            user_id: Authenticated user
+
+        Returns:
+            Optional[Connection]: The connection, or None if the worker is full
+        """
+        if len(self._connections) >= self.max_connections:
+            self.rejected += 1
+            return None
+        connection = Connection(self, websocket, user_id)
+        self._connections.add(connection)
+        return connection
+
+    def disconnect(self, connection: Connection) -> None:
+        """Forget a socket and leave its rooms"""
+        connection.cancel()
+        for room in connection.rooms:
+            members = self._rooms.get(room)
+            if members is not None:
+                members.discard(connection)
+                if not members:
+                    del self._rooms[room]
+        connection.rooms.clear()
+        self._connections.discard(connection)
+
+    def join(self, connection: Connection, room: Room) -> bool:
+        """
+        Add a connection to a room; access must already be checked.
+
+        Returns:
+            bool: False if the connection is in too many rooms
+        """
+        if room not in connection.rooms:
+            if len(connection.rooms) >= self.max_rooms:
+                return False
+            connection.rooms.add(room)
+            self._rooms.setdefault(room, set()).add(connection)
+        return True
+
+    def leave(self, connection: Connection, room: Room) -> None:
+        """Remove a connection from a room"""
+        if room in connection.rooms:
+            connection.rooms.discard(room)
+            members = self._rooms[room]
+            members.discard(connection)
+            if not members:
+                del self._rooms[room]
+
+    def publish(self, event: Event) -> int:
+        """
+        Queue an event for every connection in its board's or project's room.
+
+        Args:
+            event: Committed change
+
+        Returns:
+            int: Number of connections it was queued for
+        """
+        recipients = set(self._rooms.get(("project", event.project_id), ()))
+        if event.board_id is not None:
+            recipients.update(self._rooms.get(("board", event.board_id), ()))
+        self.events += 1
+        if not recipients:
+            return 0
+
+        text = json.dumps(
+            {"type": event.type, "project_id": event.project_id, "board_id": event.board_id, "data": event.data},
+            default=str,
+        )
+        entity_id = event.data.get("id")
+        key = (event.type, entity_id) if entity_id is not None else None
+        for connection in recipients:
+            connection.push(key, text)
+        self.messages += len(recipients)
+        return len(recipients)
+
+    def stats(self) -> dict:
+        """Connections, rooms and delivery counts of this worker"""
+        return {
+            "connections": len(self._connections),
+            "max_connections": self.max_connections,
+            "rooms": len(self._rooms),
+            "queued": sum(connection.queued for connection in self._connections),
+            "events": self.events,
+            "messages": self.messages,
+            "dropped": self.dropped,
+            "closed_slow": self.timed_out,
+            "rejected": self.rejected,
+        }
+
+
+hub = Hub(
+    max_connections=settings.WS_MAX_CONNECTIONS,
+    max_rooms=settings.WS_MAX_ROOMS_PER_CONNECTION,
+    max_queued=settings.WS_SEND_QUEUE_SIZE,
+    send_timeout=settings.WS_SEND_TIMEOUT_SECONDS,
+)
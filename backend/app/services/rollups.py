@@ -0,0 +1,205 @@
+"""
+Roll-up of subtask estimates and progress onto their ancestors.
+
+Every task stores totals over all of its descendants in its rollup_*
+columns. A change to one task only touches its ancestor path: callers
+compute the change of the task's contribution (its own values plus its
+rollups) and apply it to every ancestor in one statement. The
+verification job recomputes everything from scratch and corrects drift.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Dict, Optional
+
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import Session, aliased
+
+from app.database import SessionLocal
+from app.models.task import Task
+from app.utils.constants import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Roll-up name -> Task column holding it
+ROLLUP_COLUMNS = {
+    "story_points": Task.rollup_story_points,
+    "estimated_hours": Task.rollup_estimated_hours,
+    "actual_hours": Task.rollup_actual_hours,
+    "done_count": Task.rollup_done_count,
+    "task_count": Task.rollup_task_count,
+}
+
+Contribution = Dict[str, object]
+
+
+def own_contribution(
+    story_points: Optional[int],
+    estimated_hours: Optional[Decimal],
+    actual_hours: Optional[Decimal],
+    status: Optional[str],
+) -> Contribution:
+    """What a single task adds to each of its ancestors' roll-ups"""
+    return {
+        "story_points": story_points or 0,
+        "estimated_hours": Decimal(estimated_hours or 0),
+        "actual_hours": Decimal(actual_hours or 0),
+        "done_count": 1 if status == TaskStatus.DONE.value else 0,
+        "task_count": 1,
+    }
+
+
+def subtree_contribution(task: Task) -> Contribution:
+    """What a task and all its descendants add to each of its ancestors"""
+    own = own_contribution(task.story_points, task.estimated_hours, task.actual_hours, task.status)
+    return {name: own[name] + (getattr(task, column.key) or 0) for name, column in ROLLUP_COLUMNS.items()}
+
+
+def negate(contribution: Contribution) -> Contribution:
+    return {name: -value for name, value in contribution.items()}
+
+
+def difference(after: Contribution, before: Contribution) -> Contribution:
+    return {name: after[name] - before[name] for name in ROLLUP_COLUMNS}
+
+
+def ancestor_ids(task_id: int):
+    """
+    Select a task and all its ancestors.
+
+    UNION (rather than UNION ALL) stops the walk if parent links ever form
+    a cycle.
+    """
+    path = (
+        select(Task.id, Task.parent_task_id)
+        .where(Task.id == task_id)
+        .cte("ancestor_path", recursive=True)
+    )
+    path = path.union(
+        select(Task.id, Task.parent_task_id).join(path, Task.id == path.c.parent_task_id)
+    )
+    return select(path.c.id)
+
+
+def propagate(db: Session, parent_id: Optional[int], delta: Contribution) -> None:
+    """
+    Add a contribution change to a task and all its ancestors.
+
+    One UPDATE over the ancestor path; updated_at of the ancestors is left
+    alone, only their totals change.
+
+    Args:
+        db: Database session
+        parent_id: Parent of the changed task, nothing to do if None
+        delta: Change of the task's contribution
+    """
+    values = {
+        column.key: column + delta[name]
+        for name, column in ROLLUP_COLUMNS.items()
+        if delta.get(name)
+    }
+    if parent_id is None or not values:
+        return
+    db.execute(
+        update(Task)
+        .where(Task.id.in_(ancestor_ids(parent_id)))
+        .values(**values, updated_at=Task.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def is_descendant_or_self(db: Session, task_id: int, candidate_id: int) -> bool:
+    """Whether candidate_id is task_id or one of its subtasks, at any depth"""
+    return task_id in db.scalars(ancestor_ids(candidate_id)).all()
+
+
+def _expected_rollups():
+    """Subquery of roll-ups recomputed from the tree, per task with subtasks"""
+    # (ancestor, descendant) pairs; UNION ends the walk on cycles
+    pairs = (
+        select(Task.parent_task_id.label("ancestor_id"), Task.id.label("task_id"))
+        .where(Task.parent_task_id.is_not(None))
+        .cte("rollup_pairs", recursive=True)
+    )
+    parent = aliased(Task)
+    pairs = pairs.union(
+        select(parent.parent_task_id, pairs.c.task_id)
+        .join(pairs, parent.id == pairs.c.ancestor_id)
+        .where(parent.parent_task_id.is_not(None))
+    )
+    descendant = aliased(Task)
+    return (
+        select(
+            pairs.c.ancestor_id,
+            func.sum(func.coalesce(descendant.story_points, 0)).label("story_points"),
+            func.sum(func.coalesce(descendant.estimated_hours, 0)).label("estimated_hours"),
+            func.sum(func.coalesce(descendant.actual_hours, 0)).label("actual_hours"),
+            func.sum(case((descendant.status == TaskStatus.DONE.value, 1), else_=0)).label("done_count"),
+            func.count().label("task_count"),
+        )
+        .join(descendant, descendant.id == pairs.c.task_id)
+        .group_by(pairs.c.ancestor_id)
+        .subquery("expected")
+    )
+
+
+def _drifted_rows(db: Session, task_ids=None):
+    """Tasks whose stored roll-ups differ from the recomputed ones, with the latter"""
+    expected = _expected_rollups()
+    wanted = {name: func.coalesce(expected.c[name], 0) for name in ROLLUP_COLUMNS}
+    query = (
+        select(Task.id, Task.updated_at, *(value.label(name) for name, value in wanted.items()))
+        .outerjoin(expected, expected.c.ancestor_id == Task.id)
+        .where(or_(*(ROLLUP_COLUMNS[name] != value for name, value in wanted.items())))
+    )
+    if task_ids is not None:
+        query = query.where(Task.id.in_(task_ids))
+    return db.execute(query).all()
+
+
+def verify_rollups(fix: bool = True) -> int:
+    """
+    Scheduled job: recompute every roll-up from scratch and report (and
+    by default correct) tasks whose stored totals have drifted.
+
+    The drifted tasks are found without locks. To correct them, their rows
+    are locked (SELECT ... FOR UPDATE) and their roll-ups recomputed under
+    the lock before writing: propagate() adds its deltas under the same
+    row locks, so a subtask change committing in between is neither lost
+    nor counted twice. updated_at is kept, as in propagate().
+
+    Args:
+        fix: Write the recomputed totals
+
+    Returns:
+        int: Number of tasks with drifted roll-ups
+    """
+    db = SessionLocal()
+    try:
+        drifted = _drifted_rows(db)
+        if drifted:
+            logger.warning(
+                "Roll-ups drifted on %d tasks (e.g. %s)",
+                len(drifted), ", ".join(str(row.id) for row in drifted[:10]),
+            )
+        if drifted and fix:
+            task_ids = sorted(row.id for row in drifted)
+            db.execute(select(Task.id).where(Task.id.in_(task_ids)).order_by(Task.id).with_for_update())
+            # Changes committed while waiting for the locks are seen from here on
+            rows = _drifted_rows(db, task_ids)
+            if rows:
+                db.execute(update(Task), [
+                    {
+                        "id": row.id,
+                        "updated_at": row.updated_at,
+                        **{column.key: row._mapping[name] for name, column in ROLLUP_COLUMNS.items()},
+                    }
+                    for row in rows
+                ])
+            db.commit()
+        return len(drifted)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
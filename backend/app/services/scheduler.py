@@ -0,0 +1,71 @@
+"""Periodic background jobs"""
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.config import settings
+from app.services import (
+    activity_archive,
+    column_counts,
+    deadlines,
+    notification_counts,
+    notification_retention,
+    ordering,
+    rollups,
+)
+
+# Plain (sync) job functions run in the event loop's default thread pool
+scheduler = AsyncIOScheduler(timezone="UTC")
+
+
+def _every(func, seconds: int, job_id: str) -> None:
+    scheduler.add_job(
+        func,
+        "interval",
+        seconds=seconds,
+        id=job_id,
+        replace_existing=True,
+        coalesce=True,
+        max_instances=1,
+    )
+
+
+def _register_jobs() -> None:
+    """Add every periodic job; each job is idempotent and safe to run on
+    several workers at once"""
+    _every(ordering.rebalance_long_ranks, settings.RANK_REBALANCE_INTERVAL_SECONDS, "rebalance_ranks")
+    _every(
+        column_counts.reconcile_task_counts,
+        settings.TASK_COUNT_RECONCILE_INTERVAL_SECONDS,
+        "reconcile_task_counts",
+    )
+    _every(
+        notification_counts.reconcile_unread_counts,
+        settings.NOTIFICATION_COUNT_RECONCILE_INTERVAL_SECONDS,
+        "reconcile_unread_counts",
+    )
+    _every(
+        notification_retention.compact_notifications,
+        settings.NOTIFICATION_COMPACTION_INTERVAL_SECONDS,
+        "compact_notifications",
+    )
+    _every(deadlines.scan_deadlines, settings.DEADLINE_SCAN_INTERVAL_SECONDS, "scan_deadlines")
+    _every(rollups.verify_rollups, settings.ROLLUP_VERIFY_INTERVAL_SECONDS, "verify_rollups")
+    _every(
+        activity_archive.maintain_activity_log,
+        settings.ACTIVITY_LOG_MAINTENANCE_INTERVAL_SECONDS,
+        "maintain_activity_log",
+    )
+
+
+def start_scheduler() -> None:
+    """Start the scheduler unless disabled (call from the running event loop)"""
+    if not settings.SCHEDULER_ENABLED or scheduler.running:
+        return
+    _register_jobs()
+    scheduler.start()
+
+
+def shutdown_scheduler() -> None:
+    """Stop the scheduler without waiting for running jobs"""
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
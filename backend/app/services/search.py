@@ -0,0 +1,161 @@
+"""
+Ranked full-text task search.
+
+Runs on the indexes created by migration 7d2c41e9a0f6: a generated
+tsvector column with a GIN index on PostgreSQL, external-content FTS5
+tables on SQLite. The database keeps both current on every write, so
+nothing here needs reindexing. A task matches if its title, its
+description or one of its comments contains every word of the query,
+the last word as a prefix.
+"""
+
+import re
+from typing import List, Optional
+
+from sqlalchemy import Float, Integer, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.task import Task
+from app.services.task_listing import LIST_COLUMNS, load_task_relations
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_after
+
+# Words of a query used, the rest are ignored
+MAX_TERMS = 8
+
+# A match in a comment scores less than one in the task itself
+COMMENT_WEIGHT = 0.5
+
+# Each source contributes at most SEARCH_MAX_CANDIDATES matches, the most
+# recent ones, so a query matching most of a project still ranks a
+# bounded set.
+_POSTGRESQL_HITS = """
+SELECT task_id, max(score) AS score FROM (
+    (SELECT t.id AS task_id, ts_rank_cd(t.search_vector, q.query)::float8 AS score
+    FROM tasks t CROSS JOIN (SELECT to_tsquery('simple', :query) AS query) q
+    WHERE t.project_id = :project_id AND t.search_vector @@ q.query
+    ORDER BY t.id DESC LIMIT :candidates)
+    UNION ALL
+    (SELECT c.task_id, ts_rank_cd(c.search_vector, q.query)::float8 * :comment_weight
+    FROM comments c
+    JOIN tasks t ON t.id = c.task_id
+    CROSS JOIN (SELECT to_tsquery('simple', :query) AS query) q
+    WHERE t.project_id = :project_id AND c.search_vector @@ q.query
+    ORDER BY c.id DESC LIMIT :candidates)
+) matches
+GROUP BY task_id
+"""
+
+# bm25() is lower for better matches; title weighs 4x the description.
+# CROSS JOIN fixes the join order: SQLite would otherwise walk the
+# project's tasks and probe the full-text index once per task. FTS5
+# returns matches in rowid order, so the candidate limit stops the scan.
+_SQLITE_HITS = """
+SELECT task_id, max(score) AS score FROM (
+    SELECT * FROM (
+        SELECT t.id AS task_id, -bm25(tasks_fts, 4.0, 1.0) AS score
+        FROM tasks_fts CROSS JOIN tasks t ON t.id = tasks_fts.rowid
+        WHERE tasks_fts MATCH :query AND t.project_id = :project_id
+        ORDER BY tasks_fts.rowid DESC LIMIT :candidates
+    )
+    UNION ALL
+    SELECT * FROM (
+        SELECT c.task_id, -bm25(comments_fts) * :comment_weight
+        FROM comments_fts
+        CROSS JOIN comments c ON c.id = comments_fts.rowid
+        CROSS JOIN tasks t ON t.id = c.task_id
+        WHERE comments_fts MATCH :query AND t.project_id = :project_id
+        ORDER BY comments_fts.rowid DESC LIMIT :candidates
+    )
+)
+GROUP BY task_id
+"""
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Split a search query into lowercase words.
+
+    Only word characters are kept, so the terms can be embedded in
+    tsquery and FTS5 query syntax as they are.
+
+    Args:
+        query: Query as typed by the user
+
+    Returns:
+        List[str]: Up to MAX_TERMS words
+    """
+    return re.findall(r"\w+", query.lower())[:MAX_TERMS]
+
+
+def _match_query(dialect: str, terms: List[str]) -> str:
+    if dialect == "postgresql":
+        return " & ".join(terms) + ":*"
+    return " ".join(f'"{term}"' for term in terms) + "*"
+
+
+def search_tasks(
+    db: Session,
+    project_id: int,
+    query: str,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    Search a project's tasks and their comments, best matches first.
+
+    Pages are keyset-paginated over (score, id). Only the most recent
+    SEARCH_MAX_CANDIDATES matching tasks and comments are ranked. Scores
+    depend on the whole index, so pages fetched around concurrent writes
+    may overlap.
+
+    Args:
+        db: Database session
+        project_id: Project ID, already access-checked
+        query: Search words
+        limit: Page size
+        cursor: next_cursor of the previous page
+
+    Returns:
+        dict: Page matching schemas.task.TaskSearchPage
+
+    Raises:
+        HTTPException: If the cursor is invalid or from another query
+    """
+    terms = search_terms(query)
+    if not terms:
+        return {"items": [], "next_cursor": None}
+
+    dialect = db.get_bind().dialect.name
+    cursor_name = "search:" + " ".join(terms)
+    hits = (
+        text(_POSTGRESQL_HITS if dialect == "postgresql" else _SQLITE_HITS)
+        .bindparams(
+            query=_match_query(dialect, terms),
+            project_id=project_id,
+            comment_weight=COMMENT_WEIGHT,
+            candidates=settings.SEARCH_MAX_CANDIDATES,
+        )
+        .columns(task_id=Integer, score=Float)
+        .subquery("hits")
+    )
+    keys = (hits.c.score, hits.c.task_id)
+    page = select(*keys)
+    if cursor:
+        page = page.where(keyset_after(keys, decode_cursor(cursor, cursor_name), descending=True))
+    page = page.order_by(hits.c.score.desc(), hits.c.task_id.desc()).limit(limit + 1)
+
+    rows = db.execute(page).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(cursor_name, [rows[-1].score, rows[-1].task_id])
+
+    tasks = {}
+    if rows:
+        for task in db.execute(select(*LIST_COLUMNS).where(Task.id.in_([row.task_id for row in rows]))):
+            tasks[task.id] = task._asdict()
+    items = [dict(tasks[row.task_id], score=row.score) for row in rows if row.task_id in tasks]
+
+    load_task_relations(db, items)
+    return {"items": items, "next_cursor": next_cursor}
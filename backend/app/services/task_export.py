@@ -0,0 +1,217 @@
+"""
+Streaming task export to NDJSON or CSV.
+
+Tasks are read through a server-side cursor, a chunk at a time, as plain
+rows rather than ORM objects, so nothing accumulates in the identity map
+and memory stays flat whatever the project size. Assignees, labels and
+custom field values are loaded per chunk, one query each.
+
+CSV output uses the field names of app.services.task_import, so an export
+can be imported again.
+
+Usage:
+    python -m app.services.task_export --project-id 1 --format csv -o tasks.csv
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.board import Board, Column
+from app.models.custom_field import CustomField, TaskCustomFieldValue
+from app.models.label import Label, TaskLabel
+from app.models.task import Task, TaskAssignee
+from app.models.user import User
+from app.utils.constants import DataFormat
+
+_EXPORT_COLUMNS = (
+    Task.id,
+    Task.task_number,
+    Task.board_id,
+    Task.column_id,
+    Task.title,
+    Task.description,
+    Task.status,
+    Task.priority,
+    Task.type,
+    Task.story_points,
+    Task.estimated_hours,
+    Task.actual_hours,
+    Task.start_date,
+    Task.due_date,
+    Task.completed_at,
+    Task.parent_task_id,
+    Task.creator_id,
+    Task.created_at,
+    Task.updated_at,
+)
+_FIELDS = [column.key for column in _EXPORT_COLUMNS]
+
+
+def _plain(value):
+    """JSON/CSV form of a column value"""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _related(db: Session, task_ids: List[int], fields: Dict[int, str]) -> Dict[int, dict]:
+    """Assignee emails, label names and custom field values of a chunk of tasks"""
+    related = {task_id: {"assignees": [], "labels": [], "custom_fields": {}} for task_id in task_ids}
+    for task_id, email in db.execute(
+        select(TaskAssignee.task_id, User.email)
+        .join(User, User.id == TaskAssignee.user_id)
+        .where(TaskAssignee.task_id.in_(task_ids))
+        .order_by(TaskAssignee.task_id, TaskAssignee.assigned_at)
+    ):
+        related[task_id]["assignees"].append(email)
+    for task_id, name in db.execute(
+        select(TaskLabel.task_id, Label.name)
+        .join(Label, Label.id == TaskLabel.label_id)
+        .where(TaskLabel.task_id.in_(task_ids))
+        .order_by(TaskLabel.task_id, Label.name)
+    ):
+        related[task_id]["labels"].append(name)
+    if fields:
+        for task_id, field_id, value in db.execute(
+            select(TaskCustomFieldValue.task_id, TaskCustomFieldValue.custom_field_id, TaskCustomFieldValue.value)
+            .where(TaskCustomFieldValue.task_id.in_(task_ids))
+        ):
+            related[task_id]["custom_fields"][fields[field_id]] = value
+    return related
+
+
+def iter_task_chunks(
+    db: Session,
+    project_id: int,
+    board_id: Optional[int] = None,
+    chunk_size: int = settings.EXPORT_CHUNK_SIZE,
+) -> Iterator[List[dict]]:
+    """
+    Read a project's tasks in chunks, oldest first.
+
+    Args:
+        db: Database session, not used for anything else meanwhile
+        project_id: Project ID, already access-checked
+        board_id: Only tasks of this board
+        chunk_size: Rows fetched from the cursor at a time
+
+    Yields:
+        List[dict]: Task columns plus ``column`` (name), ``assignees``
+            (emails), ``labels`` (names) and ``custom_fields``
+            (name -> value)
+    """
+    columns = dict(db.execute(
+        select(Column.id, Column.name).join(Board, Board.id == Column.board_id).where(Board.project_id == project_id)
+    ).all())
+    fields = dict(db.execute(
+        select(CustomField.id, CustomField.name).where(CustomField.project_id == project_id)
+    ).all())
+
+    query = select(*_EXPORT_COLUMNS).where(Task.project_id == project_id)
+    if board_id is not None:
+        query = query.where(Task.board_id == board_id)
+    # Matches ix_tasks_project_id_created_at_id: rows stream without a sort
+    query = query.order_by(Task.created_at, Task.id).execution_options(yield_per=chunk_size)
+
+    result = db.execute(query)
+    try:
+        for rows in result.partitions():
+            related = _related(db, [row.id for row in rows], fields)
+            chunk = []
+            for row in rows:
+                task = row._asdict()
+                task["column"] = columns.get(task["column_id"])
+                task.update(related[task["id"]])
+                chunk.append(task)
+            yield chunk
+    finally:
+        result.close()
+
+
+def custom_field_names(db: Session, project_id: int) -> List[str]:
+    """Names of a project's custom fields, in creation order"""
+    return db.scalars(
+        select(CustomField.name).where(CustomField.project_id == project_id).order_by(CustomField.id)
+    ).all()
+
+
+def stream_export(
+    fmt: DataFormat,
+    project_id: int,
+    board_id: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Export tasks with their own session, one text block per chunk.
+
+    Suited to a StreamingResponse; the session is closed when the stream
+    ends or is abandoned.
+
+    Args:
+        fmt: Output format
+        project_id: Project ID, already access-checked
+        board_id: Only tasks of this board
+
+    Yields:
+        str: NDJSON lines, or CSV rows after a header row
+    """
+    db = SessionLocal()
+    try:
+        if fmt is DataFormat.NDJSON:
+            for chunk in iter_task_chunks(db, project_id, board_id):
+                yield "".join(json.dumps(task, default=_plain) + "\n" for task in chunk)
+            return
+
+        field_names = custom_field_names(db, project_id)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(_FIELDS + ["column", "assignees", "labels"] + field_names)
+        for chunk in iter_task_chunks(db, project_id, board_id):
+            for task in chunk:
+                writer.writerow(
+                    [_plain(task[field]) for field in _FIELDS]
+                    + [task["column"], ";".join(task["assignees"]), ";".join(task["labels"])]
+                    + [task["custom_fields"].get(name) for name in field_names]
+                )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI entry point, for scheduled exports"""
+    parser = argparse.ArgumentParser(description="Export a project's tasks as CSV or NDJSON")
+    parser.add_argument("--project-id", type=int, required=True)
+    parser.add_argument("--board-id", type=int)
+    parser.add_argument("--format", choices=[f.value for f in DataFormat], default=DataFormat.NDJSON.value)
+    parser.add_argument("-o", "--output", help="file to write, default stdout")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w", newline="", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for block in stream_export(DataFormat(args.format), args.project_id, args.board_id):
+            out.write(block)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
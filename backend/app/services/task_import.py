@@ -0,0 +1,416 @@
+"""
+Streaming bulk task import from CSV or NDJSON.
+
+Each record is one task. Recognised fields (CSV header names or JSON
+keys): title (required), description, status, priority, type, column
+(name or id), labels, assignees (emails or usernames of project members),
+story_points, estimated_hours, start_date, due_date (ISO 8601). In CSV,
+labels and assignees are separated by ";" or ","; in NDJSON they may also
+be arrays. Missing labels are created; everything else must exist.
+
+Usage:
+    python -m app.services.task_import --project-id 1 --board-id 2 tasks.csv
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.board import Board, Column
+from app.models.label import Label, TaskLabel
+from app.models.project import ProjectMember
+from app.models.task import Task, TaskAssignee
+from app.models.user import User
+from app.services.activity import log_activity
+from app.services.column_counts import apply_task_count_deltas
+from app.services.events import Event, bus
+from app.services.task_numbers import allocate_task_numbers
+from app.utils.bulk import bulk_insert
+from app.utils.constants import DataFormat, TaskPriority, TaskStatus, TaskType
+from app.utils.rank import rank_between, rank_sequence
+
+Record = Union[dict, Exception]
+
+NEW_LABEL_COLOR = "#6b7280"
+
+
+def iter_records(fileobj: IO[bytes], fmt: DataFormat) -> Iterator[Tuple[int, Record]]:
+    """
+    Parse an upload lazily.
+
+    Args:
+        fileobj: Binary file positioned at the start
+        fmt: File format
+
+    Yields:
+        Tuple[int, Record]: Line number and the record, or the parse error
+    """
+    stream = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    if fmt is DataFormat.CSV:
+        reader = csv.DictReader(stream)
+        try:
+            for record in reader:
+                yield reader.line_num, record
+        except csv.Error as exc:
+            yield reader.line_num, exc
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+
+
+def _split(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        items = value
+    else:
+        items = str(value).replace(",", ";").split(";")
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def _text(record: dict, key: str) -> Optional[str]:
+    value = record.get(key)
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _enum(record: dict, key: str, enum, default):
+    value = _text(record, key)
+    if value is None:
+        return default.value
+    try:
+        return enum(value.lower()).value
+    except ValueError:
+        raise ValueError(f"Invalid {key}: {value}") from None
+
+
+def _datetime(record: dict, key: str) -> Optional[datetime]:
+    value = _text(record, key)
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid {key}: {value}") from None
+
+
+class TaskImporter:
+    """
+    Imports records into one board, in batches.
+
+    Columns, labels and project members are loaded once into lookup
+    tables, so parsing a record costs no query. Every batch reserves its
+    task numbers in one statement, is written with bulk_insert (COPY on
+    PostgreSQL) and committed on its own, so memory use is bounded by the
+    batch size and earlier batches stay imported if a later one fails.
+    WIP limits are not enforced for imports.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        project_id: int,
+        board_id: int,
+        creator_id: Optional[int] = None,
+        batch_size: int = settings.IMPORT_BATCH_SIZE,
+    ):
+        self.db = db
+        self.project_id = project_id
+        self.board_id = board_id
+        self.creator_id = creator_id
+        self.batch_size = batch_size
+        self.processed = 0
+        self.imported = 0
+        self.errors = 0
+        self._load_lookups()
+
+    def _load_lookups(self) -> None:
+        db = self.db
+        columns = db.execute(
+            select(Column.id, Column.name, Column.task_count)
+            .where(Column.board_id == self.board_id)
+            .order_by(Column.rank, Column.id)
+        ).all()
+        self.columns = {column.name.strip().lower(): column.id for column in columns}
+        self.column_ids = {column.id for column in columns}
+        self.default_column_id = columns[0].id if columns else None
+        self.column_counts = {column.id: column.task_count for column in columns}
+        self.column_counts[None] = 0
+        self.last_ranks = dict(db.execute(
+            select(Task.column_id, func.max(Task.rank))
+            .where(Task.board_id == self.board_id)
+            .group_by(Task.column_id)
+        ).all())
+
+        self.labels = dict(db.execute(
+            select(func.lower(Label.name), Label.id).where(Label.project_id == self.project_id)
+        ).all())
+
+        self.users: Dict[str, int] = {}
+        for user_id, email, username in db.execute(
+            select(User.id, User.email, User.username)
+            .join(ProjectMember, ProjectMember.user_id == User.id)
+            .where(ProjectMember.project_id == self.project_id)
+        ):
+            self.users[email.lower()] = user_id
+            self.users[username.lower()] = user_id
+
+    def _column_id(self, record: dict) -> Optional[int]:
+        value = _text(record, "column")
+        if value is None:
+            return self.default_column_id
+        if value.isdigit() and int(value) in self.column_ids:
+            return int(value)
+        column_id = self.columns.get(value.lower())
+        if column_id is None:
+            raise ValueError(f"Unknown column: {value}")
+        return column_id
+
+    def _label_id(self, name: str) -> int:
+        label_id = self.labels.get(name.lower())
+        if label_id is None:
+            label_id = self.db.scalar(
+                insert(Label)
+                .values(project_id=self.project_id, name=name[:100], color=NEW_LABEL_COLOR)
+                .returning(Label.id)
+            )
+            self.labels[name.lower()] = label_id
+        return label_id
+
+    def _parse(self, record: Record) -> dict:
+        if isinstance(record, Exception):
+            raise ValueError(f"Unreadable record: {record}")
+        if not isinstance(record, dict):
+            raise ValueError("Expected an object")
+        record = {str(key).strip().lower(): value for key, value in record.items() if key is not None}
+
+        title = _text(record, "title")
+        if title is None:
+            raise ValueError("Missing title")
+        if len(title) > 500:
+            raise ValueError("Title longer than 500 characters")
+
+        assignee_ids = []
+        for name in _split(record.get("assignees")):
+            user_id = self.users.get(name.lower())
+            if user_id is None:
+                raise ValueError(f"Unknown assignee: {name}")
+            if user_id not in assignee_ids:
+                assignee_ids.append(user_id)
+
+        try:
+            story_points = int(record["story_points"]) if _text(record, "story_points") else None
+        except ValueError:
+            raise ValueError(f"Invalid story_points: {record['story_points']}") from None
+        try:
+            estimated_hours = Decimal(str(record["estimated_hours"])) if _text(record, "estimated_hours") else None
+        except InvalidOperation:
+            raise ValueError(f"Invalid estimated_hours: {record['estimated_hours']}") from None
+
+        row = {
+            "project_id": self.project_id,
+            "board_id": self.board_id,
+            "column_id": self._column_id(record),
+            "title": title,
+            "description": _text(record, "description"),
+            "priority": _enum(record, "priority", TaskPriority, TaskPriority.MEDIUM),
+            "status": _enum(record, "status", TaskStatus, TaskStatus.NEW),
+            "type": _enum(record, "type", TaskType, TaskType.TASK),
+            "story_points": story_points,
+            "estimated_hours": estimated_hours,
+            "actual_hours": Decimal(0),
+            "start_date": _datetime(record, "start_date"),
+            "due_date": _datetime(record, "due_date"),
+            "creator_id": self.creator_id,
+            "parent_task_id": None,
+        }
+        # Labels last: creating one is the only side effect of parsing
+        label_ids = []
+        for name in _split(record.get("labels")):
+            label_id = self._label_id(name)
+            if label_id not in label_ids:
+                label_ids.append(label_id)
+        return {"row": row, "assignee_ids": assignee_ids, "label_ids": label_ids}
+
+    def _write_batch(self, batch: List[dict]) -> None:
+        db = self.db
+        # Commits labels created while parsing along with the counter
+        numbers = allocate_task_numbers(db, self.project_id, len(batch))
+
+        by_column = defaultdict(list)
+        for item, number in zip(batch, numbers):
+            item["row"]["task_number"] = number
+            by_column[item["row"]["column_id"]].append(item["row"])
+
+        # Append after the column's last task: one short base key per batch,
+        # evenly spaced suffixes within it
+        for column_id, rows in by_column.items():
+            base = rank_between(self.last_ranks.get(column_id), None)
+            start = self.column_counts.get(column_id, 0)
+            for i, (row, suffix) in enumerate(zip(rows, rank_sequence(len(rows)))):
+                row["rank"] = base + suffix
+                row["position"] = start + i
+            self.last_ranks[column_id] = rows[-1]["rank"]
+
+        task_ids = bulk_insert(db, Task.__table__, [item["row"] for item in batch], return_ids=True)
+        bulk_insert(db, TaskAssignee.__table__, [
+            {"task_id": task_id, "user_id": user_id}
+            for item, task_id in zip(batch, task_ids)
+            for user_id in item["assignee_ids"]
+        ])
+        bulk_insert(db, TaskLabel.__table__, [
+            {"task_id": task_id, "label_id": label_id}
+            for item, task_id in zip(batch, task_ids)
+            for label_id in item["label_ids"]
+        ])
+        deltas = {column_id: len(rows) for column_id, rows in by_column.items()}
+        apply_task_count_deltas(db, deltas, enforce_wip=False)
+        log_activity(
+            db,
+            action="imported",
+            entity_type="board",
+            entity_id=self.board_id,
+            user_id=self.creator_id,
+            project_id=self.project_id,
+            changes={"count": len(batch), "first_task_number": numbers[0]},
+        )
+        db.commit()
+
+        for column_id, count in deltas.items():
+            self.column_counts[column_id] = self.column_counts.get(column_id, 0) + count
+        self.imported += len(batch)
+
+    def _progress(self, kind: str = "progress") -> dict:
+        return {"type": kind, "processed": self.processed, "imported": self.imported, "errors": self.errors}
+
+    def run(self, records: Iterable[Tuple[int, Record]]) -> Iterator[dict]:
+        """
+        Import records.
+
+        Args:
+            records: (line number, record) pairs, e.g. from iter_records
+
+        Yields:
+            dict: ``error`` events for rejected records, a ``progress``
+                event after each committed batch, and a final ``done``
+                (or ``failed``) event
+        """
+        batch: List[dict] = []
+        try:
+            for line, record in records:
+                self.processed += 1
+                try:
+                    batch.append(self._parse(record))
+                except ValueError as exc:
+                    self.errors += 1
+                    yield {"type": "error", "line": line, "error": str(exc)}
+                    continue
+                if len(batch) >= self.batch_size:
+                    self._write_batch(batch)
+                    batch = []
+                    yield self._progress()
+            if batch:
+                self._write_batch(batch)
+        except Exception as exc:
+            self.db.rollback()
+            yield dict(self._progress("failed"), error=str(exc))
+            return
+        finally:
+            if self.imported:
+                bus.publish(Event(
+                    type="tasks.imported",
+                    project_id=self.project_id,
+                    board_id=self.board_id,
+                    data={"count": self.imported},
+                ))
+        yield self._progress("done")
+
+
+def stream_import(
+    fileobj: IO[bytes],
+    fmt: DataFormat,
+    project_id: int,
+    board_id: int,
+    creator_id: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Run an import with its own session, as NDJSON lines.
+
+    Suited to a StreamingResponse: the session and the file are closed
+    when the stream ends.
+
+    Args:
+        fileobj: Uploaded file, closed at the end
+        fmt: File format
+        project_id: Project ID
+        board_id: Board ID, must belong to the project
+        creator_id: User recorded as the creator of the tasks
+
+    Yields:
+        str: One JSON event per line
+    """
+    db = SessionLocal()
+    try:
+        importer = TaskImporter(db, project_id, board_id, creator_id=creator_id)
+        for event in importer.run(iter_records(fileobj, fmt)):
+            yield json.dumps(event) + "\n"
+    finally:
+        db.close()
+        fileobj.close()
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI entry point, exits non-zero if any record was rejected"""
+    parser = argparse.ArgumentParser(description="Import tasks into a board from CSV or NDJSON")
+    parser.add_argument("file", help="file to import")
+    parser.add_argument("--project-id", type=int, required=True)
+    parser.add_argument("--board-id", type=int, required=True)
+    parser.add_argument("--format", choices=[f.value for f in DataFormat], help="default: from the file extension")
+    parser.add_argument("--creator-email", help="user recorded as creator")
+    args = parser.parse_args(argv)
+
+    fmt = DataFormat(args.format or ("ndjson" if args.file.endswith((".ndjson", ".jsonl")) else "csv"))
+
+    db = SessionLocal()
+    try:
+        board_project_id = db.scalar(select(Board.project_id).where(Board.id == args.board_id))
+        creator_id = None
+        if args.creator_email:
+            creator_id = db.scalar(select(User.id).where(User.email == args.creator_email))
+            if creator_id is None:
+                parser.error(f"unknown user {args.creator_email}")
+    finally:
+        db.close()
+    if board_project_id != args.project_id:
+        parser.error("board not found in project")
+
+    failed = False
+    with open(args.file, "rb") as fileobj:
+        for line in stream_import(fileobj, fmt, args.project_id, args.board_id, creator_id):
+            sys.stdout.write(line)
+            event = json.loads(line)
+            failed = failed or event["type"] in ("error", "failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
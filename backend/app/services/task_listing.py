@@ -0,0 +1,175 @@
+"""Filtered, keyset-paginated task listing"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.orm import Session
+
+from app.models.label import TaskLabel
+from app.models.task import Task, TaskAssignee
+from app.utils.constants import SortOrder, TaskPriority, TaskSortField, TaskStatus, TaskType
+from app.utils.pagination import decode_cursor, encode_cursor, keyset_after
+
+LIST_COLUMNS = (
+    Task.id,
+    Task.project_id,
+    Task.board_id,
+    Task.column_id,
+    Task.task_number,
+    Task.title,
+    Task.priority,
+    Task.status,
+    Task.type,
+    Task.story_points,
+    Task.due_date,
+    Task.parent_task_id,
+    Task.created_at,
+    Task.updated_at,
+)
+
+
+def _match(column, values: List):
+    """Equality for a single value keeps the filter usable as an index prefix"""
+    values = [getattr(v, "value", v) for v in values]
+    return column == values[0] if len(values) == 1 else column.in_(values)
+
+
+def load_task_relations(db: Session, items: List[dict]) -> None:
+    """
+    Add assignee_ids and label_ids to task rows, two queries in all.
+
+    Args:
+        db: Database session
+        items: Task rows as dicts with an "id" key, updated in place
+    """
+    by_id = {}
+    for item in items:
+        item["assignee_ids"] = []
+        item["label_ids"] = []
+        by_id[item["id"]] = item
+    if by_id:
+        for task_id, user_id in db.execute(
+            select(TaskAssignee.task_id, TaskAssignee.user_id)
+            .where(TaskAssignee.task_id.in_(by_id))
+            .order_by(TaskAssignee.task_id, TaskAssignee.assigned_at)
+        ):
+            by_id[task_id]["assignee_ids"].append(user_id)
+        for task_id, label_id in db.execute(
+            select(TaskLabel.task_id, TaskLabel.label_id)
+            .where(TaskLabel.task_id.in_(by_id))
+            .order_by(TaskLabel.task_id, TaskLabel.label_id)
+        ):
+            by_id[task_id]["label_ids"].append(label_id)
+
+
+def _page(db: Session, query, keys, after: Optional[List], descending: bool, limit: int) -> list:
+    """Rows of a query ordered by keys, starting after a cursor position"""
+    if after is not None:
+        query = query.where(keyset_after(keys, after, descending))
+    query = query.order_by(*(key.desc() if descending else key.asc() for key in keys))
+    return db.execute(query.limit(limit)).all()
+
+
+def list_tasks(
+    db: Session,
+    project_id: int,
+    *,
+    board_id: Optional[int] = None,
+    column_id: Optional[int] = None,
+    status: Optional[List[TaskStatus]] = None,
+    priority: Optional[List[TaskPriority]] = None,
+    type: Optional[List[TaskType]] = None,
+    assignee_id: Optional[int] = None,
+    label_id: Optional[int] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+    sort: TaskSortField = TaskSortField.CREATED_AT,
+    order: SortOrder = SortOrder.DESC,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> dict:
+    """
+    List a project's tasks, one page at a time.
+
+    Pages are keyset-paginated over (sort key, id); each call costs three
+    statements (tasks, assignees, labels) whatever the page depth, and one
+    more for the page where a due date sort reaches the tasks without a
+    due date, which come last in either direction.
+
+    Args:
+        db: Database session
+        project_id: Project ID, already access-checked
+        board_id: Only tasks of this board
+        column_id: Only tasks in this column
+        status: Only tasks with one of these statuses
+        priority: Only tasks with one of these priorities
+        type: Only tasks of one of these types
+        assignee_id: Only tasks assigned to this user
+        label_id: Only tasks with this label
+        due_from: Only tasks due at or after this time
+        due_to: Only tasks due before this time
+        sort: Sort key
+        order: Sort direction
+        limit: Page size
+        cursor: next_cursor of the previous page
+
+    Returns:
+        dict: Page matching schemas.task.TaskPage
+
+    Raises:
+        HTTPException: If the cursor is invalid or from another ordering
+    """
+    sort_column = getattr(Task, sort.value)
+    descending = order is SortOrder.DESC
+    cursor_name = f"{sort.value}:{order.value}"
+
+    query = select(*LIST_COLUMNS).where(Task.project_id == project_id)
+    if board_id is not None:
+        query = query.where(Task.board_id == board_id)
+    if column_id is not None:
+        query = query.where(Task.column_id == column_id)
+    if status:
+        query = query.where(_match(Task.status, status))
+    if priority:
+        query = query.where(_match(Task.priority, priority))
+    if type:
+        query = query.where(_match(Task.type, type))
+    if assignee_id is not None:
+        query = query.where(exists().where(
+            TaskAssignee.task_id == Task.id, TaskAssignee.user_id == assignee_id
+        ))
+    if label_id is not None:
+        query = query.where(exists().where(
+            TaskLabel.task_id == Task.id, TaskLabel.label_id == label_id
+        ))
+    if due_from is not None:
+        query = query.where(Task.due_date >= due_from)
+    if due_to is not None:
+        query = query.where(Task.due_date < due_to)
+
+    keys = (sort_column, Task.id)
+    after = decode_cursor(cursor, cursor_name) if cursor else None
+    if sort is TaskSortField.DUE_DATE:
+        # Tasks without a due date follow the dated ones, in id order. Each
+        # part is its own range of ix_tasks_project_id_due_date_id; a
+        # cursor with a null due date points into the second one.
+        rows = []
+        if after is None or after[:1] != [None]:
+            rows = _page(db, query.where(Task.due_date.is_not(None)), keys, after, descending, limit + 1)
+            after = None
+        else:
+            after = after[1:]
+        if len(rows) <= limit and due_from is None and due_to is None:
+            undated = query.where(Task.due_date.is_(None))
+            rows += _page(db, undated, (Task.id,), after, descending, limit + 1 - len(rows))
+    else:
+        rows = _page(db, query, keys, after, descending, limit + 1)
+    items = [row._asdict() for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(cursor_name, [last[sort.value], last["id"]])
+
+    load_task_relations(db, items)
+    return {"items": items, "next_cursor": next_cursor}
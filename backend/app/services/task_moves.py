@@ -0,0 +1,168 @@
+"""Moving tasks between and within board columns"""
+
+import bisect
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+
+from app.models.board import Column
+from app.models.task import Task
+from app.models.user import User
+from app.schemas.task import TaskMoveOperation
+from app.services import access
+from app.services.activity import log_activity
+from app.services.column_counts import apply_task_count_deltas
+from app.services.events import Event, publish_after_commit
+from app.utils.rank import RANK_MAX_LENGTH, rank_between, rank_sequence
+
+# Rows per UPDATE ... CASE statement
+_UPDATE_CHUNK = 500
+
+# (rank, task id) in display order
+ColumnList = List[Tuple[str, int]]
+
+
+def _rank_at(items: ColumnList, index: int) -> Optional[str]:
+    """Rank between the neighbours of an index, None if there is no room"""
+    before = items[index - 1][0] if index > 0 else None
+    after = items[index][0] if index < len(items) else None
+    try:
+        rank = rank_between(before, after)
+    except ValueError:
+        return None
+    return rank if len(rank) <= RANK_MAX_LENGTH else None
+
+
+def _respace(items: ColumnList, column_id: int, changed: Dict[int, Tuple[int, str]]) -> None:
+    """Evenly respace a whole column, recording every row as changed"""
+    for i, ((_, task_id), rank) in enumerate(zip(items, rank_sequence(len(items)))):
+        items[i] = (rank, task_id)
+        changed[task_id] = (column_id, rank)
+
+
+def move_tasks(db: Session, operations: Sequence[TaskMoveOperation], user: User) -> dict:
+    """
+    Move tasks of one board, applying the operations in order.
+
+    Access is checked once for the board's project. Column task counts and
+    WIP limits are updated by one statement, the target columns are read
+    in one query, new ranks are computed in memory, and all rows are
+    written with set-based ``UPDATE ... CASE`` statements. A single
+    ``tasks.moved`` event is published when the caller commits.
+
+    Args:
+        db: Database session
+        operations: Moves to apply
+        user: Current user
+
+    Returns:
+        dict: Board ID and the new place of every task whose rank changed,
+            including neighbours respaced to make room
+
+    Raises:
+        HTTPException: If a task or column is missing, the moves span
+            several boards, access is denied, or a WIP limit would be
+            exceeded (409)
+    """
+    task_ids = [op.task_id for op in operations]
+    if len(set(task_ids)) != len(task_ids):
+        raise HTTPException(status_code=400, detail="Each task can only be moved once per batch")
+
+    tasks = db.execute(
+        select(Task.id, Task.project_id, Task.board_id, Task.column_id).where(Task.id.in_(task_ids))
+    ).all()
+    if len(tasks) != len(task_ids):
+        raise HTTPException(status_code=404, detail="Task not found")
+    if len({row.board_id for row in tasks}) > 1:
+        raise HTTPException(status_code=400, detail="All tasks must belong to the same board")
+    project_id, board_id = tasks[0].project_id, tasks[0].board_id
+
+    access.require_project_access(db, project_id, user)
+
+    column_ids = {op.column_id for op in operations}
+    column_boards = dict(
+        db.execute(select(Column.id, Column.board_id).where(Column.id.in_(column_ids))).all()
+    )
+    if len(column_boards) != len(column_ids):
+        raise HTTPException(status_code=404, detail="Column not found")
+    if any(column_board != board_id for column_board in column_boards.values()):
+        raise HTTPException(status_code=400, detail="Tasks can only be moved within their board")
+
+    # Counts first: a move past a WIP limit fails before anything is written
+    deltas: Dict[int, int] = {}
+    for row in tasks:
+        deltas[row.column_id] = deltas.get(row.column_id, 0) - 1
+    for op in operations:
+        deltas[op.column_id] = deltas.get(op.column_id, 0) + 1
+    apply_task_count_deltas(db, deltas)
+
+    # Current order of every target column, without the tasks being moved
+    lists: Dict[int, ColumnList] = {column_id: [] for column_id in column_ids}
+    for row in db.execute(
+        select(Task.column_id, Task.rank, Task.id)
+        .where(Task.column_id.in_(column_ids), Task.id.not_in(task_ids))
+        .order_by(Task.column_id, Task.rank, Task.id)
+    ):
+        lists[row.column_id].append((row.rank, row.id))
+
+    changed: Dict[int, Tuple[int, str]] = {}
+    for op in operations:
+        items = lists[op.column_id]
+        if op.rank is not None:
+            rank = op.rank
+            index = bisect.bisect_right(items, (rank, op.task_id))
+        else:
+            index = min(op.position, len(items))
+            rank = _rank_at(items, index)
+            if rank is None:
+                # Neighbours collided or keys grew too long
+                _respace(items, op.column_id, changed)
+                rank = _rank_at(items, index)
+        items.insert(index, (rank, op.task_id))
+        changed[op.task_id] = (op.column_id, rank)
+
+    positions = {
+        task_id: i
+        for items in lists.values()
+        for i, (_, task_id) in enumerate(items)
+        if task_id in changed
+    }
+
+    ids = list(changed)
+    for start in range(0, len(ids), _UPDATE_CHUNK):
+        chunk = ids[start:start + _UPDATE_CHUNK]
+        db.execute(
+            update(Task)
+            .where(Task.id.in_(chunk))
+            .values(
+                column_id=case({i: changed[i][0] for i in chunk}, value=Task.id),
+                rank=case({i: changed[i][1] for i in chunk}, value=Task.id),
+                position=case({i: positions[i] for i in chunk}, value=Task.id),
+                updated_at=datetime.now(timezone.utc),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    moved = [
+        {"id": task_id, "column_id": column_id, "rank": rank, "position": positions[task_id]}
+        for task_id, (column_id, rank) in changed.items()
+    ]
+    old_columns = {row.id: row.column_id for row in tasks}
+    for op in operations:
+        log_activity(
+            db,
+            action="moved",
+            entity_type="task",
+            entity_id=op.task_id,
+            user_id=user.id,
+            project_id=project_id,
+            task_id=op.task_id,
+            changes={"column_id": [old_columns[op.task_id], op.column_id], "position": positions[op.task_id]},
+        )
+    publish_after_commit(
+        db, Event(type="tasks.moved", project_id=project_id, board_id=board_id, data={"tasks": moved})
+    )
+    return {"board_id": board_id, "tasks": moved}
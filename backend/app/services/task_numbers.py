@@ -0,0 +1,51 @@
+"""Per-project task number allocation"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.project import ProjectTaskCounter
+
+_counters = ProjectTaskCounter.__table__
+
+
+def allocate_task_numbers(db: Session, project_id: int, count: int = 1) -> range:
+    """
+    Reserve consecutive task numbers in a project.
+
+    A single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` bumps the
+    project's counter, so concurrent callers always get disjoint ranges.
+    The session is committed right away, so the counter row stays locked
+    only for that statement instead of for the caller's whole transaction.
+    Numbers of a caller that later rolls back are lost, like a sequence,
+    leaving gaps.
+
+    Call it before the session writes anything: pending or flushed changes
+    would be committed along with the counter.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        count: How many numbers to reserve
+
+    Returns:
+        range: The reserved numbers
+
+    Raises:
+        ValueError: If count is not positive
+    """
+    if count < 1:
+        raise ValueError("count must be positive")
+
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = (
+        dialect.insert(_counters)
+        .values(project_id=project_id, last_number=count)
+        .on_conflict_do_update(
+            index_elements=[_counters.c.project_id],
+            set_={"last_number": _counters.c.last_number + count},
+        )
+        .returning(_counters.c.last_number)
+    )
+    last = db.execute(stmt).scalar_one()
+    db.commit()
+    return range(last - count + 1, last + 1)
@@ -0,0 +1,98 @@
+"""Subtask hierarchy reads, one recursive CTE each"""
+
+from sqlalchemy import exists, func, literal, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models.task import Task
+
+_NODE_COLUMNS = (
+    Task.id,
+    Task.parent_task_id,
+    Task.board_id,
+    Task.column_id,
+    Task.task_number,
+    Task.title,
+    Task.priority,
+    Task.status,
+    Task.type,
+    Task.story_points,
+    Task.due_date,
+    Task.rollup_story_points,
+    Task.rollup_done_count,
+    Task.rollup_task_count,
+)
+
+
+def _fetch(db: Session, tree, limit: int) -> dict:
+    """Nodes of a walked tree ordered by depth, then id, capped at limit"""
+    # A parent link cycle would list nodes again, one level deeper each lap
+    nodes = select(tree.c.id, func.min(tree.c.depth).label("depth")).group_by(tree.c.id).subquery()
+    child = aliased(Task)
+    rows = db.execute(
+        select(
+            *_NODE_COLUMNS,
+            nodes.c.depth,
+            exists().where(child.parent_task_id == Task.id).label("has_children"),
+        )
+        .join(nodes, nodes.c.id == Task.id)
+        .order_by(nodes.c.depth, Task.id)
+        .limit(limit + 1)
+    ).all()
+    return {"items": [row._asdict() for row in rows[:limit]], "truncated": len(rows) > limit}
+
+
+def task_subtree(db: Session, task_id: int, max_depth: int, limit: int) -> dict:
+    """
+    Get a task and its descendants as a flat adjacency list.
+
+    Nodes come breadth-first, so a list cut at ``limit`` still holds the
+    parent of every node in it. Nodes at ``max_depth`` with
+    ``has_children`` set can be expanded with another call.
+
+    Args:
+        db: Database session
+        task_id: Root task ID, already access-checked
+        max_depth: Levels below the root to include
+        limit: Maximum number of nodes, root included
+
+    Returns:
+        dict: Tree matching schemas.task.TaskTree
+    """
+    tree = (
+        select(Task.id, literal(0).label("depth"))
+        .where(Task.id == task_id)
+        .cte("subtree", recursive=True)
+    )
+    tree = tree.union_all(
+        select(Task.id, tree.c.depth + 1)
+        .join(tree, Task.parent_task_id == tree.c.id)
+        # The depth cap also ends the walk if parent links ever form a cycle
+        .where(tree.c.depth < max_depth)
+    )
+    return _fetch(db, tree, limit)
+
+
+def task_ancestors(db: Session, task_id: int, max_depth: int) -> dict:
+    """
+    Get a task and its chain of parents.
+
+    Args:
+        db: Database session
+        task_id: Task ID, already access-checked
+        max_depth: Levels above the task to include
+
+    Returns:
+        dict: Tree matching schemas.task.TaskTree, depth counting up
+            from the task, so the top-most ancestor comes last
+    """
+    chain = (
+        select(Task.id, Task.parent_task_id, literal(0).label("depth"))
+        .where(Task.id == task_id)
+        .cte("ancestors", recursive=True)
+    )
+    chain = chain.union_all(
+        select(Task.id, Task.parent_task_id, chain.c.depth + 1)
+        .join(chain, Task.id == chain.c.parent_task_id)
+        .where(chain.c.depth < max_depth)
+    )
+    return _fetch(db, chain, max_depth + 1)
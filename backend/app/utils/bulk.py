@@ -0,0 +1,71 @@
+"""Bulk row insertion: COPY on PostgreSQL (psycopg2), executemany elsewhere"""
+
+import csv
+import io
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.orm import Session
+
+
+def _uses_copy(db: Session) -> bool:
+    dialect = db.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+
+def _copy(db: Session, table: Table, columns: Sequence[str], rows: List[Dict]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        # Unquoted empty fields are NULL in COPY's csv format
+        writer.writerow(["" if row[c] is None else row[c] for c in columns])
+    buffer.seek(0)
+
+    dbapi_connection = db.connection().connection.dbapi_connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+
+def bulk_insert(db: Session, table: Table, rows: List[Dict], return_ids: bool = False) -> Optional[List[int]]:
+    """
+    Insert many rows in the session's transaction.
+
+    On PostgreSQL rows are streamed with ``COPY ... FROM STDIN``; ids, if
+    requested, are reserved from the table's sequence first. Other
+    databases use a single executemany ``INSERT`` (with ``RETURNING`` for
+    ids).
+
+    Args:
+        db: Database session
+        table: Target table
+        rows: Rows as dicts, all with the same keys; every column without a
+            server default must be present
+        return_ids: Return the new ``id`` of each row, in order
+
+    Returns:
+        Optional[List[int]]: New ids if return_ids, else None
+    """
+    if not rows:
+        return [] if return_ids else None
+
+    if not _uses_copy(db):
+        if return_ids:
+            result = db.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True), rows
+            )
+            return [row.id for row in result]
+        db.execute(insert(table), rows)
+        return None
+
+    ids = None
+    if return_ids:
+        ids = db.scalars(
+            text("SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"),
+            {"table": table.name, "count": len(rows)},
+        ).all()
+        rows = [dict(row, id=row_id) for row, row_id in zip(rows, ids)]
+    _copy(db, table, list(rows[0]), rows)
+    return ids
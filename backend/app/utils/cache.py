@@ -0,0 +1,93 @@
+"""In-process caching helpers"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Bounded, thread-safe LRU cache with a per-entry expiry time.
+
+    Entries are evicted least-recently-used first once ``max_size`` is
+    reached, and lazily dropped on read once their expiry has passed.
+    Safe to share between the event loop and threadpool workers.
+    """
+
+    def __init__(self, max_size: int, default_ttl: float):
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Any: Cached value or default
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Lifetime in seconds, capped at the cache default. Entries
+                with a non-positive ttl are not stored.
+        """
+        ttl = self.default_ttl if ttl is None else min(ttl, self.default_ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches the predicate.
+
+        Args:
+            predicate: Called with each key
+
+        Returns:
+            int: Number of removed entries
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
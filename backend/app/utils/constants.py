@@ -42,6 +42,25 @@ class TaskType(str, Enum):
     EPIC = "epic"
 
 
+class TaskSortField(str, Enum):
+    """Sort keys of the task listing"""
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+    DUE_DATE = "due_date"
+
+
+class SortOrder(str, Enum):
+    """Sort direction"""
+    ASC = "asc"
+    DESC = "desc"
+
+
+class DataFormat(str, Enum):
+    """Bulk import/export file formats"""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
 class ProjectStatus(str, Enum):
     """Project status"""
     ACTIVE = "active"
@@ -0,0 +1,200 @@
+"""
+Index audit for the SQLAlchemy models.
+
+Walks Base.metadata and reports:
+
+- foreign keys without an index whose leading columns cover them
+- frequent filters (FREQUENT_FILTERS) without such an index
+- indexes made redundant by the primary key or by a wider index
+  starting with the same columns
+
+Usage:
+    python -m app.utils.index_audit
+    python -m app.utils.index_audit --emit-migration > fix.py
+"""
+
+import argparse
+import sys
+from typing import List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import Table, UniqueConstraint
+
+from app.database import Base
+import app.models  # noqa: F401 - Import all models
+
+
+# Column sets the API filters on (WHERE/ORDER BY), in index column order.
+# Keep in sync with the queries in app/api and app/services.
+FREQUENT_FILTERS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("users", ("email",)),
+    ("organization_members", ("user_id", "organization_id")),
+    ("project_members", ("user_id", "project_id")),
+    ("projects", ("organization_id", "key")),
+    ("boards", ("project_id", "created_at")),
+    ("columns", ("board_id", "rank")),
+    ("tasks", ("board_id", "column_id", "rank")),
+    ("tasks", ("column_id", "rank")),
+    ("tasks", ("project_id", "created_at", "id")),
+    ("tasks", ("project_id", "updated_at", "id")),
+    ("tasks", ("project_id", "due_date", "id")),
+    ("tasks", ("project_id", "status", "created_at", "id")),
+    ("tasks", ("project_id", "priority", "created_at", "id")),
+    ("tasks", ("project_id", "type", "created_at", "id")),
+    ("tasks", ("parent_task_id",)),
+    ("task_assignees", ("user_id", "task_id")),
+    ("task_labels", ("label_id", "task_id")),
+    ("comments", ("task_id",)),
+    ("checklists", ("task_id", "position")),
+    ("checklist_items", ("checklist_id", "position")),
+]
+
+
+class Finding(NamedTuple):
+    """Single audit result"""
+    kind: str  # missing_fk_index, missing_filter_index, redundant_index
+    table: str
+    columns: Tuple[str, ...]  # columns lacking an index, or of the redundant index
+    index_name: str  # index to create or drop
+    index_columns: Tuple[str, ...]  # columns of that index
+
+
+def index_name(table: str, columns: Sequence[str]) -> str:
+    """Conventional index name, matching Alembic's op.f('ix_...') style"""
+    return f"ix_{table}_{'_'.join(columns)}"
+
+
+def _index_column_lists(table: Table) -> List[Tuple[Tuple[str, ...], str, bool]]:
+    """All (columns, name, is_constraint) usable as an index on a table"""
+    result = []
+    if table.primary_key.columns:
+        result.append((tuple(c.name for c in table.primary_key.columns), "pk", True))
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            result.append((tuple(c.name for c in constraint.columns), constraint.name, True))
+    for index in table.indexes:
+        # Partial indexes only serve their own predicate
+        if index.dialect_options["postgresql"].get("where") is not None:
+            continue
+        # Unique indexes enforce a constraint, so they are never redundant
+        result.append((tuple(c.name for c in index.columns), index.name, bool(index.unique)))
+    return result
+
+
+def _is_covered(columns: Sequence[str], indexes, exclude: str = None, ordered: bool = False) -> bool:
+    """
+    True if some index starts with these columns.
+
+    Column order only matters when ``ordered`` is set: a foreign key lookup
+    is served by any permutation, a filter plus sort key is not.
+    """
+    for cols, name, _ in indexes:
+        if name == exclude or len(cols) < len(columns):
+            continue
+        prefix = cols[:len(columns)]
+        if (tuple(prefix) == tuple(columns)) if ordered else (set(prefix) == set(columns)):
+            return True
+    return False
+
+
+def audit(metadata=Base.metadata) -> List[Finding]:
+    """
+    Audit the indexes of every table in the metadata.
+
+    Args:
+        metadata: SQLAlchemy MetaData to audit
+
+    Returns:
+        List[Finding]: Findings, ordered by table
+    """
+    findings: List[Finding] = []
+    filters = {}
+    for table_name, columns in FREQUENT_FILTERS:
+        filters.setdefault(table_name, []).append(columns)
+
+    for table in metadata.sorted_tables:
+        indexes = _index_column_lists(table)
+
+        # Filters first: a composite index for a filter often covers a
+        # foreign key as well, in which case no separate index is proposed
+        planned = []
+        for columns in filters.get(table.name, []):
+            if not _is_covered(columns, indexes + planned, ordered=True):
+                name = index_name(table.name, columns)
+                planned.append((columns, name, False))
+                findings.append(Finding("missing_filter_index", table.name, columns, name, columns))
+
+        for fk in table.foreign_key_constraints:
+            columns = tuple(c.name for c in fk.columns)
+            if _is_covered(columns, indexes):
+                continue
+            covering = [p for p in planned if _is_covered(columns, [p])]
+            if covering:
+                index_columns, name, _ = covering[0]
+            else:
+                index_columns, name = columns, index_name(table.name, columns)
+                planned.append((columns, name, False))
+            findings.append(Finding("missing_fk_index", table.name, columns, name, index_columns))
+
+        for cols, name, is_constraint in indexes:
+            if is_constraint:
+                continue
+            wider = [i for i in indexes + planned if len(i[0]) > len(cols) or i[1] == "pk"]
+            if _is_covered(cols, wider, exclude=name, ordered=True):
+                findings.append(Finding("redundant_index", table.name, cols, name, cols))
+
+    return findings
+
+
+def render_migration(findings: List[Finding]) -> str:
+    """
+    Render the body of an Alembic revision fixing the findings.
+
+    Args:
+        findings: Audit findings
+
+    Returns:
+        str: upgrade()/downgrade() functions
+    """
+    up, down = [], []
+    seen = set()
+    for f in findings:
+        if f.index_name in seen:
+            continue
+        seen.add(f.index_name)
+        cols = ", ".join(repr(c) for c in f.index_columns)
+        if f.kind == "redundant_index":
+            up.append(f"    op.drop_index('{f.index_name}', table_name='{f.table}')")
+            down.insert(0, f"    op.create_index('{f.index_name}', '{f.table}', [{cols}], unique=False)")
+        else:
+            up.append(f"    op.create_index('{f.index_name}', '{f.table}', [{cols}], unique=False)")
+            down.insert(0, f"    op.drop_index('{f.index_name}', table_name='{f.table}')")
+
+    return "\n".join(
+        ["def upgrade() -> None:"] + (up or ["    pass"])
+        + ["", "", "def downgrade() -> None:"] + (down or ["    pass"])
+    ) + "\n"
+
+
+def main(argv: List[str] = None) -> int:
+    """CLI entry point, exits non-zero when anything is reported"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--emit-migration",
+        action="store_true",
+        help="print Alembic upgrade/downgrade functions instead of a report",
+    )
+    args = parser.parse_args(argv)
+
+    findings = audit()
+    if args.emit_migration:
+        sys.stdout.write(render_migration(findings))
+        return 0
+
+    for f in findings:
+        print(f"{f.kind:22} {f.table}({', '.join(f.columns)})  -> {f.index_name}({', '.join(f.index_columns)})")
+    print(f"{len(findings)} finding(s)")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A page is fetched with ``WHERE (sort_key, id) > (last_sort_key, last_id)
+ORDER BY sort_key, id LIMIT n`` instead of ``OFFSET``. With an index on
+(filters..., sort_key, id) every page is a short index range scan, so
+deep pages cost the same as the first one.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import bindparam, tuple_
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
+
+
+def _object_hook(obj: dict) -> Any:
+    if "dt" in obj:
+        return datetime.fromisoformat(obj["dt"])
+    if "d" in obj:
+        return date.fromisoformat(obj["d"])
+    return obj
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort: Name of the ordering the cursor belongs to
+        values: Sort key values of the last row, ending with its id
+
+    Returns:
+        str: URL-safe cursor
+    """
+    raw = json.dumps({"s": sort, "k": list(values)}, default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor from a previous page
+        sort: Name of the ordering of the current request
+
+    Returns:
+        List[Any]: Sort key values, ending with the row id
+
+    Raises:
+        HTTPException: If the cursor is malformed or from another ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw, object_hook=_object_hook)
+        values = data["k"]
+        matches = data["s"] == sort and isinstance(values, list)
+    except (ValueError, TypeError, KeyError):
+        matches = False
+    if not matches:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def keyset_after(columns: Sequence[Any], values: Sequence[Any], descending: bool = False):
+    """
+    Condition selecting the rows after a cursor position.
+
+    Args:
+        columns: Sort columns, ending with the primary key
+        values: Decoded cursor values, one per column
+        descending: True if the rows are ordered descending
+
+    Returns:
+        Row-value comparison, usable as an index range boundary
+
+    Raises:
+        HTTPException: If the cursor does not match the columns
+    """
+    if len(values) != len(columns):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    bound = tuple_(*(
+        bindparam(None, value, type_=column.type) for column, value in zip(columns, values)
+    ))
+    row = tuple_(*columns)
+    return row < bound if descending else row > bound
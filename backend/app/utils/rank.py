@@ -0,0 +1,113 @@
+"""
+Fractional rank keys for ordered lists.
+
+A rank is a base-36 fraction written without the leading "0.", e.g. "i"
+is 18/36. Plain string comparison orders ranks, so a row can be moved
+between two neighbours by giving it a key strictly between theirs, with no
+need to renumber the rest of the list. Keys never end in "0", so there is
+always room before any key.
+
+Only digits and lowercase letters are used: they compare the same way
+under the "C" collation and under the usual locale collations.
+"""
+
+from typing import List, Optional
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Size of the rank columns
+RANK_MAX_LENGTH = 64
+
+
+def _digit(char: str) -> int:
+    value = DIGITS.find(char)
+    if value < 0:
+        raise ValueError(f"Invalid rank character: {char!r}")
+    return value
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """Key strictly between low ("" is 0) and high (None is 1)"""
+    if high is not None:
+        # Copy the shared prefix, padding low with zeros
+        n = 0
+        while n < len(high) and (low[n] if n < len(low) else "0") == high[n]:
+            n += 1
+        if n:
+            return high[:n] + _midpoint(low[n:], high[n:])
+
+    low_digit = _digit(low[0]) if low else 0
+    high_digit = _digit(high[0]) if high is not None else BASE
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit) // 2]
+    # Adjacent digits: the first digit of high alone is enough if high is longer
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def _increment(rank: str) -> str:
+    """Shortest key above rank: bump its first digit that is not the maximum"""
+    for i, char in enumerate(rank):
+        if char != DIGITS[-1]:
+            return rank[:i] + DIGITS[_digit(char) + 1]
+    return rank + DIGITS[1]
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Get a rank sorting strictly between two neighbours.
+
+    Appending (no ``after``) steps up by one digit instead of halving the
+    remaining space, so repeated appends grow keys by one character every
+    35 appends rather than every 5.
+
+    Args:
+        before: Rank of the previous item, None at the start of the list
+        after: Rank of the next item, None at the end of the list
+
+    Returns:
+        str: New rank
+
+    Raises:
+        ValueError: If the neighbours are invalid or not in order
+    """
+    for rank in (before, after):
+        if rank is not None and (not rank or rank.endswith("0")):
+            raise ValueError(f"Invalid rank: {rank!r}")
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Ranks out of order: {before!r} >= {after!r}")
+    if before is not None and after is None:
+        return _increment(before)
+    return _midpoint(before or "", after)
+
+
+def rank_sequence(count: int) -> List[str]:
+    """
+    Get evenly spaced ranks for a list of items.
+
+    Used to assign initial ranks and to rebalance a list whose keys have
+    grown long.
+
+    Args:
+        count: Number of items
+
+    Returns:
+        List[str]: Ascending ranks, all of the shortest sufficient width
+    """
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    step = BASE ** width // (count + 1)
+
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * step
+        chars = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            chars.append(DIGITS[digit])
+        # Trailing zeros carry no value and would block inserts before the key
+        ranks.append("".join(reversed(chars)).rstrip("0"))
+    return ranks
@@ -0,0 +1,213 @@
+"""
+Local SMTP stand-in.
+
+Accepts mail over plain SMTP and keeps it in memory instead of delivering
+it, so notification emails can be exercised without a mail provider. It
+can also slow down or refuse messages to exercise pooling and retries.
+
+Usage:
+    python -m app.utils.smtp_sink --port 1025
+    python -m app.utils.smtp_sink --port 1025 --latency-ms 20 --fail-rate 0.1
+    python -m app.utils.smtp_sink --port 1025 --fail-rate 0.1 --fail-code 550
+
+Then set EMAIL_HOST=localhost, EMAIL_PORT=1025 and EMAIL_ENABLED=true.
+In-process:
+    sink = SMTPSink(fail_rate=0.1)
+    port = await sink.start()
+    ...
+    await sink.stop()
+"""
+
+import argparse
+import asyncio
+import random
+from collections import deque
+from dataclasses import dataclass
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+from typing import Deque, List, Optional, Set
+
+
+@dataclass
+class ReceivedMessage:
+    """One accepted message"""
+    mail_from: str
+    rcpt_to: List[str]
+    data: bytes
+
+    def parse(self) -> EmailMessage:
+        return message_from_bytes(self.data, policy=policy.default)
+
+
+class SMTPSink:
+    """
+    Minimal SMTP server (RFC 5321 subset: EHLO/HELO, MAIL, RCPT, DATA,
+    RSET, NOOP, QUIT) storing the last ``keep`` messages.
+
+    ``latency_ms`` delays every DATA reply; ``fail_rate`` is the share of
+    messages refused instead of being accepted, with the reply code
+    ``fail_code``: a transient 451 by default, or e.g. a permanent 550.
+    """
+
+    def __init__(
+        self,
+        *,
+        keep: int = 1000,
+        latency_ms: float = 0.0,
+        fail_rate: float = 0.0,
+        fail_code: int = 451,
+    ):
+        self.messages: Deque[ReceivedMessage] = deque(maxlen=keep)
+        self.latency_ms = latency_ms
+        self.fail_rate = fail_rate
+        self.fail_code = fail_code
+        self.accepted = 0
+        self.refused = 0
+        self.connections = 0
+        self.open_connections = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Start listening.
+
+        Args:
+            host: Address to bind
+            port: Port to bind, 0 for any free port
+
+        Returns:
+            int: Bound port
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and drop open connections"""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def stats(self) -> dict:
+        return {
+            "accepted": self.accepted,
+            "refused": self.refused,
+            "connections": self.connections,
+            "open_connections": self.open_connections,
+        }
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self.open_connections += 1
+        self._writers.add(writer)
+
+        async def reply(line: str) -> None:
+            writer.write(line.encode() + b"\r\n")
+            await writer.drain()
+
+        mail_from: Optional[str] = None
+        rcpt_to: List[str] = []
+        try:
+            await reply("220 smtp-sink ESMTP ready")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command, _, argument = line.decode("utf-8", "replace").rstrip("\r\n").partition(" ")
+                command = command.upper()
+                if command == "EHLO":
+                    await reply("250-smtp-sink")
+                    await reply("250-8BITMIME")
+                    await reply("250-SMTPUTF8")
+                    await reply("250 PIPELINING")
+                elif command == "HELO":
+                    await reply("250 smtp-sink")
+                elif command == "MAIL":
+                    mail_from, rcpt_to = argument.partition(":")[2].strip(), []
+                    await reply("250 OK")
+                elif command == "RCPT":
+                    if mail_from is None:
+                        await reply("503 Need MAIL command")
+                        continue
+                    rcpt_to.append(argument.partition(":")[2].strip())
+                    await reply("250 OK")
+                elif command == "DATA":
+                    if not rcpt_to:
+                        await reply("503 Need RCPT command")
+                        continue
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = await self._read_data(reader)
+                    if self.latency_ms:
+                        await asyncio.sleep(self.latency_ms / 1000)
+                    if random.random() < self.fail_rate:
+                        self.refused += 1
+                        reason = "Try again later" if self.fail_code < 500 else "Message rejected"
+                        await reply(f"{self.fail_code} {reason}")
+                    else:
+                        self.accepted += 1
+                        self.messages.append(ReceivedMessage(mail_from, rcpt_to, data))
+                        await reply("250 OK")
+                    mail_from, rcpt_to = None, []
+                elif command == "RSET":
+                    mail_from, rcpt_to = None, []
+                    await reply("250 OK")
+                elif command == "NOOP":
+                    await reply("250 OK")
+                elif command == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.open_connections -= 1
+            self._writers.discard(writer)
+            writer.close()
+
+    @staticmethod
+    async def _read_data(reader: asyncio.StreamReader) -> bytes:
+        lines = []
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b".\r\n":
+                return b"".join(lines)
+            # Undo dot-stuffing
+            lines.append(line[1:] if line.startswith(b".") else line)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    sink = SMTPSink(keep=args.keep, latency_ms=args.latency_ms, fail_rate=args.fail_rate, fail_code=args.fail_code)
+    port = await sink.start(args.host, args.port)
+    print(f"SMTP sink listening on {args.host}:{port}")
+    last = None
+    try:
+        while True:
+            await asyncio.sleep(5)
+            stats = sink.stats()
+            if stats != last:
+                print(stats)
+                last = stats
+    finally:
+        await sink.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local SMTP server that keeps mail in memory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--keep", type=int, default=1000, help="Messages kept in memory")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before each DATA reply")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of messages refused")
+    parser.add_argument("--fail-code", type=int, default=451, help="Reply code of refused messages")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Benchmarks, run from backend/ as ``python -m benchmarks.<name>``"""
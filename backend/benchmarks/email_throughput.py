@@ -0,0 +1,133 @@
+"""
+Notification email throughput.
+
+Drives app.services.mailer.EmailDispatcher against the in-memory SMTP
+server of app.utils.smtp_sink, in one process, on a scratch SQLite
+database with ``--users`` active users. Every user gets ``--per-user``
+notifications at once; the dispatcher turns them into one digest per
+user and sends them over its connection pool. Reports the time from
+submitting the notifications to the last message accepted (or given up
+on).
+
+Usage, from backend/:
+    python -m benchmarks.email_throughput
+    python -m benchmarks.email_throughput --latency-ms 5 --pool-size 1
+    python -m benchmarks.email_throughput --fail-rate 0.2
+    python -m benchmarks.email_throughput --baseline 500
+
+``--baseline N`` first sends N single-notification messages with one
+connection each (aiosmtplib.send), for comparison.
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.scratch import use_scratch_database
+
+
+def _create_users(count: int) -> list:
+    from sqlalchemy import insert, select
+
+    from app.database import SessionLocal
+    from app.models.user import User
+
+    db = SessionLocal()
+    try:
+        db.execute(insert(User), [
+            {
+                "email": f"user{i}@example.com",
+                "username": f"user{i}",
+                "password_hash": "-",
+                "first_name": "User",
+                "last_name": str(i),
+                "is_active": True,
+            }
+            for i in range(count)
+        ])
+        db.commit()
+        return list(db.scalars(select(User).order_by(User.id)))
+    finally:
+        db.close()
+
+
+async def _baseline(users: list, count: int, port: int) -> None:
+    import aiosmtplib
+
+    from app.config import settings
+    from app.services.mailer import MailItem, compose
+
+    started = time.perf_counter()
+    for user in users[:count]:
+        message = compose(user, [MailItem(user.id, "Task assigned", "Details", "/boards/1?task=1")])
+        await aiosmtplib.send(message, sender=settings.EMAIL_FROM, hostname="127.0.0.1", port=port)
+    elapsed = time.perf_counter() - started
+    print(f"baseline, one connection per message: {count} in {elapsed:.2f}s ({count / elapsed:.0f} msg/s)")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from app.config import settings
+    from app.services.mailer import EmailDispatcher, MailItem
+    from app.utils.smtp_sink import SMTPSink
+
+    users = await asyncio.to_thread(_create_users, args.users)
+    sink = SMTPSink(keep=1, latency_ms=args.latency_ms, fail_rate=args.fail_rate)
+    port = await sink.start()
+    settings.EMAIL_HOST, settings.EMAIL_PORT = "127.0.0.1", port
+    if args.baseline:
+        await _baseline(users, args.baseline, port)
+        sink.accepted = sink.refused = sink.connections = 0
+
+    dispatcher = EmailDispatcher(
+        pool_size=args.pool_size,
+        digest_window=0.1,
+        max_pending=args.users * args.per_user,
+        max_attempts=args.max_attempts,
+        retry_backoff=0.02,
+        idle_timeout=60,
+    )
+    dispatcher.start()
+    items = [
+        MailItem(user.id, f"Notification {n}", "Details", f"/boards/1?task={n}")
+        for n in range(args.per_user)
+        for user in users
+    ]
+    started = time.perf_counter()
+    # From another thread, as after a commit in a threadpool endpoint
+    await asyncio.to_thread(dispatcher.submit, items)
+    while True:
+        stats = dispatcher.stats()
+        if stats["sent"] + stats["failed"] >= len(users):
+            break
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    await dispatcher.shutdown()
+    await sink.stop()
+
+    print(
+        f"dispatcher, pool of {args.pool_size}, latency {args.latency_ms:g}ms, fail rate {args.fail_rate:g}: "
+        f"{len(items)} notifications -> {stats['sent']} emails in {elapsed:.2f}s "
+        f"({stats['sent'] / elapsed:.0f} msg/s)"
+    )
+    print(
+        f"retried {stats['retried']}, failed {stats['failed']}, "
+        f"{sink.connections} SMTP connections, {sink.accepted} accepted by the server"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="EmailDispatcher throughput against a local SMTP sink")
+    parser.add_argument("--users", type=int, default=2000, help="Recipients, one digest each")
+    parser.add_argument("--per-user", type=int, default=5, help="Notifications per recipient")
+    parser.add_argument("--pool-size", type=int, default=4, help="SMTP connections")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Server delay before each DATA reply")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="Share of messages refused with 451")
+    parser.add_argument("--max-attempts", type=int, default=8, help="Attempts per message")
+    parser.add_argument("--baseline", type=int, default=0, metavar="N", help="Also send N messages unpooled")
+    args = parser.parse_args()
+    use_scratch_database()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
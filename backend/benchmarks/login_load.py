@@ -0,0 +1,126 @@
+"""
+Login throughput, and the latency of other requests during a login storm.
+
+The app runs in-process with its lifespan (so with the password hashing
+pool), on a scratch SQLite database, behind httpx.AsyncClient over ASGI.
+``--concurrency`` clients log in back to back while a prober requests
+/health and /api/v1/users/me every few milliseconds and records their
+latency. Logins refused with 503 (hashing pool saturated) are counted
+separately; those clients wait for Retry-After before trying again.
+
+Usage, from backend/:
+    python -m benchmarks.login_load
+    python -m benchmarks.login_load --concurrency 200
+    python -m benchmarks.login_load --inline
+
+``--inline`` hashes on the event loop, as the auth endpoints did before
+the process pool, for comparison.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Dict, List
+
+from benchmarks.scratch import use_scratch_database
+
+PROBES = ("/health", "/api/v1/users/me")
+
+
+class _InlineHasher:
+    """Hashes on the calling thread, blocking the event loop"""
+
+    async def hash(self, password: str) -> str:
+        from app.utils.security import get_password_hash
+        return get_password_hash(password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        from app.utils.security import verify_password
+        return verify_password(plain_password, hashed_password)
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    import httpx
+
+    from app.api.v1 import auth
+    from app.main import app
+
+    if args.inline:
+        auth.password_hasher = _InlineHasher()
+
+    credentials = {"email": "bench@example.com", "password": "password1"}
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=120
+    ) as client:
+        response = await client.post("/api/v1/auth/register", json={**credentials, "username": "bench"})
+        response.raise_for_status()
+        response = await client.post("/api/v1/auth/login", json=credentials)
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        stop = asyncio.Event()
+        logins: Counter = Counter()
+        latencies: Dict[str, List[float]] = {path: [] for path in PROBES}
+
+        async def log_in() -> None:
+            while True:
+                response = await client.post("/api/v1/auth/login", json=credentials)
+                logins[response.status_code] += 1
+                if response.status_code == 503:
+                    # As a well-behaved client would
+                    await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+
+        async def probe() -> None:
+            while not stop.is_set():
+                for path in PROBES:
+                    started = time.perf_counter()
+                    response = await client.get(path, headers=headers)
+                    response.raise_for_status()
+                    latencies[path].append(time.perf_counter() - started)
+                await asyncio.sleep(args.probe_interval_ms / 1000)
+
+        started = time.perf_counter()
+        clients = [asyncio.create_task(log_in()) for _ in range(args.concurrency)]
+        prober = asyncio.create_task(probe())
+        await asyncio.sleep(args.duration)
+        stop.set()
+        # Logins still queued for the pool would take long to drain
+        for task in clients:
+            task.cancel()
+        elapsed = time.perf_counter() - started
+        logins = logins.copy()
+        await asyncio.gather(prober, *clients, return_exceptions=True)
+
+    mode = "inline hashing" if args.inline else "hashing pool"
+    print(f"{mode}, {args.concurrency} concurrent clients, {elapsed:.1f}s")
+    print(
+        f"logins: {logins[200] / elapsed:.1f}/s succeeded ({logins[200]}), "
+        f"{logins[503]} refused with 503, {sum(logins.values()) - logins[200] - logins[503]} other"
+    )
+    for path, values in latencies.items():
+        print(
+            f"{path}: n={len(values)} p50={_percentile(values, 0.5) * 1000:.1f}ms "
+            f"p99={_percentile(values, 0.99) * 1000:.1f}ms max={max(values) * 1000:.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login storm against the in-process app")
+    parser.add_argument("--concurrency", type=int, default=40, help="Clients logging in back to back")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--probe-interval-ms", type=float, default=5.0, help="Pause between probe rounds")
+    parser.add_argument("--inline", action="store_true", help="Hash on the event loop instead of the pool")
+    args = parser.parse_args()
+    use_scratch_database()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Test fixtures.
+
+Tests run against the full app, with its background services, on a
+throwaway SQLite database built by the migrations. The scheduler and
+email are off. The database is shared by the whole session; tests stay
+apart by working in projects of their own (see the ``project`` fixture).
+"""
+
+import os
+import shutil
+import tempfile
+import uuid
+
+import pytest
+
+_tmp = tempfile.mkdtemp(prefix="pm-tests-")
+# SQLite serializes writers; the concurrency tests queue dozens of them,
+# longer than the default 5 second busy timeout under load
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{_tmp}/test.db?timeout=60",
+    UPLOAD_DIR=os.path.join(_tmp, "uploads"),
+    ACTIVITY_LOG_ARCHIVE_DIR=os.path.join(_tmp, "archive"),
+    DEBUG="false",
+    SCHEDULER_ENABLED="false",
+    EMAIL_ENABLED="false",
+)
+
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Client of the running app"""
+    # Without the ini file, so that alembic leaves logging alone
+    config = Config()
+    config.set_main_option("script_location", os.path.join(os.path.dirname(__file__), "..", "alembic"))
+    command.upgrade(config, "head")
+    with TestClient(app) as client:
+        yield client
+    engine.dispose()
+    shutil.rmtree(_tmp, ignore_errors=True)
+
+
+@pytest.fixture
+def register(client):
+    """Factory registering a new user; returns its Authorization header"""
+
+    def register() -> dict:
+        name = f"user{uuid.uuid4().hex[:12]}"
+        response = client.post(
+            "/api/v1/auth/register",
+            json={"email": f"{name}@example.com", "username": name, "password": "password1"},
+        )
+        assert response.status_code == 201, response.text
+        response = client.post("/api/v1/auth/login", json={"email": f"{name}@example.com", "password": "password1"})
+        assert response.status_code == 200, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    return register
+
+
+@pytest.fixture
+def auth_headers(register) -> dict:
+    """Authorization header of a newly registered user"""
+    return register()
+
+
+@pytest.fixture
+def project(client, auth_headers) -> dict:
+    """A new project with one board, owned by the ``auth_headers`` user"""
+    organization_id = client.get("/api/v1/organizations/", headers=auth_headers).json()[0]["id"]
+    response = client.post(
+        "/api/v1/projects/",
+        headers=auth_headers,
+        json={"name": "Test project", "key": "TP", "organization_id": organization_id},
+    )
+    assert response.status_code == 201, response.text
+    project_id = response.json()["id"]
+    response = client.post("/api/v1/boards/", headers=auth_headers, json={"name": "Board", "project_id": project_id})
+    assert response.status_code == 201, response.text
+    return {"project_id": project_id, "board_id": response.json()["id"]}
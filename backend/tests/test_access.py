@@ -0,0 +1,52 @@
+"""Project access checks"""
+
+import pytest
+
+MISSING_PROJECT_ID = 999999
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/projects/{id}",
+    "/api/v1/projects/{id}/activity",
+    "/api/v1/boards/project/{id}",
+    "/api/v1/tasks/?project_id={id}",
+])
+def test_missing_and_foreign_projects_are_indistinguishable(client, register, project, path):
+    outsider = register()
+
+    foreign = client.get(path.format(id=project["project_id"]), headers=outsider)
+    missing = client.get(path.format(id=MISSING_PROJECT_ID), headers=outsider)
+
+    assert foreign.status_code == missing.status_code == 403
+    assert foreign.json() == missing.json() == {"detail": "Access denied"}
+
+
+def test_member_can_read_project(client, auth_headers, project):
+    response = client.get(f"/api/v1/projects/{project['project_id']}", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == project["project_id"]
+
+
+def test_updating_missing_project_is_denied(client, auth_headers):
+    response = client.patch(f"/api/v1/projects/{MISSING_PROJECT_ID}", headers=auth_headers, json={"name": "x"})
+
+    assert response.status_code == 403
+
+
+def test_subscribing_to_missing_and_foreign_rooms_is_indistinguishable(client, register, project):
+    token = register()["Authorization"].split()[1]
+
+    with client.websocket_connect(f"/api/v1/ws/?token={token}") as websocket:
+        replies = []
+        for room in (
+            f"board:{project['board_id']}",
+            f"board:{MISSING_PROJECT_ID}",
+            f"project:{project['project_id']}",
+            f"project:{MISSING_PROJECT_ID}",
+        ):
+            websocket.send_json({"action": "subscribe", "room": room})
+            replies.append(websocket.receive_json())
+
+    assert [reply["type"] for reply in replies] == ["error"] * 4
+    assert {reply["detail"] for reply in replies} == {"Access denied"}
@@ -0,0 +1,51 @@
+"""Authentication dependencies"""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.database import async_engine, engine
+from app.services import auth_cache
+
+
+@contextmanager
+def _checkouts(pool):
+    """Count the connections taken from a pool"""
+    taken = []
+
+    def on_checkout(*args):
+        taken.append(1)
+
+    event.listen(pool, "checkout", on_checkout)
+    try:
+        yield taken
+    finally:
+        event.remove(pool, "checkout", on_checkout)
+
+
+def test_sync_endpoint_uses_only_the_sync_pool_on_cache_miss(client, auth_headers, project):
+    user_id = client.get("/api/v1/users/me", headers=auth_headers).json()["id"]
+    auth_cache.invalidate_user(user_id)
+
+    with _checkouts(engine.pool) as sync_taken, _checkouts(async_engine.sync_engine.pool) as async_taken:
+        response = client.get("/api/v1/tasks/", headers=auth_headers, params={"project_id": project["project_id"]})
+
+    assert response.status_code == 200, response.text
+    assert len(sync_taken) == 1
+    assert async_taken == []
+
+
+def test_async_endpoint_loads_user_on_cache_miss(client, auth_headers):
+    user_id = client.get("/api/v1/users/me", headers=auth_headers).json()["id"]
+    auth_cache.invalidate_user(user_id)
+
+    response = client.get("/api/v1/users/me", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["id"] == user_id
+
+
+def test_invalid_token_is_rejected(client):
+    response = client.get("/api/v1/tasks/", headers={"Authorization": "Bearer nope"}, params={"project_id": 1})
+
+    assert response.status_code == 401
@@ -0,0 +1,46 @@
+"""Deadline scanner"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.database import SessionLocal
+from app.models.job_watermark import JobWatermark
+from app.models.task import Task
+from app.services.deadlines import JOB_NAME, scan_deadlines
+
+
+def _deadline_notices(client, headers) -> list:
+    response = client.get("/api/v1/notifications/", headers=headers)
+    assert response.status_code == 200, response.text
+    return [item for item in response.json()["items"] if item["type"] == "deadline_approaching"]
+
+
+def test_update_stamped_before_the_last_run_is_not_missed(client, auth_headers, project):
+    scan_deadlines()
+    due = datetime.now(timezone.utc) + timedelta(hours=2)
+    response = client.post(
+        "/api/v1/tasks/",
+        headers=auth_headers,
+        json={"project_id": project["project_id"], "board_id": project["board_id"], "title": "Late commit"},
+    )
+    assert response.status_code == 201, response.text
+    task_id = response.json()["id"]
+
+    # As if the due date was set by a transaction that started before the
+    # last run and committed after it
+    db = SessionLocal()
+    try:
+        last_run = db.get(JobWatermark, JOB_NAME).updated_at
+        db.execute(
+            update(Task).where(Task.id == task_id).values(due_date=due, updated_at=last_run - timedelta(seconds=30))
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    scan_deadlines()
+    scan_deadlines()
+
+    notices = _deadline_notices(client, auth_headers)
+    assert [notice["title"] for notice in notices] == ["Late commit is due soon"]
@@ -0,0 +1,128 @@
+"""Notification emails, against the in-memory SMTP server of app.utils.smtp_sink"""
+
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.services.mailer import EmailDispatcher, MailItem
+from app.utils.smtp_sink import SMTPSink
+
+
+@pytest.fixture
+def recipient(client, register) -> dict:
+    """Active user to mail: its id and email"""
+    return client.get("/api/v1/users/me", headers=register()).json()
+
+
+def _deliver(monkeypatch, sink: SMTPSink, scenario, **options) -> dict:
+    """
+    Run ``scenario(dispatcher)`` with a dispatcher sending to the sink,
+    shut the dispatcher down, and return its stats.
+    """
+    defaults = {"digest_window": 0.05, "max_pending": 100, "max_attempts": 5, "retry_backoff": 0.01}
+
+    async def run() -> dict:
+        port = await sink.start()
+        monkeypatch.setattr(settings, "EMAIL_HOST", "127.0.0.1")
+        monkeypatch.setattr(settings, "EMAIL_PORT", port)
+        dispatcher = EmailDispatcher(pool_size=2, idle_timeout=5, **{**defaults, **options})
+        dispatcher.start()
+        try:
+            await scenario(dispatcher)
+        finally:
+            await dispatcher.shutdown(timeout=5)
+            await sink.stop()
+        return dispatcher.stats()
+
+    return asyncio.run(run())
+
+
+async def _until(condition, timeout: float = 10.0) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def _items(user: dict, count: int) -> list:
+    return [MailItem(user["id"], f"Notification {n}", "Details", f"/boards/1?task={n}") for n in range(count)]
+
+
+def test_notifications_of_a_user_become_one_digest(monkeypatch, recipient):
+    sink = SMTPSink()
+
+    async def scenario(dispatcher):
+        dispatcher.submit(_items(recipient, 3))
+        await _until(lambda: dispatcher.stats()["sent"] == 1)
+
+    stats = _deliver(monkeypatch, sink, scenario)
+
+    assert (stats["sent"], stats["notifications_mailed"]) == (1, 3)
+    [received] = sink.messages
+    assert received.rcpt_to == [f"<{recipient['email']}>"]
+    message = received.parse()
+    assert message["Subject"] == "You have 3 new notifications"
+    body = message.get_content()
+    assert all(f"Notification {n}" in body for n in range(3))
+
+
+def test_transient_refusal_is_retried_then_delivered(monkeypatch, recipient):
+    sink = SMTPSink(fail_rate=1.0, fail_code=451)
+
+    async def scenario(dispatcher):
+        dispatcher.submit(_items(recipient, 1))
+        await _until(lambda: sink.refused >= 1)
+        sink.fail_rate = 0.0
+        await _until(lambda: dispatcher.stats()["sent"] == 1)
+
+    stats = _deliver(monkeypatch, sink, scenario, max_attempts=50)
+
+    assert stats["retried"] >= 1
+    assert (stats["sent"], stats["failed"]) == (1, 0)
+    assert len(sink.messages) == 1
+
+
+def test_permanent_refusal_is_not_retried(monkeypatch, recipient):
+    sink = SMTPSink(fail_rate=1.0, fail_code=550)
+
+    async def scenario(dispatcher):
+        dispatcher.submit(_items(recipient, 1))
+        await _until(lambda: dispatcher.stats()["failed"] == 1)
+
+    stats = _deliver(monkeypatch, sink, scenario)
+
+    assert (stats["sent"], stats["retried"], stats["failed"]) == (0, 0, 1)
+    assert sink.refused == 1
+
+
+def test_notifications_beyond_max_pending_are_dropped(monkeypatch, recipient):
+    sink = SMTPSink()
+
+    async def scenario(dispatcher):
+        dispatcher.submit(_items(recipient, 5))
+        await _until(lambda: dispatcher.stats()["sent"] == 1)
+
+    stats = _deliver(monkeypatch, sink, scenario, max_pending=3, digest_window=60)
+
+    assert (stats["dropped"], stats["notifications_mailed"]) == (2, 3)
+    assert sink.messages[0].parse()["Subject"] == "You have 3 new notifications"
+
+
+def test_shutdown_sends_buffered_digests(monkeypatch, client, register, recipient):
+    other = client.get("/api/v1/users/me", headers=register()).json()
+    sink = SMTPSink()
+
+    async def scenario(dispatcher):
+        dispatcher.submit(_items(recipient, 2) + _items(other, 1))
+        await asyncio.sleep(0.01)
+        assert dispatcher.stats()["pending_notifications"] == 3
+
+    # The digest window never ends on its own
+    stats = _deliver(monkeypatch, sink, scenario, digest_window=60)
+
+    assert (stats["sent"], stats["notifications_mailed"]) == (2, 3)
+    assert sorted(message.rcpt_to[0] for message in sink.messages) == sorted(
+        f"<{user['email']}>" for user in (recipient, other)
+    )
@@ -0,0 +1,54 @@
+"""Cached unread-notification counts"""
+
+from sqlalchemy import delete, update
+
+from app.database import SessionLocal
+from app.models.notification import NotificationCounter
+from app.services.notification_counts import reconcile_unread_counts
+from app.services.notifications import insert_notifications
+
+
+def _notify(user_id: int, count: int) -> None:
+    db = SessionLocal()
+    try:
+        rows = [{"user_id": user_id, "type": "task_mentioned", "title": f"Notification {i}"} for i in range(count)]
+        insert_notifications(db, rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _set_counter(user_id: int, value) -> None:
+    db = SessionLocal()
+    try:
+        if value is None:
+            db.execute(delete(NotificationCounter).where(NotificationCounter.user_id == user_id))
+        else:
+            db.execute(
+                update(NotificationCounter).where(NotificationCounter.user_id == user_id).values(unread_count=value)
+            )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _unread(client, headers) -> int:
+    return client.get("/api/v1/notifications/unread-count", headers=headers).json()["unread_count"]
+
+
+def test_reconcile_corrects_wrong_and_missing_counters(client, register):
+    reconcile_unread_counts()  # Drift left by other tests
+    wrong, missing, stale = register(), register(), register()
+    ids = [client.get("/api/v1/users/me", headers=headers).json()["id"] for headers in (wrong, missing, stale)]
+    _notify(ids[0], 3)
+    _notify(ids[1], 2)
+    _notify(ids[2], 1)
+    client.post("/api/v1/notifications/read-all", headers=stale)
+    _set_counter(ids[0], 7)
+    _set_counter(ids[1], None)
+    _set_counter(ids[2], 4)
+
+    assert reconcile_unread_counts() == 3
+
+    assert [_unread(client, headers) for headers in (wrong, missing, stale)] == [3, 2, 0]
+    assert reconcile_unread_counts() == 0
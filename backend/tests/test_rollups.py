@@ -0,0 +1,52 @@
+"""Subtask roll-ups"""
+
+from sqlalchemy import select, update
+
+from app.database import SessionLocal
+from app.models.task import Task
+from app.services.rollups import verify_rollups
+
+
+def _create_task(client, auth_headers, project, **fields) -> int:
+    payload = {"project_id": project["project_id"], "board_id": project["board_id"], "title": "Task", **fields}
+    response = client.post("/api/v1/tasks/", headers=auth_headers, json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _stored(task_id: int):
+    db = SessionLocal()
+    try:
+        return db.execute(
+            select(Task.rollup_story_points, Task.rollup_task_count, Task.updated_at).where(Task.id == task_id)
+        ).one()
+    finally:
+        db.close()
+
+
+def test_verify_corrects_drift_and_keeps_updated_at(client, auth_headers, project):
+    parent_id = _create_task(client, auth_headers, project)
+    _create_task(client, auth_headers, project, parent_task_id=parent_id, story_points=3)
+    _create_task(client, auth_headers, project, parent_task_id=parent_id, story_points=5)
+    verify_rollups()  # Drift left by other tests
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(Task)
+            .where(Task.id == parent_id)
+            .values(rollup_story_points=1, rollup_task_count=9, updated_at=Task.updated_at)
+        )
+        db.commit()
+    finally:
+        db.close()
+    before = _stored(parent_id)
+
+    assert verify_rollups(fix=False) == 1
+    assert _stored(parent_id) == before
+
+    assert verify_rollups() == 1
+
+    after = _stored(parent_id)
+    assert (after.rollup_story_points, after.rollup_task_count) == (8, 2)
+    assert after.updated_at == before.updated_at
+    assert verify_rollups() == 0
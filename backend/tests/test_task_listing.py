@@ -0,0 +1,83 @@
+"""Keyset pagination of GET /tasks/"""
+
+import pytest
+
+
+def _create_tasks(client, auth_headers, project, count: int) -> list:
+    ids = []
+    for i in range(count):
+        payload = {"project_id": project["project_id"], "board_id": project["board_id"], "title": f"Task {i}"}
+        if i % 3:
+            payload["due_date"] = f"2027-01-{i + 1:02d}T12:00:00Z"
+        response = client.post("/api/v1/tasks/", headers=auth_headers, json=payload)
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    return ids
+
+
+def _walk(client, auth_headers, project, **params) -> list:
+    items, cursor = [], None
+    for _ in range(100):
+        query = {"project_id": project["project_id"], "limit": 3, **params}
+        if cursor:
+            query["cursor"] = cursor
+        response = client.get("/api/v1/tasks/", headers=auth_headers, params=query)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        items += page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+    pytest.fail("Pagination did not end")
+
+
+@pytest.mark.parametrize("sort", ["created_at", "updated_at"])
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_walk_returns_every_task_once_in_order(client, auth_headers, project, sort, order):
+    # Created through the API, so the timestamps are the model defaults
+    ids = _create_tasks(client, auth_headers, project, 10)
+    client.put(f"/api/v1/tasks/{ids[4]}", headers=auth_headers, json={"title": "Renamed"})
+
+    items = _walk(client, auth_headers, project, sort=sort, order=order)
+
+    assert sorted(item["id"] for item in items) == ids
+    keys = [(item[sort], item["id"]) for item in items]
+    assert keys == sorted(keys, reverse=order == "desc")
+
+
+@pytest.mark.parametrize("order", ["asc", "desc"])
+def test_due_date_sort_puts_undated_tasks_last(client, auth_headers, project, order):
+    ids = _create_tasks(client, auth_headers, project, 10)
+
+    items = _walk(client, auth_headers, project, sort="due_date", order=order)
+
+    assert sorted(item["id"] for item in items) == ids
+    dated = [item for item in items if item["due_date"] is not None]
+    undated = [item for item in items if item["due_date"] is None]
+    assert items == dated + undated
+    assert len(undated) == 4
+    keys = [(item["due_date"], item["id"]) for item in dated]
+    assert keys == sorted(keys, reverse=order == "desc")
+    undated_ids = [item["id"] for item in undated]
+    assert undated_ids == sorted(undated_ids, reverse=order == "desc")
+
+
+def test_due_date_filter_excludes_undated_tasks(client, auth_headers, project):
+    _create_tasks(client, auth_headers, project, 10)
+
+    items = _walk(client, auth_headers, project, sort="due_date", due_from="2027-01-01T00:00:00Z")
+
+    assert len(items) == 6
+    assert all(item["due_date"] is not None for item in items)
+
+
+def test_cursor_of_another_ordering_is_rejected(client, auth_headers, project):
+    _create_tasks(client, auth_headers, project, 4)
+    params = {"project_id": project["project_id"], "limit": 3}
+    cursor = client.get("/api/v1/tasks/", headers=auth_headers, params=params).json()["next_cursor"]
+
+    response = client.get(
+        "/api/v1/tasks/", headers=auth_headers, params={**params, "sort": "due_date", "cursor": cursor}
+    )
+
+    assert response.status_code == 400
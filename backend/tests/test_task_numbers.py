@@ -0,0 +1,76 @@
+"""Per-project task numbers under concurrency"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.models.task import Task
+from app.services.task_numbers import allocate_task_numbers
+
+THREADS = 16
+
+
+def test_concurrent_allocations_are_unique_and_gapless(project):
+    def allocate(_) -> list:
+        db = SessionLocal()
+        try:
+            numbers = []
+            for i in range(250):
+                numbers.extend(allocate_task_numbers(db, project["project_id"], 5 if i % 10 == 0 else 1))
+            return numbers
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        numbers = [number for numbers in executor.map(allocate, range(THREADS)) for number in numbers]
+
+    # 16 threads x (225 single numbers + 25 ranges of 5)
+    assert len(numbers) == THREADS * 350
+    assert sorted(numbers) == list(range(1, len(numbers) + 1))
+
+
+def test_allocated_range_is_consecutive(project):
+    db = SessionLocal()
+    try:
+        first = allocate_task_numbers(db, project["project_id"])
+        block = allocate_task_numbers(db, project["project_id"], 10)
+    finally:
+        db.close()
+
+    assert list(first) == [1]
+    assert list(block) == list(range(2, 12))
+
+
+def test_count_must_be_positive(project):
+    db = SessionLocal()
+    try:
+        with pytest.raises(ValueError):
+            allocate_task_numbers(db, project["project_id"], 0)
+    finally:
+        db.close()
+
+
+def test_parallel_task_creation_numbers_every_task_once(client, auth_headers, project):
+    count = 2000
+
+    def create(i: int) -> int:
+        response = client.post(
+            "/api/v1/tasks/",
+            headers=auth_headers,
+            json={"project_id": project["project_id"], "board_id": project["board_id"], "title": f"Task {i}"},
+        )
+        assert response.status_code == 201, response.text
+        return response.json()["task_number"]
+
+    with ThreadPoolExecutor(32) as executor:
+        numbers = list(executor.map(create, range(count)))
+
+    assert sorted(numbers) == list(range(1, count + 1))
+    db = SessionLocal()
+    try:
+        stored = db.scalars(select(Task.task_number).where(Task.project_id == project["project_id"])).all()
+    finally:
+        db.close()
+    assert sorted(stored) == list(range(1, count + 1))
@@ -14,7 +14,9 @@ export interface Column {
   id: number
   name: string
   position: number
+  rank: string
   wip_limit?: number
+  task_count: number
   board_id: number
   created_at: string
   updated_at: string
@@ -24,6 +26,45 @@ export interface BoardWithColumns extends Board {
   columns: Column[]
 }
 
+export interface SnapshotTask {
+  id: number
+  column_id?: number
+  task_number: number
+  title: string
+  priority?: string
+  status?: string
+  type?: string
+  position?: number
+  rank: string
+  story_points?: number
+  due_date?: string
+  parent_task_id?: number
+  assignee_ids: number[]
+  label_ids: number[]
+}
+
+export interface SnapshotUser {
+  id: number
+  username: string
+  first_name?: string
+  last_name?: string
+  avatar_url?: string
+}
+
+export interface SnapshotLabel {
+  id: number
+  project_id: number
+  name: string
+  color: string
+  created_at: string
+}
+
+export interface BoardSnapshot extends BoardWithColumns {
+  tasks: SnapshotTask[]
+  users: SnapshotUser[]
+  labels: SnapshotLabel[]
+}
+
 export interface BoardCreate {
   name: string
   description?: string
@@ -49,6 +90,11 @@ export const boardsApi = {
     return response.data
   },
 
+  getBoardSnapshot: async (boardId: number): Promise<BoardSnapshot> => {
+    const response = await apiClient.get(`/boards/${boardId}/snapshot`)
+    return response.data
+  },
+
   createBoard: async (data: BoardCreate): Promise<Board> => {
     const response = await apiClient.post('/boards/', data)
     return response.data